@@ -0,0 +1,138 @@
+#
+# Copyright (C) 2025 sits developers.
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+
+"""Benchmark utilities."""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+
+
+#
+# Measurement
+#
+def measure(fnc: Callable[[], object], repeat: int = 5) -> dict[str, float]:
+    """Measure the execution time of a function.
+
+    Args:
+        fnc (Callable[[], object]): Function to measure.
+
+        repeat (int, optional): Number of executions. Defaults to 5.
+
+    Returns:
+        dict[str, float]: Minimum, mean and maximum execution time (in seconds).
+    """
+    times = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fnc()
+        times.append(time.perf_counter() - start)
+
+    return {"min": min(times), "mean": statistics.mean(times), "max": max(times)}
+
+
+#
+# Reporting
+#
+def report(title: str, results: dict[str, dict[str, float]]) -> None:
+    """Print benchmark results as a table.
+
+    Args:
+        title (str): Benchmark title.
+
+        results (dict[str, dict[str, float]]): Results of each benchmark case (as
+            returned by ``measure``).
+    """
+    name_width = max(len(name) for name in results)
+
+    print(f"\n{title}\n")
+    print(f"{'case':<{name_width}}  {'min (s)':>10}  {'mean (s)':>10}  {'max (s)':>10}")
+
+    for name, result in results.items():
+        print(
+            f"{name:<{name_width}}  {result['min']:>10.4f}  "
+            f"{result['mean']:>10.4f}  {result['max']:>10.4f}"
+        )
+
+
+def compare_baseline(
+    results: dict[str, dict],
+    baseline: dict[str, dict],
+    tolerance: float,
+    metric: Callable[[dict], float],
+) -> list[dict]:
+    """Compare benchmark results with a baseline report.
+
+    Args:
+        results (dict[str, dict]): Results of each case.
+
+        baseline (dict[str, dict]): Results of each case in the baseline.
+
+        tolerance (float): Maximum ratio between the current and baseline metric
+            (e.g., ``1.5`` allows a case to be 50% worse).
+
+        metric (Callable[[dict], float]): Function that extracts the compared
+            value (e.g., mean time or peak memory) from the result of a case.
+
+    Returns:
+        list[dict]: Comparison of each case available (without errors) in both
+            reports.
+    """
+    comparison = []
+
+    for name, result in results.items():
+        reference = baseline.get(name)
+
+        if not reference or "error" in reference or "error" in result:
+            continue
+
+        reference_value = metric(reference)
+
+        if not reference_value:
+            continue
+
+        ratio = metric(result) / reference_value
+
+        comparison.append(
+            {"case": name, "ratio": ratio, "regression": ratio > tolerance}
+        )
+
+    return comparison
+
+
+#
+# Command line
+#
+def benchmark_parser(description: str, size: int = 10_000) -> argparse.ArgumentParser:
+    """Create the command line parser of a benchmark.
+
+    Args:
+        description (str): Benchmark description.
+
+        size (int, optional): Default data size. Defaults to 10,000.
+
+    Returns:
+        argparse.ArgumentParser: Parser with ``--size`` and ``--repeat`` options.
+    """
+    parser = argparse.ArgumentParser(description=description)
+
+    parser.add_argument("--size", type=int, default=size, help="Data size.")
+    parser.add_argument("--repeat", type=int, default=5, help="Executions per case.")
+
+    return parser
@@ -0,0 +1,321 @@
+#
+# Copyright (C) 2025 sits developers.
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+
+"""Benchmark suite of tibble conversions (R <-> Python).
+
+Generates synthetic sits tibbles (``N`` samples x ``T`` dates x ``B`` bands) and
+cubes (``N`` ``file_info`` rows) in R, without network access, and measures the
+time and memory used by the converters of ``pysits.conversions.tibble`` and
+``pysits.conversions.tibble_arrow`` in both directions. Results are saved as
+JSON and can be compared with a previous report (baseline).
+
+Usage:
+    python -m benchmarks.conversions --sizes 1000 10000 --output report.json
+
+    python -m benchmarks.conversions --baseline report.json --tolerance 1.5
+"""
+
+import argparse
+import json
+import sys
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+import pyarrow as pa
+from rpy2 import robjects
+from rpy2.robjects.vectors import DataFrame as RDataFrame
+
+from benchmarks.common import compare_baseline, measure, report
+from pysits.conversions.tibble import (
+    pandas_to_tibble,
+    tibble_cube_to_pandas,
+    tibble_sits_to_pandas,
+    tibble_to_pandas,
+)
+from pysits.conversions.tibble_arrow import (
+    pandas_cube_to_tibble_arrow,
+    pandas_sits_to_tibble_arrow,
+    tibble_cube_to_pandas_arrow,
+    tibble_sits_to_pandas_arrow,
+)
+
+#
+# Data
+#
+SAMPLES_GENERATOR = """
+function(n, n_dates, n_bands) {
+    set.seed(42)
+
+    dates <- seq(as.Date("2020-01-01"), by = 16, length.out = n_dates)
+
+    # Time series of all samples as a single long table
+    time_series <- tibble::tibble(Index = rep(dates, times = n))
+
+    for (band in paste0("B", seq_len(n_bands))) {
+        time_series[[band]] <- stats::runif(n * n_dates)
+    }
+
+    samples <- tibble::tibble(
+        longitude = stats::runif(n, -60, -50),
+        latitude = stats::runif(n, -15, -5),
+        start_date = dates[[1]],
+        end_date = dates[[n_dates]],
+        label = sample(c("Forest", "Pasture", "Cerrado"), n, replace = TRUE),
+        cube = "MOD13Q1-6.1",
+        time_series = vctrs::vec_chop(time_series, sizes = rep(n_dates, n))
+    )
+
+    class(samples) <- c("sits", class(samples))
+
+    samples
+}
+"""
+
+CUBE_GENERATOR = """
+function(n_files, n_tiles) {
+    set.seed(42)
+
+    files_per_tile <- max(1L, n_files %/% n_tiles)
+
+    file_info <- tibble::tibble(
+        fid = rep(seq_len(files_per_tile), times = n_tiles),
+        band = "NDVI",
+        date = as.Date("2020-01-01") + rep(seq_len(files_per_tile), times = n_tiles),
+        ncols = 255L,
+        nrows = 147L,
+        xres = 231.656,
+        yres = 231.656,
+        xmin = stats::runif(files_per_tile * n_tiles),
+        xmax = stats::runif(files_per_tile * n_tiles),
+        ymin = stats::runif(files_per_tile * n_tiles),
+        ymax = stats::runif(files_per_tile * n_tiles),
+        crs = "EPSG:4326",
+        path = sprintf("/data/file_%d.tif", seq_len(files_per_tile * n_tiles))
+    )
+
+    cube <- tibble::tibble(
+        source = "BDC",
+        collection = "MOD13Q1-6.1",
+        satellite = "TERRA",
+        sensor = "MODIS",
+        tile = sprintf("%06d", seq_len(n_tiles)),
+        xmin = 0, xmax = 1, ymin = 0, ymax = 1,
+        crs = "EPSG:4326",
+        labels = rep(list(c("1" = "Forest", "2" = "Pasture")), n_tiles),
+        file_info = vctrs::vec_chop(file_info, sizes = rep(files_per_tile, n_tiles))
+    )
+
+    class(cube) <- c("raster_cube", class(cube))
+
+    cube
+}
+"""
+
+
+def sample_samples(size: int, dates: int, bands: int) -> RDataFrame:
+    """Create a sits tibble with ``size`` samples.
+
+    Args:
+        size (int): Number of samples.
+
+        dates (int): Number of dates of each time series.
+
+        bands (int): Number of bands of each time series.
+
+    Returns:
+        rpy2.robjects.vectors.DataFrame: sits tibble.
+    """
+    return robjects.r(SAMPLES_GENERATOR)(size, dates, bands)
+
+
+def sample_cube(size: int) -> RDataFrame:
+    """Create a cube tibble with ``size`` files (one tile for each 1,000 files).
+
+    Args:
+        size (int): Number of files (rows of ``file_info``).
+
+    Returns:
+        rpy2.robjects.vectors.DataFrame: Cube tibble.
+    """
+    return robjects.r(CUBE_GENERATOR)(size, max(1, size // 1000))
+
+
+#
+# Measurement
+#
+def measure_memory(fnc: Callable[[], object]) -> dict[str, int]:
+    """Measure the memory used by a function.
+
+    Args:
+        fnc (Callable[[], object]): Function to measure.
+
+    Returns:
+        dict[str, int]: Memory (in bytes) used by the function: peak allocated by
+            Python (including NumPy), retained by Arrow and maximum used by R.
+    """
+    # ``gc`` reports the maximum memory used (in Mb) in its last column
+    r_gc = robjects.r("function(reset) { x <- gc(reset = reset); sum(x[, ncol(x)]) }")
+
+    r_gc(True)
+    arrow_start = pa.total_allocated_bytes()
+
+    tracemalloc.start()
+
+    try:
+        fnc()
+        _, python_peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "python_peak": python_peak,
+        "arrow_retained": pa.total_allocated_bytes() - arrow_start,
+        "r_max_used": int(r_gc(False)[0] * 1024**2),
+    }
+
+
+def benchmark_cases(size: int, dates: int, bands: int) -> dict[str, Callable]:
+    """Create the benchmark cases of a data size.
+
+    Args:
+        size (int): Number of samples (and of cube files).
+
+        dates (int): Number of dates of each time series.
+
+        bands (int): Number of bands of each time series.
+
+    Returns:
+        dict[str, Callable]: Functions to measure (by case name).
+    """
+    samples = sample_samples(size, dates, bands)
+    samples_df = tibble_sits_to_pandas_arrow(samples)
+
+    points = robjects.r("function(x) tibble::as_tibble(x[, 1:6])")(samples)
+    points_df = tibble_to_pandas(points)
+
+    cube = sample_cube(size)
+    cube_df = tibble_cube_to_pandas_arrow(cube)
+
+    return {
+        "points: tibble -> pandas (rpy2)": lambda: tibble_to_pandas(points),
+        "points: pandas -> tibble": lambda: pandas_to_tibble(points_df),
+        "sits: tibble -> pandas (rpy2)": lambda: tibble_sits_to_pandas(samples),
+        "sits: tibble -> pandas (arrow)": lambda: tibble_sits_to_pandas_arrow(samples),
+        "sits: pandas -> tibble (arrow)": lambda: pandas_sits_to_tibble_arrow(
+            samples_df
+        ),
+        "cube: tibble -> pandas (rpy2)": lambda: tibble_cube_to_pandas(cube),
+        "cube: tibble -> pandas (arrow)": lambda: tibble_cube_to_pandas_arrow(cube),
+        "cube: pandas -> tibble (arrow)": lambda: pandas_cube_to_tibble_arrow(cube_df),
+    }
+
+
+#
+# Benchmark
+#
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000, 1_000_000],
+        help="Number of samples (and of cube files).",
+    )
+    parser.add_argument("--dates", type=int, default=23, help="Dates per sample.")
+    parser.add_argument("--bands", type=int, default=2, help="Bands per sample.")
+    parser.add_argument("--repeat", type=int, default=3, help="Executions per case.")
+    parser.add_argument("--cases", default="", help="Run cases containing this text.")
+    parser.add_argument("--output", type=Path, default=None, help="JSON report.")
+    parser.add_argument("--baseline", type=Path, default=None, help="JSON baseline.")
+    parser.add_argument(
+        "--tolerance", type=float, default=1.5, help="Maximum time ratio to baseline."
+    )
+
+    args = parser.parse_args()
+
+    results = {}
+
+    for size in args.sizes:
+        cases = benchmark_cases(size, args.dates, args.bands)
+        size_results = {}
+
+        for name, fnc in cases.items():
+            if args.cases not in name:
+                continue
+
+            case_name = f"{name} [{size}]"
+
+            try:
+                size_results[case_name] = {
+                    "time": measure(fnc, args.repeat),
+                    "memory": measure_memory(fnc),
+                }
+
+            except Exception as e:
+                results[case_name] = {"error": str(e)}
+
+        if size_results:
+            report(
+                f"Conversions ({size} samples)",
+                {name: result["time"] for name, result in size_results.items()},
+            )
+
+        results.update(size_results)
+
+    report_data = {
+        "parameters": {"dates": args.dates, "bands": args.bands},
+        "results": results,
+    }
+
+    # Compare with baseline
+    regressions = []
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        comparison = compare_baseline(
+            results,
+            baseline["results"],
+            args.tolerance,
+            lambda result: result["time"]["mean"],
+        )
+
+        report_data["baseline"] = {
+            "path": args.baseline.as_posix(),
+            "tolerance": args.tolerance,
+            "comparison": comparison,
+        }
+
+        regressions = [item for item in comparison if item["regression"]]
+
+        for item in comparison:
+            status = "REGRESSION" if item["regression"] else "ok"
+            print(f"{item['case']}: {item['ratio']:.2f}x baseline ({status})")
+
+    if args.output:
+        args.output.write_text(json.dumps(report_data, indent=2), encoding="utf-8")
+
+    if regressions:
+        sys.exit(f"{len(regressions)} case(s) slower than the baseline tolerance")
+
+
+if __name__ == "__main__":
+    main()
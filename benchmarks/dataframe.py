@@ -0,0 +1,123 @@
+#
+# Copyright (C) 2025 sits developers.
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+
+"""Benchmark of data frame conversions from pandas/GeoPandas to R.
+
+Compares rpy2's pandas converter with the columnar (Arrow) conversion used by
+``pysits.conversions.tibble`` for plain data frames, using a points table like
+the ones given to ``sits_get_data``.
+
+Usage:
+    python -m benchmarks.dataframe --size 1000000
+"""
+
+import numpy as np
+from geopandas import GeoDataFrame as GeoPandasDataFrame
+from geopandas import points_from_xy
+from pandas import DataFrame as PandasDataFrame
+from pandas import Timestamp
+from rpy2 import robjects
+from rpy2.robjects import pandas2ri
+from rpy2.robjects.conversion import localconverter
+from rpy2.robjects.vectors import DataFrame as RDataFrame
+
+from benchmarks.common import benchmark_parser, measure, report
+from pysits.conversions.tibble import (
+    _shapely_to_sf,
+    geopandas_to_tibble,
+    pandas_to_tibble,
+)
+
+
+#
+# Data
+#
+def sample_points(size: int) -> PandasDataFrame:
+    """Create a table of sample points.
+
+    Args:
+        size (int): Number of points.
+
+    Returns:
+        pandas.DataFrame: Points with ``longitude``, ``latitude``, ``start_date``,
+            ``end_date`` and ``label`` columns.
+    """
+    rng = np.random.default_rng(42)
+
+    return PandasDataFrame(
+        {
+            "longitude": rng.uniform(-60, -50, size),
+            "latitude": rng.uniform(-15, -5, size),
+            "start_date": Timestamp("2020-01-01").date(),
+            "end_date": Timestamp("2020-12-31").date(),
+            "label": rng.choice(["Forest", "Pasture", "Cerrado"], size),
+        }
+    )
+
+
+#
+# rpy2 conversions (reference)
+#
+def pandas_to_tibble_rpy2(data: PandasDataFrame) -> RDataFrame:
+    """Convert a DataFrame to R using rpy2's pandas converter."""
+    with localconverter(robjects.default_converter + pandas2ri.converter):
+        return robjects.conversion.py2rpy(data)
+
+
+def geopandas_to_sf_rpy2(data: GeoPandasDataFrame) -> RDataFrame:
+    """Convert a GeoDataFrame to sf using rpy2's pandas converter."""
+    r_df = pandas_to_tibble_rpy2(
+        PandasDataFrame(data.drop(columns=[data.geometry.name]))
+    )
+
+    return _shapely_to_sf(r_df, data.geometry, data.crs.to_wkt())
+
+
+#
+# Benchmark
+#
+def main() -> None:
+    """Run the benchmark."""
+    args = benchmark_parser(__doc__.splitlines()[0], size=1_000_000).parse_args()
+
+    data = sample_points(args.size)
+    geo_data = GeoPandasDataFrame(
+        data.drop(columns=["longitude", "latitude"]),
+        geometry=points_from_xy(data["longitude"], data["latitude"]),
+        crs="EPSG:4326",
+    )
+
+    results = {
+        "pandas -> tibble (rpy2)": measure(
+            lambda: pandas_to_tibble_rpy2(data), args.repeat
+        ),
+        "pandas -> tibble (Arrow)": measure(
+            lambda: pandas_to_tibble(data), args.repeat
+        ),
+        "geopandas -> sf (rpy2)": measure(
+            lambda: geopandas_to_sf_rpy2(geo_data), args.repeat
+        ),
+        "geopandas -> sf (Arrow)": measure(
+            lambda: geopandas_to_tibble(geo_data), args.repeat
+        ),
+    }
+
+    report(f"Data frame conversions ({args.size} points)", results)
+
+
+if __name__ == "__main__":
+    main()
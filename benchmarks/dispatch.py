@@ -0,0 +1,95 @@
+#
+# Copyright (C) 2025 sits developers.
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+
+"""Benchmark of the per-call overhead of the pysits function wrappers.
+
+Measures the Python-side overhead of ``function_call``, ``rpy2_fix_type`` and
+``rpy2_fix_type_custom`` (argument conversion and dispatch) using a no-op function
+in place of the R function, and compares it with a minimal R call.
+
+Usage:
+    python -m benchmarks.dispatch --repeat 10000
+"""
+
+from rpy2 import robjects
+
+from benchmarks.common import benchmark_parser, measure, report
+from pysits.conversions.decorators import (
+    function_call,
+    rpy2_fix_type,
+    rpy2_fix_type_custom,
+)
+
+
+#
+# Wrapped functions
+#
+def noop(*args, **kwargs) -> None:
+    """Function without any work (replaces the R function)."""
+
+
+@function_call(noop, lambda x: x)
+def wrapped_function_call(*args, **kwargs) -> None:
+    """Function wrapped with ``function_call``."""
+
+
+@rpy2_fix_type
+def wrapped_fix_type(*args, **kwargs) -> None:
+    """Function wrapped with ``rpy2_fix_type``."""
+
+
+@rpy2_fix_type_custom(converters={"data": lambda x: x})
+@rpy2_fix_type
+def wrapped_fix_type_custom(data, *args, **kwargs) -> None:
+    """Function wrapped with ``rpy2_fix_type_custom``."""
+
+
+#
+# Benchmark
+#
+def main() -> None:
+    """Run the benchmark."""
+    parser = benchmark_parser(__doc__.splitlines()[0])
+    parser.set_defaults(repeat=10_000)
+
+    args = parser.parse_args()
+
+    r_identity = robjects.r["identity"]
+    r_value = robjects.IntVector([1])
+
+    call_args = ("NDVI",)
+    call_kwargs = {"multicores": 2, "progress": False, "class_": "raster"}
+
+    results = {
+        "no wrapper": measure(lambda: noop(*call_args, **call_kwargs), args.repeat),
+        "function_call": measure(
+            lambda: wrapped_function_call(*call_args, **call_kwargs), args.repeat
+        ),
+        "rpy2_fix_type": measure(
+            lambda: wrapped_fix_type(*call_args, **call_kwargs), args.repeat
+        ),
+        "rpy2_fix_type_custom": measure(
+            lambda: wrapped_fix_type_custom(*call_args, **call_kwargs), args.repeat
+        ),
+        "R call (identity)": measure(lambda: r_identity(r_value), args.repeat),
+    }
+
+    report(f"Wrapper overhead per call ({args.repeat} calls)", results)
+
+
+if __name__ == "__main__":
+    main()
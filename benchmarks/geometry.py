@@ -0,0 +1,116 @@
+#
+# Copyright (C) 2025 sits developers.
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+
+"""Benchmark of geometry conversions between sf (R) and GeoPandas.
+
+Compares the text (WKT) conversion with the binary (WKB) conversion used by
+``pysits.conversions.tibble``.
+
+Usage:
+    python -m benchmarks.geometry --size 100000
+"""
+
+import numpy as np
+import shapely
+from geopandas import GeoDataFrame as GeoPandasDataFrame
+from rpy2 import robjects
+from rpy2.robjects import pandas2ri
+from rpy2.robjects.conversion import localconverter
+from rpy2.robjects.vectors import DataFrame as RDataFrame
+
+from benchmarks.common import benchmark_parser, measure, report
+from pysits.backend.pkgs import r_pkg_sf
+from pysits.conversions.tibble import _sf_to_shapely, geopandas_to_tibble
+
+
+#
+# Data
+#
+def sample_geometries(size: int) -> GeoPandasDataFrame:
+    """Create a GeoDataFrame with random polygons.
+
+    Args:
+        size (int): Number of polygons.
+
+    Returns:
+        geopandas.GeoDataFrame: Polygons with an ``id`` column.
+    """
+    rng = np.random.default_rng(42)
+
+    xmin = rng.uniform(-60, -50, size)
+    ymin = rng.uniform(-15, -5, size)
+
+    return GeoPandasDataFrame(
+        {"id": np.arange(size)},
+        geometry=shapely.box(xmin, ymin, xmin + 0.01, ymin + 0.01),
+        crs="EPSG:4326",
+    )
+
+
+#
+# WKT conversions (reference)
+#
+def sf_to_shapely_wkt(sf_object: RDataFrame) -> list:
+    """Convert sf geometries to Shapely using WKT."""
+    geom_wkt = r_pkg_sf.st_as_text(r_pkg_sf.st_geometry(sf_object))
+
+    return [shapely.from_wkt(g) for g in list(geom_wkt)]
+
+
+def geopandas_to_sf_wkt(data: GeoPandasDataFrame) -> RDataFrame:
+    """Convert a GeoDataFrame to sf using WKT."""
+    data_wkt = data.copy()
+    data_wkt[data.geometry.name] = data.geometry.to_wkt()
+
+    with localconverter(robjects.default_converter + pandas2ri.converter):
+        r_df = robjects.conversion.py2rpy(data_wkt)
+
+    return r_pkg_sf.st_as_sf(
+        r_df,
+        wkt=robjects.StrVector([data.geometry.name]),
+        crs=robjects.StrVector([data.crs.to_wkt()]),
+    )
+
+
+#
+# Benchmark
+#
+def main() -> None:
+    """Run the benchmark."""
+    args = benchmark_parser(__doc__.splitlines()[0], size=100_000).parse_args()
+
+    data = sample_geometries(args.size)
+    sf_object = geopandas_to_tibble(data)
+
+    results = {
+        "sf -> shapely (WKT)": measure(
+            lambda: sf_to_shapely_wkt(sf_object), args.repeat
+        ),
+        "sf -> shapely (WKB)": measure(lambda: _sf_to_shapely(sf_object), args.repeat),
+        "geopandas -> sf (WKT)": measure(
+            lambda: geopandas_to_sf_wkt(data), args.repeat
+        ),
+        "geopandas -> sf (WKB)": measure(
+            lambda: geopandas_to_tibble(data), args.repeat
+        ),
+    }
+
+    report(f"Geometry conversions ({args.size} polygons)", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#
+# Copyright (C) 2025 sits developers.
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+
+"""Benchmark of the fixed (per-call) overhead of R helper functions.
+
+Compares defining an R helper from its source on each call (as done before the
+helper registry) with calling the helper from ``pysits.backend.registry``, using
+small tibbles, where the fixed overhead dominates the conversion time.
+
+Usage:
+    python -m benchmarks.helpers --size 10
+"""
+
+from rpy2 import robjects
+from rpy2.robjects.vectors import DataFrame as RDataFrame
+
+from benchmarks.common import benchmark_parser, measure, report
+from pysits.backend.registry import r_helpers
+from pysits.conversions.tibble import tibble_schema, tibble_slice
+
+
+#
+# Data
+#
+def sample_tibble(size: int) -> RDataFrame:
+    """Create a small tibble.
+
+    Args:
+        size (int): Number of rows.
+
+    Returns:
+        rpy2.robjects.vectors.DataFrame: Tibble with numeric and character columns.
+    """
+    return robjects.r(f"""
+        tibble::tibble(
+            longitude = runif({size}),
+            latitude = runif({size}),
+            label = sample(c("Forest", "Pasture"), {size}, replace = TRUE)
+        )
+    """)
+
+
+#
+# Inline definitions (reference)
+#
+def call_inline_helper(name: str, *args) -> object:
+    """Define an R helper from its source and call it."""
+    return robjects.r(r_helpers.source(name))(*args)
+
+
+#
+# Benchmark
+#
+def main() -> None:
+    """Run the benchmark."""
+    args = benchmark_parser(__doc__.splitlines()[0], size=10).parse_args()
+    repeat = args.repeat * 20
+
+    data = sample_tibble(args.size)
+    rows = robjects.IntVector([1])
+
+    results = {
+        "tibble_schema (inline)": measure(
+            lambda: call_inline_helper("tibble_schema", data), repeat
+        ),
+        "tibble_schema (registry)": measure(lambda: tibble_schema(data), repeat),
+        "tibble_slice (inline)": measure(
+            lambda: call_inline_helper("tibble_slice", data, rows), repeat
+        ),
+        "tibble_slice (registry)": measure(lambda: tibble_slice(data, [0]), repeat),
+    }
+
+    report(f"R helper calls ({args.size} rows)", results)
+
+
+if __name__ == "__main__":
+    main()
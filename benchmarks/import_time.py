@@ -0,0 +1,203 @@
+#
+# Copyright (C) 2025 sits developers.
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+
+"""Benchmark of the import time (cold start) of pysits.
+
+Runs ``import pysits`` in new Python processes (with ``-X importtime``) and records
+the import time of each module, the time to load each R package of
+``pysits.backend.pkgs`` and to resolve each function of
+``pysits.backend.functions`` (first use). Results are saved as JSON, and the
+benchmark fails if the import time exceeds the startup budget.
+
+Usage:
+    python -m benchmarks.import_time --budget 5 --output import_time.json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.common import report
+
+#
+# Script executed in each process
+#
+COLD_START_SCRIPT = """
+import json
+import time
+
+start = time.perf_counter()
+import pysits
+import_time = time.perf_counter() - start
+
+from pysits.backend import functions, pkgs
+from pysits.backend.loaders import LazyFunction, LazyPackage
+
+packages = {}
+for name, value in vars(pkgs).items():
+    if isinstance(value, LazyPackage):
+        start = time.perf_counter()
+        value.load()
+        packages[name] = time.perf_counter() - start
+
+functions_time = {}
+for name, value in vars(functions).items():
+    if isinstance(value, LazyFunction):
+        start = time.perf_counter()
+        value.resolve()
+        functions_time[name] = time.perf_counter() - start
+
+print(json.dumps({
+    "import": import_time,
+    "packages": packages,
+    "functions": functions_time,
+}))
+"""
+
+
+#
+# Measurement
+#
+def parse_importtime(output: str) -> dict[str, float]:
+    """Parse the output of ``python -X importtime``.
+
+    Args:
+        output (str): Standard error of the process.
+
+    Returns:
+        dict[str, float]: Cumulative import time (in seconds) of each module.
+    """
+    modules = {}
+
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, module = line.removeprefix("import time:").split("|")
+        modules[module.strip()] = int(cumulative) / 1e6
+
+    return modules
+
+
+def run_cold_start() -> dict:
+    """Import pysits in a new process.
+
+    Returns:
+        dict: Import time, R packages and functions loading times and the import
+            time of each module (in seconds).
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", COLD_START_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    result = json.loads(process.stdout.strip().splitlines()[-1])
+    result["modules"] = parse_importtime(process.stderr)
+
+    return result
+
+
+#
+# Aggregation
+#
+def summarize(values: list[float]) -> dict[str, float]:
+    """Summarize the times measured in each process.
+
+    Args:
+        values (list[float]): Times (in seconds).
+
+    Returns:
+        dict[str, float]: Minimum, mean and maximum time (in seconds).
+    """
+    return {"min": min(values), "mean": statistics.mean(values), "max": max(values)}
+
+
+def summarize_runs(runs: list[dict], key: str) -> dict[str, dict[str, float]]:
+    """Summarize the times of each item (module, package or function) of the runs.
+
+    Args:
+        runs (list[dict]): Results of each process (see ``run_cold_start``).
+
+        key (str): Item type (``modules``, ``packages`` or ``functions``).
+
+    Returns:
+        dict[str, dict[str, float]]: Summary of each item.
+    """
+    # Items measured in all runs
+    names = [name for name in runs[0][key] if all(name in run[key] for run in runs)]
+
+    return {name: summarize([run[key][name] for run in runs]) for name in names}
+
+
+#
+# Benchmark
+#
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+
+    parser.add_argument("--repeat", type=int, default=5, help="Number of processes.")
+    parser.add_argument(
+        "--budget", type=float, default=None, help="Import time budget (seconds)."
+    )
+    parser.add_argument("--top", type=int, default=15, help="Modules to report.")
+    parser.add_argument("--output", type=Path, default=None, help="JSON report.")
+
+    args = parser.parse_args()
+
+    runs = [run_cold_start() for _ in range(args.repeat)]
+
+    results = {
+        "import": summarize([run["import"] for run in runs]),
+        "modules": summarize_runs(runs, "modules"),
+        "packages": summarize_runs(runs, "packages"),
+        "functions": summarize_runs(runs, "functions"),
+        "budget": args.budget,
+    }
+
+    # Report
+    slowest_modules = sorted(
+        results["modules"].items(), key=lambda item: item[1]["mean"], reverse=True
+    )
+
+    report("import pysits", {"import pysits": results["import"]})
+    report("Modules (cumulative import time)", dict(slowest_modules[: args.top]))
+
+    if results["packages"]:
+        report("R packages (first use)", results["packages"])
+
+    if results["functions"]:
+        report("R functions (first use)", results["functions"])
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    # Check startup budget
+    if args.budget is not None and results["import"]["mean"] > args.budget:
+        sys.exit(
+            f"import pysits took {results['import']['mean']:.3f}s "
+            f"(budget: {args.budget:.3f}s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
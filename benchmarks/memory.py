@@ -0,0 +1,320 @@
+#
+# Copyright (C) 2025 sits developers.
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+
+"""Benchmark of the memory footprint of the sits model classes.
+
+Creates the model classes (``SITSFrame``, ``SITSTimeSeriesModel`` and
+``SITSCubeModel``) from synthetic tibbles (see ``benchmarks.conversions``) and
+measures the memory used by each of them and by common operations (slicing, sync
+with R and ``sits_as_xarray``): Python heap (``tracemalloc``), R heap (``gc``
+and object size) and process RSS. Results are saved as JSON and the peak memory
+can be compared with a previous report (baseline).
+
+Usage:
+    python -m benchmarks.memory --sizes 1000 10000 --output memory.json
+
+    python -m benchmarks.memory --baseline memory.json --tolerance 1.2
+"""
+
+import argparse
+import gc
+import json
+import resource
+import sys
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from rpy2 import robjects
+from rpy2.rinterface_lib.sexp import Sexp
+
+from benchmarks.common import compare_baseline
+from benchmarks.conversions import sample_cube, sample_samples
+from pysits.conversions.cache import conversion_cache
+from pysits.models.data.cube import SITSCubeModel
+from pysits.models.data.frame import SITSFrame
+from pysits.models.data.ts import SITSTimeSeriesModel
+from pysits.sits.exporters.xarray import sits_as_xarray
+
+#
+# R memory
+#
+R_GC_MEMORY = """
+function(reset) {
+    x <- gc(reset = reset)
+    mb <- which(colnames(x) == "(Mb)")
+
+    c(used = sum(x[, mb[1]]), max_used = sum(x[, mb[3]])) * 1024^2
+}
+"""
+
+R_OBJECT_SIZE = """
+function(x) {
+    if (requireNamespace("lobstr", quietly = TRUE)) {
+        return(as.numeric(lobstr::obj_size(x)))
+    }
+
+    as.numeric(utils::object.size(x))
+}
+"""
+
+
+def _process_rss() -> int:
+    """Get the resident set size (RSS) of the process.
+
+    Returns:
+        int: Current RSS (in bytes). If not available (non-Linux systems), the peak
+            RSS is used.
+    """
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+
+    except OSError:
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        # ``ru_maxrss`` is in bytes on macOS and in kilobytes elsewhere
+        return usage if sys.platform == "darwin" else usage * 1024
+
+
+def r_object_size(data: object) -> int:
+    """Get the size of an R object or of the R instance of a sits object.
+
+    Args:
+        data (object): R object, sits object (or any other object).
+
+    Returns:
+        int: Size (in bytes) of the R object. Zero if the object does not have an
+            R instance (e.g., lazy or not synced).
+    """
+    instance = data if isinstance(data, Sexp) else getattr(data, "_r_instance", None)
+
+    if instance is None:
+        return 0
+
+    return int(robjects.r(R_OBJECT_SIZE)(instance)[0])
+
+
+#
+# Measurement
+#
+def profile_memory(fnc: Callable[[], object]) -> dict[str, int]:
+    """Measure the memory used by a function.
+
+    The conversion cache is cleared before the call, and the result is kept alive
+    while the retained memory is measured. All values are deltas from the state
+    before the call: the R heap is collected and its maximum used memory reset
+    (``gc(reset = TRUE)``) before the call.
+
+    Args:
+        fnc (Callable[[], object]): Function to measure.
+
+    Returns:
+        dict[str, int]: Memory (in bytes) used by the function: peak and retained
+            Python heap (including NumPy), peak R heap growth, process RSS growth,
+            size of the R object of the result and total peak (Python and R).
+    """
+    r_gc_memory = robjects.r(R_GC_MEMORY)
+
+    conversion_cache.clear()
+    gc.collect()
+
+    r_used_start = r_gc_memory(True)[0]
+    rss_start = _process_rss()
+
+    tracemalloc.start()
+
+    try:
+        result = fnc()
+        python_retained, python_peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    rss = _process_rss() - rss_start
+    r_max_used = max(0, int(r_gc_memory(False)[1] - r_used_start))
+
+    memory = {
+        "python_peak": python_peak,
+        "python_retained": python_retained,
+        "r_max_used": r_max_used,
+        "rss": rss,
+        "r_object_size": r_object_size(result),
+        "peak": python_peak + r_max_used,
+    }
+
+    del result
+
+    return memory
+
+
+#
+# Data
+#
+def benchmark_cases(size: int, dates: int, bands: int) -> dict[str, Callable]:
+    """Create the benchmark cases of a data size.
+
+    Args:
+        size (int): Number of samples (and of cube files).
+
+        dates (int): Number of dates of each time series.
+
+        bands (int): Number of bands of each time series.
+
+    Returns:
+        dict[str, Callable]: Functions to measure (by case name).
+    """
+    samples = sample_samples(size, dates, bands)
+    points = robjects.r("function(x) tibble::as_tibble(x[, 1:6])")(samples)
+    cube = sample_cube(size)
+
+    # Models used by the operations
+    ts = SITSTimeSeriesModel(samples, lazy=False)
+    cube_model = SITSCubeModel(cube, lazy=False)
+
+    def sync(data, column):
+        """Change a column of a copy of the data and sync it with R."""
+        data = data.copy()
+        data[column] = "changed"
+        data._sync_instance()
+
+        return data
+
+    return {
+        "frame: load": lambda: SITSFrame(points),
+        "ts: load (eager)": lambda: SITSTimeSeriesModel(samples, lazy=False),
+        "ts: load (lazy)": lambda: SITSTimeSeriesModel(samples, lazy=True),
+        "ts: slice": lambda: ts.iloc[: size // 2],
+        "ts: slice (R instance)": lambda: ts.iloc[: size // 2]._instance,
+        "ts: sync": lambda: sync(ts, "label"),
+        "ts: sits_as_xarray": lambda: sits_as_xarray(ts),
+        "cube: load (eager)": lambda: SITSCubeModel(cube, lazy=False),
+        "cube: load (lazy)": lambda: SITSCubeModel(cube, lazy=True),
+        "cube: slice": lambda: cube_model.iloc[: max(1, len(cube_model) // 2)],
+        "cube: sync": lambda: sync(cube_model, "tile"),
+    }
+
+
+#
+# Benchmark
+#
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="Number of samples (and of cube files).",
+    )
+    parser.add_argument("--dates", type=int, default=23, help="Dates per sample.")
+    parser.add_argument("--bands", type=int, default=2, help="Bands per sample.")
+    parser.add_argument("--cases", default="", help="Run cases containing this text.")
+    parser.add_argument("--output", type=Path, default=None, help="JSON report.")
+    parser.add_argument("--baseline", type=Path, default=None, help="JSON baseline.")
+    parser.add_argument(
+        "--tolerance", type=float, default=1.2, help="Maximum peak ratio to baseline."
+    )
+
+    args = parser.parse_args()
+
+    results = {}
+
+    for size in args.sizes:
+        cases = benchmark_cases(size, args.dates, args.bands)
+
+        # Raw size of the time series (float64 values)
+        raw_size = size * args.dates * args.bands * 8
+
+        print(
+            f"\nMemory ({size} samples, raw time series: {raw_size / 1024**2:.1f} MB)\n"
+        )
+        print(
+            f"{'case':<28}  {'py peak':>10}  {'py kept':>10}  "
+            f"{'R max':>10}  {'R object':>10}  {'RSS':>10}"
+        )
+
+        for name, fnc in cases.items():
+            if args.cases not in name:
+                continue
+
+            case_name = f"{name} [{size}]"
+
+            try:
+                memory = profile_memory(fnc)
+
+            except Exception as e:
+                results[case_name] = {"error": str(e)}
+                print(f"{name:<28}  error: {e}")
+                continue
+
+            results[case_name] = {"memory": memory, "raw_size": raw_size}
+
+            print(
+                f"{name:<28}  "
+                + "  ".join(
+                    f"{memory[key] / 1024**2:>10.1f}"
+                    for key in (
+                        "python_peak",
+                        "python_retained",
+                        "r_max_used",
+                        "r_object_size",
+                        "rss",
+                    )
+                )
+            )
+
+    report_data = {
+        "parameters": {"dates": args.dates, "bands": args.bands},
+        "results": results,
+    }
+
+    # Compare with baseline
+    regressions = []
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        comparison = compare_baseline(
+            results,
+            baseline["results"],
+            args.tolerance,
+            lambda result: result["memory"]["peak"],
+        )
+
+        report_data["baseline"] = {
+            "path": args.baseline.as_posix(),
+            "tolerance": args.tolerance,
+            "comparison": comparison,
+        }
+
+        regressions = [item for item in comparison if item["regression"]]
+
+        for item in comparison:
+            status = "REGRESSION" if item["regression"] else "ok"
+            print(f"{item['case']}: {item['ratio']:.2f}x baseline peak ({status})")
+
+    if args.output:
+        args.output.write_text(json.dumps(report_data, indent=2), encoding="utf-8")
+
+    if regressions:
+        sys.exit(f"{len(regressions)} case(s) above the baseline peak tolerance")
+
+
+if __name__ == "__main__":
+    main()
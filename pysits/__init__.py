@@ -28,12 +28,7 @@ from .sits.colors import (
     sits_colors_show,
 )
 from .sits.config import sits_config, sits_config_show, sits_config_user_file
-from .sits.context import (
-    cerrado_2classes,
-    point_mt_6bands,
-    samples_l8_rondonia_2bands,
-    samples_modis_ndvi,
-)
+from .sits.context import CONTEXT_DATASETS
 from .sits.cube import (
     sits_add_base_cube,
     sits_clean,
@@ -246,3 +241,29 @@ __all__ = (
     # Package settings
     "__version__",
 )
+
+
+#
+# Lazy loading mechanism (context data)
+#
+def __getattr__(name: str) -> object:
+    """Lazily load context data (see ``pysits.sits.context``).
+
+    Args:
+        name (str): Dataset name.
+
+    Returns:
+        object: The requested dataset.
+
+    Raises:
+        AttributeError: If the attribute doesn't exist.
+    """
+    if name in CONTEXT_DATASETS:
+        from .sits import context
+
+        # Cache it in the current module for future access
+        globals()[name] = getattr(context, name)
+
+        return globals()[name]
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -0,0 +1,114 @@
+#
+# Copyright (C) 2025 sits developers.
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+
+"""backend calls of R functions with expression arguments."""
+
+from typing import Any
+
+from rpy2.robjects import ListVector, StrVector
+
+from pysits.backend.registry import r_helpers
+from pysits.conversions.dsl.base import DSLObject
+
+#
+# R helpers
+#
+r_helpers.register(
+    "call_with_expressions",
+    """
+    function(fnc, values, expressions) {
+        env <- new.env(parent = globalenv())
+
+        # Bind values to symbols, so they are not deparsed in the call
+        symbols <- sprintf(".pysits_%s", names(values))
+
+        for (i in seq_along(values)) {
+            assign(symbols[[i]], values[[i]], envir = env)
+        }
+
+        args <- c(
+            lapply(symbols, as.name),
+            lapply(as.character(expressions), str2lang)
+        )
+        names(args) <- c(names(values), names(expressions))
+
+        eval(as.call(c(list(str2lang(fnc)), args)), env)
+    }
+    """,
+)
+
+
+#
+# Calls
+#
+def split_expression_arguments(
+    kwargs: dict[str, Any], text_arguments: tuple[str, ...] = ("output_dir",)
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """Split R arguments into values and (high-level) expressions.
+
+    DSL objects and strings are expressions (R code), except for the arguments in
+    ``text_arguments``. All other arguments are values (R objects).
+
+    Args:
+        kwargs (dict[str, Any]): Arguments converted to R (see ``rpy2_fix_type``).
+
+        text_arguments (tuple[str, ...], optional): Names of string arguments that
+            are not expressions. Defaults to ``("output_dir",)``.
+
+    Returns:
+        tuple[dict[str, Any], dict[str, str]]: Values and expressions (as R code).
+    """
+    values = {}
+    expressions = {}
+
+    for k, v in kwargs.items():
+        if isinstance(v, DSLObject):
+            expressions[k] = v.r_repr()
+
+        elif isinstance(v, StrVector) and k not in text_arguments:
+            expressions[k] = v[0]
+
+        else:
+            values[k] = v
+
+    return values, expressions
+
+
+def call_with_expressions(
+    name: str, values: dict[str, Any], expressions: dict[str, str]
+) -> Any:
+    """Call an R function with values and (high-level) expressions.
+
+    Values are bound to symbols in a private environment and only expressions are
+    parsed, so R objects (e.g., data frames) are not deparsed into R code.
+
+    Args:
+        name (str): Function name (e.g., ``sits::sits_apply``).
+
+        values (dict[str, Any]): Arguments with R objects.
+
+        expressions (dict[str, str]): Arguments with expressions (as R code).
+
+    Returns:
+        Any: Result of the R function.
+    """
+    expressions_r = StrVector(list(expressions.values()))
+    expressions_r.names = StrVector(list(expressions))
+
+    return r_helpers["call_with_expressions"](
+        StrVector([name]), ListVector(values), expressions_r
+    )
@@ -17,34 +17,34 @@
 
 """backend functions."""
 
-from pysits.backend.loaders import load_function_from_package
+from pysits.backend.loaders import lazy_function_from_package
 
 # Base - plot
-r_fnc_plot = load_function_from_package("base::plot")
+r_fnc_plot = lazy_function_from_package("base::plot")
 
 # Base - set column
-r_fnc_set_column = load_function_from_package("base::$<-")
+r_fnc_set_column = lazy_function_from_package("base::$<-")
 
 # Base - summary (base)
-r_fnc_summary = load_function_from_package("base::summary")
+r_fnc_summary = lazy_function_from_package("base::summary")
 
 # Base - readRDS (base)
-r_fnc_read_rds = load_function_from_package("base::readRDS")
+r_fnc_read_rds = lazy_function_from_package("base::readRDS")
 
 # Base - system.file (base)
-r_fnc_system_file = load_function_from_package("base::system_file")
+r_fnc_system_file = lazy_function_from_package("base::system_file")
 
 # Base - set.seed (base)
-r_fnc_set_seed = load_function_from_package("base::set_seed")
+r_fnc_set_seed = lazy_function_from_package("base::set_seed")
 
 # Base - class (base)
-r_fnc_class = load_function_from_package("base::class")
+r_fnc_class = lazy_function_from_package("base::class")
 
 # Base - as.data.frame (base)
-r_fnc_as_data_frame = load_function_from_package("base::as_data_frame")
+r_fnc_as_data_frame = lazy_function_from_package("base::as_data_frame")
 
 # Base - colnames (base)
-r_fnc_colnames = load_function_from_package("base::colnames")
+r_fnc_colnames = lazy_function_from_package("base::colnames")
 
 # Base - rownames (base)
-r_fnc_rownames = load_function_from_package("base::rownames")
+r_fnc_rownames = lazy_function_from_package("base::rownames")
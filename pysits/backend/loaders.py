@@ -17,6 +17,7 @@
 
 """backend loaders."""
 
+import warnings
 from collections.abc import Callable
 from typing import Any
 
@@ -36,7 +37,7 @@ def load_package(name: str, min_version: str | None = None) -> Any:
                 f"`{name}` must have at least version {min_version} or greater."
             )
 
-    return importr(name)
+    return importr(name, on_conflict="warn")
 
 
 def load_data_from_package(name: str, package: str, **kwargs) -> object:
@@ -105,3 +106,194 @@ def load_function_from_package(name: str) -> Callable[..., Any]:
 
     # Return function
     return getattr(pkg, func_name)
+
+
+#
+# Lazy loaders
+#
+class LazyPackage:
+    """R package loaded on its first use.
+
+    Attributes accessed before the package is loaded (e.g., functions referenced
+    by decorators on import) are returned as ``LazyFunction`` proxies, which are
+    checked when the package is loaded. After the package is loaded, attributes
+    are returned as they are.
+
+    Use ``lazy_package`` to share a single instance per package.
+    """
+
+    def __init__(self, name: str, min_version: str | None = None) -> None:
+        """Initializer.
+
+        Args:
+            name (str): Package name.
+
+            min_version (str | None, optional): Minimum version of the package
+                (checked when the package is loaded). Defaults to None.
+        """
+        self._name = name
+        self._min_version = min_version
+        self._package = None
+        self._functions: dict[str, LazyFunction] = {}
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the package is loaded."""
+        return self._package is not None
+
+    def load(self) -> Any:
+        """Load the package (only once).
+
+        Returns:
+            Any: The R package (as loaded by ``importr``).
+        """
+        if self._package is None:
+            self._package = load_package(self._name, min_version=self._min_version)
+
+            # Check functions referenced before the package was loaded
+            missing = [
+                name for name in self._functions if not hasattr(self._package, name)
+            ]
+            if missing:
+                warnings.warn(
+                    f"R package `{self._name}` has no functions: {missing}",
+                    stacklevel=2,
+                )
+
+        return self._package
+
+    def __getattr__(self, name: str) -> Any:
+        """Get an attribute of the package (lazy if the package is not loaded).
+
+        Raises:
+            AttributeError: If the package is loaded and has no attribute ``name``.
+        """
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        if self._package is None:
+            if name not in self._functions:
+                self._functions[name] = LazyFunction(self, name)
+
+            return self._functions[name]
+
+        try:
+            return getattr(self._package, name)
+
+        except AttributeError as e:
+            raise AttributeError(
+                f"R package `{self._name}` has no attribute `{name}`"
+            ) from e
+
+    def __contains__(self, name: str) -> bool:
+        """Check if the package has an attribute (loads the package)."""
+        return hasattr(self.load(), name)
+
+    def __repr__(self) -> str:
+        """String representation of the lazy package."""
+        status = "loaded" if self.loaded else "not loaded"
+
+        return f"<LazyPackage {self._name} ({status})>"
+
+
+class LazyFunction:
+    """R function of a ``LazyPackage`` resolved on its first use."""
+
+    def __init__(self, package: LazyPackage, name: str) -> None:
+        """Initializer.
+
+        Args:
+            package (LazyPackage): Package of the function.
+
+            name (str): Function name (as translated by ``importr``).
+        """
+        self._package = package
+        self._name = name
+        self._function = None
+
+    def resolve(self) -> Callable[..., Any]:
+        """Get the R function (loads the package, if required).
+
+        Returns:
+            Callable[..., Any]: The R function.
+
+        Raises:
+            AttributeError: If the package has no function ``name``.
+        """
+        if self._function is None:
+            self._package.load()
+            self._function = getattr(self._package, self._name)
+
+        return self._function
+
+    def __call__(self, *args, **kwargs) -> Any:
+        """Call the R function."""
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """Get an attribute of the R function."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        """String representation of the lazy function."""
+        return f"<LazyFunction {self._package._name}::{self._name}>"
+
+
+# Lazy packages, shared by package name (each package is loaded only once)
+_lazy_packages: dict[str, LazyPackage] = {}
+
+
+def lazy_package(name: str, min_version: str | None = None) -> LazyPackage:
+    """Get the lazy loader of an R package (shared by all callers).
+
+    Args:
+        name (str): Package name.
+
+        min_version (str | None, optional): Minimum version of the package
+            (checked when the package is loaded). Defaults to None.
+
+    Returns:
+        LazyPackage: The lazy package. The first call of each package creates it;
+            later calls return the same instance.
+    """
+    package = _lazy_packages.get(name)
+
+    if package is None:
+        package = _lazy_packages[name] = LazyPackage(name, min_version=min_version)
+
+    elif min_version and not package.loaded:
+        package._min_version = min_version
+
+    return package
+
+
+def lazy_function_from_package(name: str) -> Callable[..., Any]:
+    """Load an R function from a specified package, on its first use.
+
+    Args:
+        name (str): The fully qualified name of the R function in the format
+                    'package::function'. For example, 'stats::median'.
+
+    Returns:
+        Callable[..., Any]: A callable proxy to the R function (``LazyFunction``).
+            The R package is loaded when the function is first used. If the
+            package is already loaded, the R function is returned.
+
+    Raises:
+        ValueError: If the ``name`` doesn't follow the 'package::function' format.
+
+        AttributeError: If the package is loaded and has no function ``name``.
+    """
+    try:
+        package_name, func_name = name.split("::")
+
+    except ValueError as e:
+        raise ValueError(
+            f"Invalid function name format: {name}. "
+            "Expected format: 'package::function'"
+        ) from e
+
+    return getattr(lazy_package(package_name), func_name)
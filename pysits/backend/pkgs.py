@@ -15,22 +15,22 @@
 # along with this program; if not, see <https://www.gnu.org/licenses/>.
 #
 
-"""backend packages."""
+"""backend packages (loaded on first use)."""
 
-from pysits.backend.loaders import load_package
+from pysits.backend.loaders import lazy_package
 from pysits.settings import __sitsver__
 
 # system pakage
-r_pkg_base = load_package("base")
-r_pkg_grdevices = load_package("grDevices")
+r_pkg_base = lazy_package("base")
+r_pkg_grdevices = lazy_package("grDevices")
 
 # sits package
-r_pkg_sits = load_package("sits", min_version=__sitsver__)
+r_pkg_sits = lazy_package("sits", min_version=__sitsver__)
 
 # sits-dependencies packages
-r_pkg_tibble = load_package("tibble")
-r_pkg_leaflet = load_package("leaflet")
-r_pkg_kohonen = load_package("kohonen")
-r_pkg_sf = load_package("sf")
-r_pkg_htmlwidgets = load_package("htmlwidgets")
-r_pkg_arrow = load_package("arrow")
+r_pkg_tibble = lazy_package("tibble")
+r_pkg_leaflet = lazy_package("leaflet")
+r_pkg_kohonen = lazy_package("kohonen")
+r_pkg_sf = lazy_package("sf")
+r_pkg_htmlwidgets = lazy_package("htmlwidgets")
+r_pkg_arrow = lazy_package("arrow")
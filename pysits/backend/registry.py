@@ -0,0 +1,143 @@
+#
+# Copyright (C) 2025 sits developers.
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+
+"""backend registry of R helper functions."""
+
+from collections.abc import Callable
+from typing import Any
+
+from rpy2.robjects import r as rpy2_r_interface
+
+
+#
+# Helper registry
+#
+class RHelperRegistry:
+    """Registry of R helper functions used by pysits.
+
+    Helpers are registered with their R source code and are defined (only once,
+    when first used) in a private R environment, so the user's global environment
+    is not changed. Defined helpers are byte-compiled and cached as Python
+    callables.
+    """
+
+    def __init__(self) -> None:
+        """Initializer."""
+        self._sources = {}
+        self._functions = {}
+
+        self._env = None
+        self._define_fnc = None
+
+    #
+    # Auxiliary methods
+    #
+    def _define(self, name: str) -> Callable[..., Any]:
+        """Define and byte-compile an R helper in the private environment.
+
+        Args:
+            name (str): Helper name.
+
+        Returns:
+            Callable[..., Any]: The R function (as Python callable).
+        """
+        if self._env is None:
+            # Helpers see the attached packages, but not the global environment
+            self._env = rpy2_r_interface("new.env(parent = parent.env(globalenv()))")
+
+            self._define_fnc = rpy2_r_interface("""
+                function(env, name, source) {
+                    fnc <- eval(parse(text = source, keep.source = FALSE), env)
+                    fnc <- compiler::cmpfun(fnc)
+
+                    assign(name, fnc, envir = env)
+
+                    fnc
+                }
+            """)
+
+        return self._define_fnc(self._env, name, self._sources[name])
+
+    #
+    # Registry methods
+    #
+    def register(self, name: str, source: str) -> None:
+        """Register an R helper function.
+
+        Args:
+            name (str): Helper name.
+
+            source (str): R source code of the helper (a function definition).
+
+        Raises:
+            ValueError: If a different helper is already registered with ``name``.
+        """
+        if self._sources.get(name, source) != source:
+            raise ValueError(f"R helper already registered: {name}")
+
+        self._sources[name] = source
+
+    def get(self, name: str) -> Callable[..., Any]:
+        """Get an R helper function.
+
+        Args:
+            name (str): Helper name.
+
+        Returns:
+            Callable[..., Any]: The R function (as Python callable).
+
+        Raises:
+            KeyError: If the helper is not registered.
+        """
+        if name not in self._functions:
+            if name not in self._sources:
+                raise KeyError(f"R helper not registered: {name}")
+
+            self._functions[name] = self._define(name)
+
+        return self._functions[name]
+
+    def source(self, name: str) -> str:
+        """Get the R source code of a helper function.
+
+        Args:
+            name (str): Helper name.
+
+        Returns:
+            str: R source code of the helper.
+
+        Raises:
+            KeyError: If the helper is not registered.
+        """
+        if name not in self._sources:
+            raise KeyError(f"R helper not registered: {name}")
+
+        return self._sources[name]
+
+    def __getitem__(self, name: str) -> Callable[..., Any]:
+        """Get an R helper function (see ``get``)."""
+        return self.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        """Check if an R helper is registered."""
+        return name in self._sources
+
+
+#
+# Registry instance
+#
+r_helpers = RHelperRegistry()
@@ -0,0 +1,258 @@
+#
+# Copyright (C) 2025 sits developers.
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+
+"""Arrow transport between R and Python."""
+
+import ctypes
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+from pyarrow import RecordBatchReader, Table, feather
+from rpy2.robjects import StrVector
+from rpy2.robjects.vectors import DataFrame as RDataFrame
+
+from pysits import settings
+from pysits.backend.pkgs import r_pkg_arrow
+from pysits.backend.registry import r_helpers
+
+#
+# R helpers
+#
+r_helpers.register(
+    "arrow_stream_export",
+    """
+    function(data, stream_ptr) {
+        reader <- arrow::as_record_batch_reader(arrow::as_arrow_table(data))
+        reader$export_to_c(stream_ptr)
+
+        invisible(NULL)
+    }
+    """,
+)
+
+r_helpers.register(
+    "arrow_stream_import",
+    """
+    function(stream_ptr) {
+        reader <- arrow::RecordBatchReader$import_from_c(stream_ptr)
+
+        as.data.frame(reader$read_table())
+    }
+    """,
+)
+
+
+#
+# Arrow C Stream interface
+#
+class _ArrowArrayStream(ctypes.Structure):
+    """Arrow C Stream interface structure (``struct ArrowArrayStream``).
+
+    Note:
+        To learn more about this structure, please check the Arrow documentation:
+        https://arrow.apache.org/docs/format/CStreamInterface.html
+    """
+
+    _fields_ = [
+        ("get_schema", ctypes.c_void_p),
+        ("get_next", ctypes.c_void_p),
+        ("get_last_error", ctypes.c_void_p),
+        ("release", ctypes.c_void_p),
+        ("private_data", ctypes.c_void_p),
+    ]
+
+
+def _release_arrow_stream(stream: _ArrowArrayStream) -> None:
+    """Release an Arrow C stream that was not moved by its consumer.
+
+    Args:
+        stream (_ArrowArrayStream): Arrow C stream structure.
+    """
+    if stream.release:
+        release_fnc = ctypes.CFUNCTYPE(None, ctypes.c_void_p)(stream.release)
+        release_fnc(ctypes.addressof(stream))
+
+
+def _load_arrow_stream_exporter_function() -> Callable[[RDataFrame, StrVector], None]:
+    """Load an R function that exports a data frame to an Arrow C stream.
+
+    Returns:
+        Callable[[RDataFrame, StrVector], None]: An R function that takes a data
+            frame and the address of an ``ArrowArrayStream`` structure (as string)
+            and exports the data frame to it.
+    """
+    return r_helpers["arrow_stream_export"]
+
+
+def _load_arrow_stream_importer_function() -> Callable[[StrVector], RDataFrame]:
+    """Load an R function that imports a data frame from an Arrow C stream.
+
+    Returns:
+        Callable[[StrVector], RDataFrame]: An R function that takes the address of
+            an ``ArrowArrayStream`` structure (as string) and returns its content as
+            an R data frame (tibble).
+    """
+    return r_helpers["arrow_stream_import"]
+
+
+#
+# Transport functions
+#
+def _tibble_to_arrow_c_stream(data: RDataFrame) -> Table:
+    """Move an R data frame to a pyarrow Table using the Arrow C Stream interface.
+
+    Args:
+        data (rpy2.robjects.vectors.DataFrame): R (tibble/data.frame) Data frame.
+
+    Returns:
+        pyarrow.Table: Data frame as an Arrow table.
+    """
+    stream = _ArrowArrayStream()
+    stream_address = ctypes.addressof(stream)
+
+    try:
+        # Export from R
+        _load_arrow_stream_exporter_function()(data, StrVector([str(stream_address)]))
+
+        # Import in Python (the stream is moved, so the structure can be released)
+        return RecordBatchReader._import_from_c(stream_address).read_all()
+
+    finally:
+        _release_arrow_stream(stream)
+
+
+def _arrow_to_tibble_c_stream(table: Table) -> RDataFrame:
+    """Move a pyarrow Table to an R data frame using the Arrow C Stream interface.
+
+    Args:
+        table (pyarrow.Table): Arrow table.
+
+    Returns:
+        rpy2.robjects.vectors.DataFrame: Arrow table as R (tibble) Data frame.
+    """
+    stream = _ArrowArrayStream()
+    stream_address = ctypes.addressof(stream)
+
+    try:
+        # Export from Python
+        table.to_reader()._export_to_c(stream_address)
+
+        # Import in R
+        return _load_arrow_stream_importer_function()(StrVector([str(stream_address)]))
+
+    finally:
+        _release_arrow_stream(stream)
+
+
+def _tibble_to_arrow_feather(data: RDataFrame) -> Table:
+    """Move an R data frame to a pyarrow Table using a temporary Feather file.
+
+    Args:
+        data (rpy2.robjects.vectors.DataFrame): R (tibble/data.frame) Data frame.
+
+    Returns:
+        pyarrow.Table: Data frame as an Arrow table.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = (Path(tmp_dir) / "data.feather").as_posix()
+
+        # Write to Feather format
+        r_pkg_arrow.write_feather(data, tmp_path)
+
+        # Read from Feather format
+        return feather.read_table(tmp_path)
+
+
+def _arrow_to_tibble_feather(table: Table) -> RDataFrame:
+    """Move a pyarrow Table to an R data frame using a temporary Feather file.
+
+    Args:
+        table (pyarrow.Table): Arrow table.
+
+    Returns:
+        rpy2.robjects.vectors.DataFrame: Arrow table as R (tibble) Data frame.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = (Path(tmp_dir) / "data.feather").as_posix()
+
+        # Write to Feather format
+        feather.write_feather(table, tmp_path)
+
+        # Read from Feather format
+        return r_pkg_arrow.read_feather(tmp_path)
+
+
+#
+# Available transports
+#
+ARROW_TRANSPORTS = {
+    "c_stream": (_tibble_to_arrow_c_stream, _arrow_to_tibble_c_stream),
+    "feather": (_tibble_to_arrow_feather, _arrow_to_tibble_feather),
+}
+
+
+def _get_arrow_transport() -> tuple[Callable, Callable]:
+    """Get the Arrow transport functions selected in ``pysits.settings``.
+
+    Returns:
+        tuple[Callable, Callable]: Functions to move data from R to Python and from
+            Python to R.
+
+    Raises:
+        ValueError: If the selected transport is not available.
+    """
+    transport = settings.ARROW_TRANSPORT
+
+    if transport not in ARROW_TRANSPORTS:
+        raise ValueError(
+            f"Invalid Arrow transport: {transport}. "
+            f"Available transports: {', '.join(ARROW_TRANSPORTS)}"
+        )
+
+    return ARROW_TRANSPORTS[transport]
+
+
+#
+# General conversions
+#
+def tibble_to_arrow(data: RDataFrame) -> Table:
+    """Convert an R data frame to a pyarrow Table.
+
+    Args:
+        data (rpy2.robjects.vectors.DataFrame): R (tibble/data.frame) Data frame.
+
+    Returns:
+        pyarrow.Table: Data frame as an Arrow table.
+    """
+    tibble_to_arrow_fnc, _ = _get_arrow_transport()
+
+    return tibble_to_arrow_fnc(data)
+
+
+def arrow_to_tibble(table: Table) -> RDataFrame:
+    """Convert a pyarrow Table to an R data frame (tibble).
+
+    Args:
+        table (pyarrow.Table): Arrow table.
+
+    Returns:
+        rpy2.robjects.vectors.DataFrame: Arrow table as R (tibble) Data frame.
+    """
+    _, arrow_to_tibble_fnc = _get_arrow_transport()
+
+    return arrow_to_tibble_fnc(table)
@@ -0,0 +1,218 @@
+#
+# Copyright (C) 2025 sits developers.
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+
+"""Cache of conversions from R to Python."""
+
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+
+from pandas import DataFrame as PandasDataFrame
+from pandas import __version__ as pandas_version
+from pandas import get_option as pandas_get_option
+from rpy2.robjects.vectors import DataFrame as RDataFrame
+
+from pysits import settings
+
+#
+# Constants
+#
+PANDAS_COPY_ON_WRITE_VERSION = 3
+"""Major version of pandas where Copy-on-Write is always enabled."""
+
+
+#
+# Conversion cache
+#
+class ConversionCache:
+    """LRU cache of R data frames converted to Python.
+
+    Entries are identified by the R object (``SEXP``) identity and by a
+    modification stamp (classes, column names and number of rows), which changes
+    when the R object is modified in place (e.g., its classes). The R object is not
+    kept alive by the cache: entries are removed when the R object (Python wrapper)
+    is released, so its identity is not reused by other objects while cached.
+
+    Converted data is copied when returned, so changes in the returned data frames
+    do not change the cached data. With pandas Copy-on-Write, copies share the
+    data until they are changed.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        """Initializer.
+
+        Args:
+            max_entries (int): Maximum number of cached conversions.
+
+            max_bytes (int): Maximum size (in bytes) of the cached conversions.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+
+        self._entries = OrderedDict()
+
+    #
+    # Auxiliary methods
+    #
+    @staticmethod
+    def _key(instance: RDataFrame, converter: Callable) -> tuple:
+        """Create the cache key of an R object.
+
+        Args:
+            instance (rpy2.robjects.vectors.DataFrame): R data frame.
+
+            converter (Callable): Function used to convert the R data frame.
+
+        Returns:
+            tuple: Cache key.
+        """
+        return (
+            converter,
+            instance.rid,
+            tuple(instance.rclass),
+            tuple(instance.names),
+            instance.nrow,
+        )
+
+    @staticmethod
+    def _size(data: PandasDataFrame) -> int:
+        """Estimate the size (in bytes) of a converted data frame.
+
+        Object columns (e.g., strings) are measured by their values and nested
+        columns by the size of their data (see ``SITSFrameArray.nbytes``).
+        """
+        return int(data.memory_usage(index=True, deep=True).sum())
+
+    @staticmethod
+    def _copy(data: PandasDataFrame) -> PandasDataFrame:
+        """Copy a converted data frame (shallow with pandas Copy-on-Write)."""
+        copy_on_write = (
+            int(pandas_version.split(".")[0]) >= PANDAS_COPY_ON_WRITE_VERSION
+        ) or (pandas_get_option("mode.copy_on_write") is True)
+
+        return data.copy(deep=not copy_on_write)
+
+    def _remove(self, key: tuple) -> None:
+        """Remove an entry (e.g., when its R object is released).
+
+        Args:
+            key (tuple): Cache key.
+        """
+        entry = self._entries.pop(key, None)
+
+        if entry is not None:
+            finalizer, _, size = entry
+
+            finalizer.detach()
+            self.nbytes -= size
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries exceeding the cache limits."""
+        while self._entries and (
+            len(self._entries) > self.max_entries or self.nbytes > self.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+
+    #
+    # Cache operations
+    #
+    def convert(
+        self, instance: RDataFrame, converter: Callable[[RDataFrame], PandasDataFrame]
+    ) -> PandasDataFrame:
+        """Convert an R data frame to Python, reusing cached conversions.
+
+        Args:
+            instance (rpy2.robjects.vectors.DataFrame): R data frame.
+
+            converter (Callable[[RDataFrame], PandasDataFrame]): Function used to
+                convert the R data frame.
+
+        Returns:
+            pandas.DataFrame: Converted data frame.
+        """
+        if self.max_entries <= 0 or not isinstance(instance, RDataFrame):
+            return converter(instance)
+
+        key = self._key(instance, converter)
+
+        # Cached conversion
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+
+            _, data, _ = self._entries[key]
+
+            return self._copy(data)
+
+        # New conversion
+        self.misses += 1
+
+        data = converter(instance)
+        size = self._size(data)
+
+        if size <= self.max_bytes:
+            # Remove the entry when the R object is released
+            finalizer = weakref.finalize(instance, self._remove, key)
+
+            self._entries[key] = (finalizer, data, size)
+            self.nbytes += size
+
+            self._evict()
+
+            return self._copy(data)
+
+        return data
+
+    def info(self) -> dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            dict[str, int]: Hits, misses, number of entries and size (in bytes) of
+                the cache, with the cache limits.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "nbytes": self.nbytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self) -> None:
+        """Remove all cached conversions and reset statistics."""
+        for finalizer, _, _ in list(self._entries.values()):
+            finalizer.detach()
+
+        self._entries.clear()
+
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+
+
+#
+# Default cache (disabled unless ``PYSITS_CONVERSION_CACHE_SIZE`` is set)
+#
+conversion_cache = ConversionCache(
+    max_entries=settings.CONVERSION_CACHE_SIZE,
+    max_bytes=settings.CONVERSION_CACHE_BYTES,
+)
@@ -53,7 +53,7 @@ def closure_factory(
     Raises:
         ValueError: If the specified function name does not exist in the R sits package.
     """
-    if not hasattr(r_pkg_sits, name):
+    if name not in r_pkg_sits:
         raise ValueError(f"Invalid function: {name}")
 
     # define method closure
@@ -17,20 +17,100 @@
 
 """Common conversions."""
 
+import functools
+from collections.abc import Callable
 from datetime import date, timedelta
 from pathlib import Path, PosixPath
 
+import numpy as np
 import rpy2.robjects as ro
 from geopandas import GeoDataFrame as GeoPandasDataFrame
+from pandas import CategoricalDtype
 from pandas import DataFrame as PandasDataFrame
+from pandas import Series as PandasSeries
+from pandas.api.types import infer_dtype, is_integer_dtype
 from rpy2.rinterface_lib.sexp import NULLType
 from rpy2.robjects import pandas2ri
 from rpy2.robjects.robject import RObjectMixin
 
+from pysits.backend.loaders import LazyFunction
 from pysits.backend.pkgs import r_pkg_tibble
 from pysits.conversions.dsl.base import DSLObject
+from pysits.conversions.numpy import categorical_to_r, numpy_to_r, r_vector_to_numpy
 from pysits.conversions.tibble import geopandas_to_tibble, pandas_to_tibble
 
+
+#
+# Array conversions
+#
+def convert_array_like_to_r(obj: np.ndarray | np.generic) -> ro.vectors.Vector:
+    """Convert a NumPy array (or scalar) to an R vector.
+
+    Numeric, logical and date arrays are copied in bulk to R. Arrays of Python
+    objects are converted element by element, as lists.
+
+    Args:
+        obj (np.ndarray | np.generic): NumPy array or scalar.
+
+    Returns:
+        ro.vectors.Vector: R vector (or matrix, for multidimensional arrays).
+    """
+    values = np.asarray(obj)
+
+    # Scalars are converted as vectors of length one
+    if values.ndim == 0:
+        values = values.reshape(1)
+
+    if values.dtype.kind == "O":
+        return convert_list_like_to_r(values.tolist())
+
+    return numpy_to_r(values)
+
+
+def convert_series_to_r(obj: PandasSeries) -> ro.vectors.Vector:
+    """Convert a pandas Series to an R vector.
+
+    Categorical series are converted to factors, and missing values of nullable
+    types (e.g., ``boolean``, ``Int64`` and ``string``) are converted to ``NA``.
+    Series with a non-integer index (e.g., string labels) are converted to named
+    vectors.
+
+    Args:
+        obj (pandas.Series): Series to convert.
+
+    Returns:
+        ro.vectors.Vector: R vector.
+    """
+    if isinstance(obj.dtype, CategoricalDtype):
+        vector = categorical_to_r(obj.array)
+
+    else:
+        values = obj.to_numpy()
+        missing = obj.isna().to_numpy()
+
+        # Nullable numeric / boolean types use ``pd.NA`` (filled, then set as NA)
+        if obj.dtype.kind in "biuf" and hasattr(obj.dtype, "numpy_dtype"):
+            numpy_dtype = obj.dtype.numpy_dtype
+
+            values = obj.to_numpy(dtype=numpy_dtype, na_value=numpy_dtype.type(0))
+
+        # Strings with missing values (``pd.NA``, ``None`` or ``NaN``)
+        elif values.dtype.kind == "O" and infer_dtype(values) == "string":
+            values = obj.to_numpy(dtype=object, na_value="").astype(str)
+
+        vector = (
+            convert_array_like_to_r(values)
+            if values.dtype.kind == "O"
+            else numpy_to_r(values, missing)
+        )
+
+    # Use index as names (integer indexes are positions, e.g., of filtered series)
+    if not is_integer_dtype(obj.index.dtype):
+        vector.names = ro.StrVector(obj.index.astype(str).tolist())
+
+    return vector
+
+
 #
 # Type mapping dictionary
 #
@@ -47,6 +127,9 @@ TYPE_CONVERSIONS = {
     PosixPath: lambda obj: ro.StrVector([obj.as_posix()]),
     PandasDataFrame: lambda obj: r_pkg_tibble.as_tibble(pandas_to_tibble(obj)),
     GeoPandasDataFrame: lambda obj: geopandas_to_tibble(obj),
+    np.ndarray: convert_array_like_to_r,
+    PandasSeries: convert_series_to_r,
+    LazyFunction: lambda obj: obj.resolve(),
 }
 
 
@@ -55,6 +138,11 @@ TYPE_CONVERSIONS = {
 #
 EPOCH_START = date(1970, 1, 1)
 
+#
+# NumPy types of Python types
+#
+NUMPY_TYPES = {"int": np.int64, "float": np.float64, "bool": np.bool_}
+
 
 #
 # Base utilities
@@ -143,6 +231,49 @@ def convert_dict_like_to_r(obj: dict) -> ro.vectors.Vector:
     return convert_dict_like_as_list_to_r(obj)
 
 
+def _convert_instance_to_r(obj):
+    """Get the R instance of a ``SITSBase`` object (changes are synced to R)."""
+    instance = obj._instance
+
+    if not instance:
+        raise TypeError(f"Cannot convert object of type {type(obj)} to R format")
+
+    return instance
+
+
+@functools.cache
+def _get_converter(obj_type: type) -> Callable | None:
+    """Get the function used to convert objects of a type to R.
+
+    The function is defined once per type, so conversions of objects of the same
+    type (e.g., in loops) don't repeat the type checks.
+
+    Args:
+        obj_type (type): Object type.
+
+    Returns:
+        Callable | None: Conversion function. Returns ``None`` if the type is not
+            supported.
+    """
+    # Check if the object type exists in the conversion dictionary
+    if obj_type in TYPE_CONVERSIONS:
+        return TYPE_CONVERSIONS[obj_type]
+
+    # Handle ``SITSBase`` objects
+    if hasattr(obj_type, "_instance"):
+        return _convert_instance_to_r
+
+    # Handle ``raw R`` / Expressions objects
+    if issubclass(obj_type, RObjectMixin | DSLObject):
+        return lambda obj: obj
+
+    # Handle NumPy scalars (e.g., ``np.float64``, ``np.datetime64``)
+    if issubclass(obj_type, np.generic):
+        return convert_array_like_to_r
+
+    return None
+
+
 def convert_to_r(obj):
     """Convert Python objects to R-compatible objects for use with rpy2.
 
@@ -156,27 +287,18 @@ def convert_to_r(obj):
         TypeError: If the object type cannot be converted.
     """
     if obj is None:
-        return ro.r("NULL")  # Convert None to R's NULL
-
-    obj_type = type(obj)
-
-    # Handle ``SITSBase`` objects
-    if getattr(obj, "_instance", None):
-        # Sync instance with R
-        if getattr(obj, "_sync_instance", None):
-            obj._sync_instance()
+        return ro.NULL  # Convert None to R's NULL
 
-        return obj._instance
+    converter = _get_converter(type(obj))
 
-    # Handle ``raw R`` / Expressions objects
-    if isinstance(obj, RObjectMixin | DSLObject):
-        return obj
+    if converter is None:
+        # Objects with an R instance defined on creation
+        if getattr(obj, "_instance", None):
+            return obj._instance
 
-    # Check if the object type exists in the conversion dictionary
-    if obj_type in TYPE_CONVERSIONS:
-        return TYPE_CONVERSIONS[obj_type](obj)
+        raise TypeError(f"Cannot convert object of type {type(obj)} to R format")
 
-    raise TypeError(f"Cannot convert object of type {obj_type} to R format")
+    return converter(obj)
 
 
 def convert_to_python(obj, as_type="str"):
@@ -203,10 +325,29 @@ def convert_to_python(obj, as_type="str"):
         ValueError: If the specified ``as_type`` is not supported.
     """
 
-    def _convert(value, type_):
+    def _convert(value, type_):  # noqa: PLR0912
         result = []
 
-        if isinstance(value, ro.ListVector):
+        # Numeric, integer and logical vectors are copied in bulk
+        values = None
+
+        if as_type in ("int", "float", "bool") and isinstance(value, ro.Vector):
+            values = r_vector_to_numpy(value)
+
+            # Missing values (``NaN``) can not be cast to integers: these vectors
+            # are converted by element (``NA`` integers are kept as ``NA_integer_``)
+            if (
+                as_type == "int"
+                and values is not None
+                and values.dtype.kind == "f"
+                and np.isnan(values).any()
+            ):
+                values = None
+
+        if values is not None and values.dtype != object:
+            result = values.ravel(order="F").astype(NUMPY_TYPES[as_type]).tolist()
+
+        elif isinstance(value, ro.ListVector):
             for k, v in value.items():
                 result.append(
                     {
@@ -32,6 +32,31 @@ P = ParamSpec("P")
 R = TypeVar("R")
 
 
+#
+# Auxiliary functions
+#
+def _convert_arguments(
+    args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[list[Any], dict[str, Any]]:
+    """Convert positional and keyword arguments to R-compatible objects.
+
+    Args:
+        args (tuple[Any, ...]): Positional arguments.
+
+        kwargs (dict[str, Any]): Keyword arguments.
+
+    Returns:
+        tuple[list[Any], dict[str, Any]]: Converted arguments.
+    """
+    if kwargs:
+        kwargs = fix_reserved_words_parameters(**kwargs)
+
+    return (
+        [convert_to_r(arg) for arg in args],
+        {k: convert_to_r(v) for k, v in kwargs.items()},
+    )
+
+
 #
 # Decorator
 #
@@ -47,9 +72,7 @@ def rpy2_fix_type(func: Callable[P, R]) -> Callable[P, R]:
 
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        kwargs = fix_reserved_words_parameters(**kwargs)
-        converted_args = [convert_to_r(arg) for arg in args]
-        converted_kwargs = {k: convert_to_r(v) for k, v in kwargs.items()}
+        converted_args, converted_kwargs = _convert_arguments(args, kwargs)
         return func(*converted_args, **converted_kwargs)
 
     return wrapper
@@ -83,19 +106,19 @@ def rpy2_fix_type_custom(
     """
 
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        # Get the converter of each positional parameter (defined once)
+        param_names = list(inspect.signature(func).parameters.keys())
+        param_converters = [converters.get(name) for name in param_names]
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Get the function's parameter names
-            param_names = inspect.signature(func).parameters.keys()
-            param_names = list(param_names)
-
             # Convert positional arguments using their parameter names
-            converted_args = []
-            for i, arg in enumerate(args):
-                if i < len(param_names) and param_names[i] in converters:
-                    converted_args.append(converters[param_names[i]](arg))
-                else:
-                    converted_args.append(arg)
+            converted_args = [
+                param_converters[i](arg)
+                if i < len(param_converters) and param_converters[i]
+                else arg
+                for i, arg in enumerate(args)
+            ]
 
             # Convert keyword arguments
             converted_kwargs = {}
@@ -118,7 +141,7 @@ def function_call(r_function: Callable[P, R], output_wrapper: Callable[[R], T]):
     This decorator is used to wrap Python stub functions that serve as documentation
     and type hint shells. The resulting function performs the following steps:
 
-    1. Converts all arguments to R-compatible types using `@rpy2_fix_type`.
+    1. Converts all arguments to R-compatible types (as `@rpy2_fix_type`).
     2. Calls the provided R function (`r_function`) with converted arguments.
     3. Wraps the result in a specified output Python class (`output_wrapper`).
 
@@ -137,10 +160,11 @@ def function_call(r_function: Callable[P, R], output_wrapper: Callable[[R], T]):
     """
 
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
-        @rpy2_fix_type
         @functools.wraps(func)
         def wrapped(*args: P.args, **kwargs: P.kwargs) -> T:
-            result = r_function(*args, **kwargs)
+            converted_args, converted_kwargs = _convert_arguments(args, kwargs)
+
+            result = r_function(*converted_args, **converted_kwargs)
             return output_wrapper(result)
 
         return wrapped
@@ -0,0 +1,257 @@
+#
+# Copyright (C) 2025 sits developers.
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+
+"""NumPy conversions."""
+
+import numpy as np
+from pandas import Categorical as PandasCategorical
+from rpy2.rinterface import BoolSexpVector, FloatSexpVector, IntSexpVector
+from rpy2.rinterface_lib.sexp import NULLType
+from rpy2.robjects import NA_Character
+from rpy2.robjects.vectors import BoolVector, FloatVector, IntVector, StrVector, Vector
+
+#
+# R constants
+#
+R_NA_INTEGER = np.iinfo(np.int32).min
+"""Value used by R to represent ``NA`` in integer and logical vectors."""
+
+R_EPOCH = np.datetime64("1970-01-01", "D")
+"""Reference date of R ``Date`` values."""
+
+
+#
+# Auxiliary functions
+#
+def _r_dims(vector: Vector) -> tuple[int, ...] | None:
+    """Get the dimensions of an R vector (matrix/array).
+
+    Args:
+        vector (rpy2.robjects.vectors.Vector): R vector.
+
+    Returns:
+        tuple[int, ...] | None: Dimensions, or None if the vector has no dimensions.
+    """
+    try:
+        return tuple(int(dim) for dim in vector.do_slot("dim"))
+
+    except LookupError:
+        return None
+
+
+#
+# R to NumPy conversions
+#
+def r_vector_to_numpy(vector: Vector) -> np.ndarray | None:
+    """Convert an R numeric, integer or logical vector (or matrix) to NumPy.
+
+    Values are copied in bulk from the R memory (buffer protocol), without
+    iterating over the elements. Matrices and arrays keep their dimensions.
+
+    Args:
+        vector (rpy2.robjects.vectors.Vector): R vector, matrix or array.
+
+    Returns:
+        np.ndarray | None: Array with the values of the vector (``NA`` values are
+            represented as ``NaN`` for integers and as ``None`` for logicals), or None
+            if the vector type is not supported (e.g., character vectors, lists and
+            factors).
+    """
+    if isinstance(vector, FloatSexpVector):
+        dtype = np.float64
+
+    elif isinstance(vector, IntSexpVector | BoolSexpVector):
+        dtype = np.int32
+
+    else:
+        return None
+
+    # Factors are integer vectors with levels
+    if "factor" in vector.rclass:
+        return None
+
+    # Copy values (R vectors are stored in column-major order)
+    values = np.frombuffer(vector.memoryview(), dtype=dtype).copy()
+
+    # Handle ``NA`` values
+    if isinstance(vector, BoolSexpVector):
+        is_na = values == R_NA_INTEGER
+
+        values = values.astype(bool)
+
+        if is_na.any():
+            values = np.where(is_na, None, values)
+
+    elif isinstance(vector, IntSexpVector):
+        is_na = values == R_NA_INTEGER
+
+        if is_na.any():
+            values = np.where(is_na, np.nan, values)
+
+    # Restore dimensions
+    dims = _r_dims(vector)
+
+    if dims is not None:
+        values = values.reshape(dims, order="F")
+
+    return values
+
+
+def r_dimnames(vector: Vector) -> list[list[str] | None]:
+    """Get the names of each dimension of an R vector (matrix/array).
+
+    Args:
+        vector (rpy2.robjects.vectors.Vector): R vector, matrix or array.
+
+    Returns:
+        list[list[str] | None]: Names of each dimension (None if a dimension has no
+            names). For vectors without dimensions, the vector names are used.
+    """
+    dims = _r_dims(vector)
+
+    # Vectors: use names
+    if dims is None:
+        try:
+            return [list(vector.do_slot("names"))]
+
+        except LookupError:
+            return [None]
+
+    # Matrices and arrays: use dimnames
+    try:
+        dimnames = vector.do_slot("dimnames")
+
+    except LookupError:
+        return [None] * len(dims)
+
+    return [None if isinstance(names, NULLType) else list(names) for names in dimnames]
+
+
+#
+# NumPy to R conversions
+#
+def _fits_r_integer(values: np.ndarray) -> bool:
+    """Check if integer values can be stored in an R integer vector."""
+    if values.size == 0:
+        return True
+
+    return values.min() > R_NA_INTEGER and values.max() <= np.iinfo(np.int32).max
+
+
+def numpy_to_r(values: np.ndarray, missing: np.ndarray | None = None) -> Vector:
+    """Convert a NumPy array to an R vector (or matrix).
+
+    Boolean, integer, float and date (``datetime64``) values are copied in bulk to
+    R memory, without iterating over the elements. Arrays with more than one
+    dimension are converted to R matrices/arrays.
+
+    Args:
+        values (np.ndarray): NumPy array.
+
+        missing (np.ndarray | None, optional): Mask of missing values (e.g., of
+            pandas nullable types), converted to ``NA``. Defaults to None.
+
+    Returns:
+        rpy2.robjects.vectors.Vector: R vector. Integers that don't fit in R
+            integers are converted to numeric (double) vectors, and dates are
+            converted to ``Date`` vectors (``NaT`` is converted to ``NA``).
+
+    Raises:
+        TypeError: If the array type is not supported (e.g., object arrays).
+    """
+    values = np.asarray(values)
+
+    # R vectors are stored in column-major order
+    flat_values = values.ravel(order="F")
+    kind = flat_values.dtype.kind
+
+    flat_missing = None
+
+    if missing is not None and np.any(missing):
+        flat_missing = np.asarray(missing, dtype=bool).ravel(order="F")
+
+    if kind in "biu" and (kind == "b" or _fits_r_integer(flat_values)):
+        flat_values = np.array(flat_values, dtype=np.int32)
+
+        if flat_missing is not None:
+            flat_values[flat_missing] = R_NA_INTEGER
+
+        vector = (
+            BoolVector(BoolSexpVector.from_memoryview(memoryview(flat_values)))
+            if kind == "b"
+            else IntVector(IntSexpVector.from_memoryview(memoryview(flat_values)))
+        )
+
+    elif kind in "iuf":
+        flat_values = np.array(flat_values, dtype=np.float64)
+
+        if flat_missing is not None:
+            flat_values[flat_missing] = np.nan
+
+        vector = FloatVector(FloatSexpVector.from_memoryview(memoryview(flat_values)))
+
+    elif kind == "M":
+        days = flat_values.astype("datetime64[D]")
+
+        flat_values = np.where(
+            np.isnat(days), np.nan, (days - R_EPOCH).astype(np.float64)
+        )
+
+        if flat_missing is not None:
+            flat_values[flat_missing] = np.nan
+
+        vector = FloatVector(FloatSexpVector.from_memoryview(memoryview(flat_values)))
+        vector.rclass = StrVector(["Date"])
+
+    elif kind in "US":
+        flat_values = flat_values.astype(str).astype(object)
+
+        if flat_missing is not None:
+            flat_values[flat_missing] = NA_Character
+
+        vector = StrVector(flat_values.tolist())
+
+    else:
+        raise TypeError(f"Cannot convert array of type {values.dtype} to R format")
+
+    # Restore dimensions
+    if values.ndim > 1:
+        vector.do_slot_assign("dim", IntVector(list(values.shape)))
+
+    return vector
+
+
+def categorical_to_r(values: PandasCategorical) -> Vector:
+    """Convert a pandas Categorical to an R factor.
+
+    Args:
+        values (pandas.Categorical): Categorical values.
+
+    Returns:
+        rpy2.robjects.vectors.Vector: R factor (``ordered`` if the categorical is
+            ordered). Missing values are converted to ``NA``.
+    """
+    # Factor codes are 1-based (``NA`` for missing values)
+    codes = np.where(values.codes < 0, R_NA_INTEGER, values.codes + 1)
+    codes = np.ascontiguousarray(codes, dtype=np.int32)
+
+    vector = IntVector(IntSexpVector.from_memoryview(memoryview(codes)))
+
+    vector.do_slot_assign("levels", StrVector(values.categories.astype(str).tolist()))
+    vector.rclass = StrVector(["ordered", "factor"] if values.ordered else ["factor"])
+
+    return vector
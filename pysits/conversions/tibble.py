@@ -18,21 +18,169 @@
 """tibble conversions."""
 
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
+import numpy as np
+import pyarrow as pa
+import shapely
 from geopandas import GeoDataFrame as GeoPandasDataFrame
+from geopandas import GeoSeries
 from pandas import DataFrame as PandasDataFrame
 from pandas import to_datetime as pandas_to_datetime
 from rpy2 import robjects
+from rpy2.rinterface import ByteSexpVector, IntSexpVector
+from rpy2.rinterface_lib.sexp import NULLType
 from rpy2.robjects import StrVector, pandas2ri
 from rpy2.robjects.conversion import localconverter
 from rpy2.robjects.vectors import DataFrame as RDataFrame
-from shapely import wkt
+from rpy2.robjects.vectors import ListVector
 
 from pysits.backend.functions import r_fnc_class
-from pysits.backend.pkgs import r_pkg_base, r_pkg_sf
+from pysits.backend.pkgs import r_pkg_sf
+from pysits.backend.registry import r_helpers
+from pysits.conversions.arrow import arrow_to_tibble
+from pysits.conversions.numpy import R_NA_INTEGER, r_vector_to_numpy
 from pysits.models.frame import SITSFrameArray
 
+#
+# R helpers
+#
+r_helpers.register(
+    "sf_to_wkb",
+    """
+    function(data) {
+        wkb <- sf::st_as_binary(sf::st_geometry(data))
+
+        list(
+            wkb = as.raw(unlist(wkb, use.names = FALSE)),
+            sizes = lengths(wkb)
+        )
+    }
+    """,
+)
+
+r_helpers.register(
+    "wkb_to_sf",
+    """
+    function(data, wkb, sizes, geometry_column, crs) {
+        # Missing geometries have no WKB buffer (`NA` size). sf stores them as
+        # empty geometries.
+        missing <- is.na(sizes)
+        sizes[missing] <- 0L
+
+        rows <- factor(rep.int(seq_along(sizes), sizes), levels = seq_along(sizes))
+        wkb <- structure(unname(split(wkb, rows)), class = "WKB")
+
+        geometry <- vector("list", length(sizes))
+        if (any(!missing)) {
+            geometry[!missing] <- unclass(sf::st_as_sfc(wkb[!missing]))
+        }
+
+        if (ncol(data) == 0) {
+            data <- data.frame(row.names = seq_along(sizes))
+        }
+
+        data[[geometry_column]] <- sf::st_sfc(geometry, crs = sf::st_crs(crs))
+
+        sf::st_as_sf(data, sf_column_name = geometry_column)
+    }
+    """,
+)
+
+r_helpers.register(
+    "tibble_unnest_column",
+    """
+    function(column) {
+        if (length(column) == 0 || !all(vapply(column, is.data.frame, TRUE))) {
+            return(NULL)
+        }
+
+        column_classes <- function(x) {
+            stats::setNames(vapply(x, function(y) class(y)[[1]], ""), names(x))
+        }
+
+        classes <- lapply(column, column_classes)
+
+        if (!all(vapply(classes, identical, TRUE, classes[[1]])) ||
+            "list" %in% classes[[1]]) {
+            return(NULL)
+        }
+
+        list(
+            data = as.data.frame(dplyr::bind_rows(unname(column))),
+            sizes = vapply(column, nrow, integer(1), USE.NAMES = FALSE)
+        )
+    }
+    """,
+)
+
+r_helpers.register(
+    "tibble_schema",
+    """
+    function(data) {
+        column_class <- function(column) class(column)[[1]]
+
+        element_class <- function(column) {
+            if (length(column) == 0) {
+                return(NA_character_)
+            }
+
+            class(column[[1]])[[1]]
+        }
+
+        types <- vapply(data, column_class, character(1), USE.NAMES = FALSE)
+        elements <- vapply(data, element_class, character(1), USE.NAMES = FALSE)
+
+        valid <- is.na(elements) | !elements %in% c("function", "NULL")
+
+        stats::setNames(types[valid], names(data)[valid])
+    }
+    """,
+)
+
+r_helpers.register(
+    "tibble_slice",
+    """
+    function(data, rows) {
+        result <- vctrs::vec_slice(data, rows)
+        class(result) <- class(data)
+
+        result
+    }
+    """,
+)
+
+r_helpers.register(
+    "tibble_update_columns",
+    """
+    function(data, values, rows, removed) {
+        classes <- class(data)
+
+        for (column in removed) {
+            data[[column]] <- NULL
+        }
+
+        for (column in names(values)) {
+            column_values <- values[[column]][[column]]
+            column_rows <- rows[[column]]
+
+            if (is.null(column_rows)) {
+                data[[column]] <- column_values
+            } else {
+                current_values <- data[[column]]
+                current_values[column_rows] <- column_values
+
+                data[[column]] <- current_values
+            }
+        }
+
+        class(data) <- classes
+
+        data
+    }
+    """,
+)
+
 
 #
 # Auxiliary functions
@@ -56,23 +204,193 @@ def _column_to_datetime(data: PandasDataFrame, colname: str) -> PandasDataFrame:
     return data
 
 
-def _sf_to_shapely(sf_object: RDataFrame) -> list:
+def _pandas_to_arrow_table(data: PandasDataFrame) -> pa.Table | None:
+    """Convert a plain (non-nested) pandas DataFrame to a pyarrow Table.
+
+    Args:
+        data (pandas.DataFrame): Pandas Data Frame.
+
+    Returns:
+        pyarrow.Table | None: Data frame as an Arrow table. Returns ``None`` if
+            the data frame has columns without a flat Arrow representation (e.g.,
+            nested data frames, lists or mixed-type objects).
+    """
+    if any(dtype.name == "sits" for dtype in data.dtypes):
+        return None
+
+    try:
+        table = pa.Table.from_pandas(data, preserve_index=False)
+
+    except pa.ArrowException:
+        return None
+
+    if any(pa.types.is_nested(field.type) for field in table.schema):
+        return None
+
+    return table
+
+
+def _wkb_to_shapely(wkb: memoryview, sizes: np.ndarray) -> np.ndarray:
+    """Create Shapely geometries from concatenated WKB buffers.
+
+    Args:
+        wkb (memoryview): WKB buffers of all geometries, concatenated.
+
+        sizes (np.ndarray): Size of the WKB buffer of each geometry (missing
+            geometries have a missing size, ``NA`` in R).
+
+    Returns:
+        np.ndarray: Array of Shapely geometries (``None`` for missing geometries).
+    """
+    missing = sizes == R_NA_INTEGER
+    offsets = np.concatenate([[0], np.cumsum(np.where(missing, 0, sizes))])
+
+    # Use an Arrow binary array to split the buffers without copying them
+    validity = pa.array(~missing).buffers()[1] if missing.any() else None
+    wkb_array = pa.LargeBinaryArray.from_buffers(
+        pa.large_binary(),
+        len(sizes),
+        [validity, pa.py_buffer(offsets.astype(np.int64)), pa.py_buffer(wkb)],
+    )
+
+    return shapely.from_wkb(wkb_array.to_numpy(zero_copy_only=False))
+
+
+def _shapely_to_wkb(geometries: GeoSeries) -> tuple[memoryview, np.ndarray]:
+    """Encode Shapely geometries as concatenated WKB buffers.
+
+    Args:
+        geometries (geopandas.GeoSeries): Geometries.
+
+    Returns:
+        tuple[memoryview, np.ndarray]: WKB buffers of all geometries, concatenated,
+            and the size of the WKB buffer of each geometry (missing geometries
+            have no buffer and a missing size, ``NA`` in R).
+    """
+    wkb_array = pa.array(
+        shapely.to_wkb(np.asarray(geometries.values), flavor="iso"),
+        type=pa.large_binary(),
+    )
+
+    # Extract buffers (values and offsets). Arrays without values (e.g., no rows or
+    # only missing geometries) may not have a data buffer.
+    _, offsets, wkb = wkb_array.buffers()
+
+    offsets = np.frombuffer(offsets, dtype=np.int64)[: len(wkb_array) + 1]
+    sizes = np.diff(offsets).astype(np.int32)
+    sizes[wkb_array.is_null().to_numpy(zero_copy_only=False)] = R_NA_INTEGER
+
+    if wkb is None:
+        return memoryview(b""), sizes
+
+    return memoryview(wkb)[offsets[0] : offsets[-1]], sizes
+
+
+def _sf_to_shapely(sf_object: RDataFrame) -> np.ndarray:
     """Transform a columns from R to a valid geometry column in Python.
 
     Args:
         sf_object (rpy2.robjects.vectors.ListVector): R (tibble/data.frame) Data frame.
 
     Returns:
-        list: List of Shapely geometries.
+        np.ndarray: Array of Shapely geometries.
+    """
+    # Extract geometry as WKB in R (all geometries in a single raw vector)
+    geom_wkb = r_helpers["sf_to_wkb"](sf_object)
+
+    sizes = np.asarray(geom_wkb.rx2("sizes").memoryview(), dtype=np.int32)
+
+    # Convert WKB buffers (shared with R) to Shapely geometries
+    return _wkb_to_shapely(geom_wkb.rx2("wkb").memoryview(), sizes)
+
+
+def _shapely_to_sf(data: RDataFrame, geometries: GeoSeries, crs: str) -> RDataFrame:
+    """Add a geometry column from Python to an R data frame, as an sf object.
+
+    Args:
+        data (rpy2.robjects.vectors.DataFrame): R (tibble/data.frame) Data frame.
+
+        geometries (geopandas.GeoSeries): Geometries of each row of ``data``.
+
+        crs (str): Coordinate reference system (as WKT).
+
+    Returns:
+        rpy2.robjects.vectors.DataFrame: sf object.
+    """
+    # Build geometries from WKB in R (all geometries in a single raw vector)
+    geom_wkb, sizes = _shapely_to_wkb(geometries)
+
+    return r_helpers["wkb_to_sf"](
+        data,
+        ByteSexpVector.from_memoryview(geom_wkb),
+        IntSexpVector.from_memoryview(memoryview(sizes)),
+        StrVector([geometries.name]),
+        StrVector([crs]),
+    )
+
+
+def _unnest_column(column: ListVector) -> tuple[RDataFrame, np.ndarray] | None:
+    """Bind the data frames of a list-column into a single long table, in R.
+
+    Args:
+        column (rpy2.robjects.vectors.ListVector): List-column of a tibble.
+
+    Returns:
+        tuple[rpy2.robjects.vectors.DataFrame, np.ndarray] | None: Long table and
+            number of rows of each element. Returns ``None`` if the elements are
+            not data frames with the same columns (and column types), or if they
+            have list-columns.
+    """
+    long_table = r_helpers["tibble_unnest_column"](column)
+
+    if isinstance(long_table, NULLType):
+        return None
+
+    return long_table.rx2("data"), r_vector_to_numpy(long_table.rx2("sizes"))
+
+
+def _long_table_to_array(
+    data: RDataFrame,
+    sizes: np.ndarray,
+    nested_processor: Callable[[PandasDataFrame], PandasDataFrame] | None = None,
+) -> SITSFrameArray:
+    """Convert a long table to a SITS Frame array (one data frame per row).
+
+    The columns of the long table are used as the flat buffers of the array, so
+    the data frames of each row are not created.
+
+    Args:
+        data (rpy2.robjects.vectors.DataFrame): Long table (see ``_unnest_column``).
+
+        sizes (np.ndarray): Number of rows of each data frame.
+
+        nested_processor (Callable | None, optional): Function to process the
+            converted table (applied once, before splitting). Defaults to None.
+
+    Returns:
+        SITSFrameArray: Data frames of each row.
     """
-    # Extract geometry and convert to WKT in R directly
-    geom_wkt = r_pkg_sf.st_as_text(r_pkg_sf.st_geometry(sf_object))
+    data = pandas2ri.rpy2py(data)
+
+    if nested_processor:
+        data = nested_processor(data)
 
-    # Convert R character vector to Python list of strings
-    geom_wkt_py = list(geom_wkt)
+    offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
 
-    # Convert each WKT string to a Shapely geometry
-    return [wkt.loads(g) for g in geom_wkt_py]
+    try:
+        return SITSFrameArray.from_ragged(
+            {name: data[name] for name in data.columns}, offsets
+        )
+
+    # Columns that can not be represented as Arrow (e.g., mixed objects)
+    except (pa.ArrowException, TypeError):
+        return SITSFrameArray(
+            [
+                data.iloc[start:end].reset_index(drop=True)
+                for start, end in zip(offsets[:-1], offsets[1:], strict=True)
+            ]
+        )
 
 
 #
@@ -133,21 +451,8 @@ def _tibble_to_pandas(
     # Convert columns definitions
     nested_columns = nested_columns if nested_columns else []
 
-    # Extract columns from the data
-    data_columns = r_pkg_base.colnames(data)
-
-    # Remove invalid columns
-    data_columns_valid = []
-
-    for data_column in data_columns:
-        col = data.rx2(data_column)
-
-        # Remove invalid columns
-        if r_fnc_class(col[0])[0] not in ["function", "NULL"]:
-            data_columns_valid.append(data_column)
-
-    # Replace old data columns with the filtered one
-    data_columns = data_columns_valid
+    # Extract valid columns from the data (without functions and NULL values)
+    data_columns = list(tibble_schema(data))
 
     # If user define nested columns, verify if they are available.
     if nested_columns:
@@ -168,7 +473,16 @@ def _tibble_to_pandas(
         # Select nested column (using ``[[]]``)
         nested_column_data = data.rx2(nested_column)
 
-        # As it is a nested column, handle it as a list of ``tibble/data.frame``
+        # Convert data frames of all rows at once, if possible
+        nested_column_long = _unnest_column(nested_column_data)
+
+        if nested_column_long is not None:
+            rdf_data[nested_column] = _long_table_to_array(
+                *nested_column_long, nested_processor
+            )
+            continue
+
+        # Otherwise, handle it as a list of ``tibble/data.frame`` (or vectors)
         nested_column_processed = []
 
         for nested_row in nested_column_data:
@@ -190,7 +504,7 @@ def _tibble_to_pandas(
         rdf_data = table_processor(rdf_data)
 
     # Transform dataframe to geodataframe
-    if shapely_geometries:
+    if shapely_geometries is not None:
         rdf_data = GeoPandasDataFrame(
             rdf_data, geometry=shapely_geometries, crs=shapely_crs
         )
@@ -375,15 +689,97 @@ def tibble_cube_to_pandas(data: RDataFrame) -> PandasDataFrame:
     )
 
 
+#
+# Tibble operations
+#
+def tibble_schema(data: RDataFrame) -> dict[str, str]:
+    """Get the valid columns of a tibble and their types, in a single R call.
+
+    Columns whose values are functions or NULL are not valid and are ignored.
+
+    Args:
+        data (rpy2.robjects.vectors.DataFrame): R (tibble/data.frame) Data frame.
+
+    Returns:
+        dict[str, str]: Valid column names and their (R) classes (e.g., ``numeric``,
+            ``Date`` or ``list``), in the order of the data frame.
+    """
+    schema = r_helpers["tibble_schema"](data)
+
+    return dict(zip(schema.names or [], schema))
+
+
+def tibble_slice(data: RDataFrame, positions: Sequence[int]) -> RDataFrame:
+    """Select rows of a tibble, keeping its classes and attributes.
+
+    Args:
+        data (rpy2.robjects.vectors.DataFrame): R (tibble/data.frame) Data frame.
+
+        positions (Sequence[int]): Positions (0-based) of the rows to select.
+
+    Returns:
+        rpy2.robjects.vectors.DataFrame: Data frame with the selected rows.
+    """
+    # Positions in R are 1-based
+    rows = (np.asarray(positions, dtype=np.int64) + 1).tolist()
+
+    return r_helpers["tibble_slice"](data, robjects.IntVector(rows))
+
+
+def tibble_update_columns(
+    data: RDataFrame,
+    values: dict[str, RDataFrame],
+    rows: dict[str, Sequence[int] | None] | None = None,
+    removed: Sequence[str] = (),
+) -> RDataFrame:
+    """Update columns of a tibble, keeping its classes and attributes.
+
+    Args:
+        data (rpy2.robjects.vectors.DataFrame): R (tibble/data.frame) Data frame.
+
+        values (dict[str, rpy2.robjects.vectors.DataFrame]): New values of each
+            column, as a data frame containing the column.
+
+        rows (dict[str, Sequence[int] | None] | None, optional): Positions (0-based)
+            of the rows updated in each column. If a column is not available (or is
+            None), all rows of the column are replaced. Defaults to None.
+
+        removed (Sequence[str], optional): Columns to remove. Defaults to ().
+
+    Returns:
+        rpy2.robjects.vectors.DataFrame: Data frame with the updated columns.
+    """
+    # Positions in R are 1-based (NULL to replace all rows)
+    rows = rows or {}
+    rows_r = {}
+
+    for column in values:
+        column_rows = rows.get(column)
+
+        if column_rows is None:
+            rows_r[column] = robjects.NULL
+
+        else:
+            column_rows = np.asarray(column_rows, dtype=np.int64) + 1
+            rows_r[column] = robjects.IntVector(column_rows.tolist())
+
+    return r_helpers["tibble_update_columns"](
+        data,
+        robjects.ListVector(values),
+        robjects.ListVector(rows_r),
+        StrVector(list(removed)),
+    )
+
+
 #
 # Pandas to R conversions
 #
 def pandas_to_tibble(data: PandasDataFrame) -> RDataFrame:
     """Convert a pandas DataFrame to an R DataFrame object.
 
-    This function converts a pandas DataFrame to an R DataFrame using
-    rpy2's conversion infrastructure. It handles the conversion context
-    to ensure proper type mapping between Python and R objects.
+    Plain data frames (i.e., without nested columns) are moved to R in a columnar
+    format, using Arrow (see ``pysits.settings.ARROW_TRANSPORT``). Other data
+    frames are converted using rpy2's conversion infrastructure.
 
     Args:
         data (pandas.DataFrame): The pandas DataFrame to convert to R.
@@ -396,7 +792,15 @@ def pandas_to_tibble(data: PandasDataFrame) -> RDataFrame:
         - Handles both DataFrame and non-DataFrame inputs
         - Preserves column names and data types where possible
         - For non-DataFrame inputs, falls back to rpy2's default converter
+        - Data frames moved using Arrow don't keep the pandas index as row names
     """
+    # Plain data frames are moved to R using Arrow
+    if isinstance(data, PandasDataFrame):
+        table = _pandas_to_arrow_table(data)
+
+        if table is not None:
+            return arrow_to_tibble(table)
+
     with localconverter(robjects.default_converter + pandas2ri.converter):
         return robjects.conversion.py2rpy(data)
 
@@ -421,24 +825,13 @@ def geopandas_to_tibble(data: GeoPandasDataFrame) -> RDataFrame:
             f"Warning: Dropping columns with embedded DataFrames: {dropped_columns}"
         )
 
-    # Keep only safe columns
-    data_safe = data[safe_columns].copy()
+    # Keep only safe columns (geometries are converted separately)
+    geom_col = data.geometry.name
 
-    # If GeoDataFrame, convert geometry to WKT and include geometry column
-    if isinstance(data, GeoPandasDataFrame):
-        geom_col = data.geometry.name
-        data_safe[geom_col] = data.geometry.to_wkt()
+    data_safe = PandasDataFrame(data[safe_columns]).drop(columns=[geom_col])
 
     # Convert to R DataFrame
-    with localconverter(robjects.default_converter + pandas2ri.converter):
-        r_df = robjects.conversion.py2rpy(data_safe)
-
-    # If GeoDataFrame, convert to sf
-    if isinstance(data, GeoPandasDataFrame):
-        r_df = r_pkg_sf.st_as_sf(
-            r_df,
-            wkt=robjects.StrVector([geom_col]),
-            crs=robjects.StrVector([data.crs.to_wkt()]),
-        )
+    r_df = pandas_to_tibble(data_safe)
 
-    return r_df
+    # Convert to sf
+    return _shapely_to_sf(r_df, data.geometry, data.crs.to_wkt())
@@ -17,88 +17,207 @@
 
 """Arrow conversions."""
 
-import os
-import tempfile
 from collections.abc import Callable
 
+import numpy as np
 from pandas import DataFrame as PandasDataFrame
+from pandas import Series as PandasSeries
+from pandas import isna as pandas_isna
+from pandas.api.types import is_scalar
 from pandas.core.generic import NDFrame as PandasNDFrame
-from pyarrow import feather
+from pyarrow import ChunkedArray
+from pyarrow import Table as ArrowTable
+from pyarrow.types import is_list, is_struct
 from rpy2.rinterface_lib.sexp import NULLType
-from rpy2.robjects import StrVector, pandas2ri
-from rpy2.robjects import globalenv as rpy2_globalenv
-from rpy2.robjects import r as rpy2_r_interface
+from rpy2.robjects import IntVector, ListVector, NA_Integer, StrVector, pandas2ri
 from rpy2.robjects.vectors import DataFrame as RDataFrame
 
-from pysits.backend.functions import r_fnc_class, r_fnc_set_column
-from pysits.backend.pkgs import r_pkg_arrow, r_pkg_base, r_pkg_sits
+from pysits.backend.functions import r_fnc_set_column
+from pysits.backend.pkgs import r_pkg_sits
+from pysits.backend.registry import r_helpers
+from pysits.conversions.arrow import arrow_to_tibble, tibble_to_arrow
+from pysits.conversions.tibble import tibble_schema
+from pysits.models.frame import SITSFrameArray
+
+#
+# Nested columns
+#
+SITS_NESTED_COLUMNS = ["time_series", "base_data", "predicted"]
+"""Nested columns of sits tibbles."""
+
+CUBE_NESTED_COLUMNS = ["labels", "file_info", "vector_info"]
+"""Nested columns of cube tibbles (Python to R)."""
+
+
+#
+# R helpers
+#
+r_helpers.register(
+    "load_arrow_table",
+    """
+    function(table, nested_cols, nested_data, nested_sizes, column_names) {
+        table <- tibble::as_tibble(table)
+
+        # Split flat tables into list-columns
+        for (col in names(nested_data)) {
+            sizes <- nested_sizes[[col]]
+            missing <- is.na(sizes)
+            sizes[missing] <- 0L
+
+            values <- vctrs::vec_chop(
+                tibble::as_tibble(nested_data[[col]]),
+                sizes = sizes
+            )
+            values[missing] <- list(NULL)
+
+            table[[col]] <- values
+        }
+
+        # Handle arrow_list class (named vectors encoded as JSON)
+        for (col in intersect(nested_cols, colnames(table))) {
+            values <- table[[col]]
+
+            if (!inherits(values, "arrow_list")) {
+                next
+            }
+
+            values_parsed <- lapply(values, function(v) {
+                if (is.null(v)) return(NULL)
+                # Try to parse as JSON
+                tryCatch({
+                    parsed <- jsonlite::fromJSON(v)
+                    setNames(as.character(parsed), names(parsed))
+                }, error = function(e) {
+                    # If JSON parsing fails, return NULL
+                    NULL
+                })
+            })
+
+            # Only replace values if all of them were parsed
+            if (!any(vapply(values_parsed, is.null, logical(1)))) {
+                table[[col]] <- values_parsed
+            }
+        }
+
+        table[column_names]
+    }
+    """,
+)
+
+r_helpers.register(
+    "named_vector_to_json",
+    """
+    function(x, colname) {
+        vec_list <- lapply(x[[colname]], function(v) {
+            if (is.null(names(v))) return(NULL)
+            class(v) <- NULL
+            json <- jsonlite::toJSON(
+                as.list(stats::setNames(as.character(v), names(v))),
+                auto_unbox = TRUE
+            )
+            class(json) <- NULL
+            json
+        })
+        x[[colname]] <- vec_list
+        x
+    }
+    """,
+)
 
 
 #
 # Helper functions
 #
-def _load_arrow_table_reader_function() -> Callable[[str, list[str]], RDataFrame]:
+def _load_arrow_table_reader_function() -> Callable[
+    [RDataFrame, StrVector, ListVector, ListVector, StrVector], RDataFrame
+]:
     """Load and return an R function for reading Arrow tables with nested columns.
 
-    This function defines and returns an R function that reads a Feather file and
-    handles nested columns by unnesting them appropriately. The returned function
-    takes a file path and a list of nested column names as arguments.
+    This function defines and returns an R function that rebuilds nested columns
+    of a table loaded from Arrow. Data frame columns are received as one flat
+    (long) table per column, together with the number of rows of each cell, and
+    are split into list-columns in a single vectorized step. Columns with named
+    vectors (encoded as JSON) are decoded column-wise.
 
     Returns:
-        Callable[[str, list[str]], RDataFrame]: An R function that takes a file path
-            and list of nested column names as input and returns an R DataFrame with
-            properly unnested columns.
+        Callable[[RDataFrame, StrVector, ListVector, ListVector, StrVector],
+            RDataFrame]: An R function that takes a table, the list of nested
+            column names, the flat tables of each data frame column, the sizes of
+            each cell (``NA`` for missing cells) and the column order, and returns
+            an R DataFrame with properly nested columns.
     """
-    rpy2_r_interface("""
-        load_arrow_table <- function(path, nested_cols) {
-            table <- arrow::read_feather(path)
-
-            purrr::map_dfr(seq_len(nrow(table)), function(idx) {
-                row_data <- table[idx,]
-
-                for (col in nested_cols) {
-                    row_nested <- row_data[[col]]
-                    
-                    # Handle arrow_list class
-                    if (inherits(row_nested, "arrow_list")) {
-                        row_nested <- lapply(row_nested, function(v) {
-                            if (is.null(v)) return(NULL)
-                            # Try to parse as JSON first
-                            tryCatch({
-                                parsed <- jsonlite::fromJSON(v)
-                                setNames(as.character(parsed), names(parsed))
-                            }, error = function(e) {
-                                # If JSON parsing fails, return NULL
-                                NULL
-                            })
-                        })
-                        # If any values in row_nested are NULL, set the whole 
-                        # thing to NULL
-                        if (any(sapply(row_nested, is.null))) {
-                            row_nested <- NULL
-                        }
-                    } else {
-                        row_nested <- list(tidyr::unnest(
-                            row_nested, 
-                            cols = dplyr::everything()     
-                        ))
-                    }
-                    
-                    # Only create tibble if row_nested is not NULL
-                    if (!is.null(row_nested)) {
-                        row_data[[col]] <- NULL
-                        row_data <- tibble::tibble(
-                            row_data, 
-                            !!col := row_nested
-                        )
-                    }
-                }
-                row_data
-            })
-        }
-    """)
+    return r_helpers["load_arrow_table"]
+
+
+def _flatten_nested_column(
+    column: PandasSeries,
+) -> tuple[ArrowTable, IntVector] | None:
+    """Flatten a column of data frames into a single long table.
+
+    Args:
+        column (PandasSeries): Column where each cell is a data frame (or missing).
+
+    Returns:
+        tuple[ArrowTable, IntVector] | None: Long table, with the rows of all cells,
+            and the number of rows of each cell (``NA`` for missing cells). If the
+            column does not contain data frames, returns None.
+    """
+    array = column.array
+
+    # Columns of data frames created by pysits are already SITS Frame arrays
+    if not isinstance(array, SITSFrameArray):
+        cells_missing = [
+            not isinstance(cell, PandasNDFrame)
+            and is_scalar(cell)
+            and pandas_isna(cell)
+            for cell in column
+        ]
+
+        # Check if column contains data frames
+        if all(cells_missing) or not all(
+            missing or isinstance(cell, PandasNDFrame)
+            for cell, missing in zip(column, cells_missing, strict=True)
+        ):
+            return None
+
+        array = SITSFrameArray(
+            [
+                None if missing else cell
+                for cell, missing in zip(column, cells_missing, strict=True)
+            ]
+        )
+
+    # Get ragged representation
+    values, offsets, missing = array.to_ragged()
+
+    # Define cell sizes
+    sizes = IntVector(
+        [
+            NA_Integer if cell_missing else int(cell_size)
+            for cell_size, cell_missing in zip(np.diff(offsets), missing, strict=True)
+        ]
+    )
 
-    return rpy2_globalenv["load_arrow_table"]
+    return ArrowTable.from_arrays(list(values.values()), names=list(values)), sizes
+
+
+def _nested_column_to_frame_array(column: ChunkedArray) -> SITSFrameArray | None:
+    """Convert an Arrow column of nested tables to a SITS Frame array.
+
+    The column is kept as Arrow, so data frames are only created when a single
+    element is accessed.
+
+    Args:
+        column (ChunkedArray): Arrow column where each cell is a list of structs.
+
+    Returns:
+        SITSFrameArray | None: SITS Frame array. If the column does not contain
+            nested tables, returns None.
+    """
+    if not (is_list(column.type) and is_struct(column.type.value_type)):
+        return None
+
+    return SITSFrameArray(column)
 
 
 def _named_vector_to_json(x: RDataFrame, colname: str) -> RDataFrame:
@@ -112,24 +231,7 @@ def _named_vector_to_json(x: RDataFrame, colname: str) -> RDataFrame:
     Returns:
         RDataFrame: DataFrame with named vectors converted to JSON strings
     """
-    # Define R code to convert named vector to JSON
-    rpy2_r_interface(f"""
-        named_vector_to_json <- function(x) {{
-            vec_list <- lapply(x${colname}, function(v) {{
-                if (is.null(names(v))) return(NULL)
-                class(v) <- NULL
-                json <- jsonlite::toJSON(as.list(setNames(as.character(v), names(v))), 
-                                       auto_unbox=TRUE)
-                class(json) <- NULL
-                json
-            }})
-            x${colname} <- vec_list
-            x
-        }}
-    """)
-
-    # Call the R function and return result
-    return rpy2_globalenv["named_vector_to_json"](x)
+    return r_helpers["named_vector_to_json"](x, StrVector([colname]))
 
 
 def _tibble_to_pandas_arrow(
@@ -140,11 +242,10 @@ def _tibble_to_pandas_arrow(
     """Convert an R DataFrame (tibble) to a Pandas DataFrame using Arrow format.
 
     This function handles the conversion of R DataFrames to Pandas DataFrames by:
-    1. Creating a temporary Feather file
-    2. Filtering out invalid columns (functions and NULL values)
-    3. Writing valid columns to Feather format
-    4. Reading back into Pandas
-    5. Converting any nested columns to Pandas DataFrames
+    1. Filtering out invalid columns (functions and NULL values)
+    2. Moving valid columns to Arrow (see ``pysits.settings.ARROW_TRANSPORT``)
+    3. Converting nested columns to SITS Frame arrays (backed by Arrow)
+    4. Converting the remaining columns to Pandas
 
     Args:
         instance (RDataFrame): The R DataFrame (tibble) to convert.
@@ -155,54 +256,50 @@ def _tibble_to_pandas_arrow(
     Returns:
         PandasDataFrame: The converted Pandas DataFrame.
     """
-    # Create a temporary file
-    tmp = tempfile.NamedTemporaryFile(suffix=".feather", delete=False)
-    tmp_path = tmp.name
-    tmp.close()
-
     # Check if instance is a empty
     if instance.nrow == 0:
         return pandas2ri.rpy2py(instance)
 
-    # Extract columns from the data
-    data_columns = r_pkg_base.colnames(instance)
-
-    # Remove invalid columns
-    data_columns_valid = []
-
-    for data_column in data_columns:
-        col = instance.rx2(data_column)
+    # Extract valid columns from the data (without functions and NULL values)
+    schema = tibble_schema(instance)
 
-        # Remove invalid columns
-        if r_fnc_class(col[0])[0] not in ["function", "NULL"]:
-            data_columns_valid.append(data_column)
-
-    # Select regular columns (using ``[]``) and convert to Pandas
-    rdf_data = instance.rx(StrVector(data_columns_valid))
+    # Select valid columns (using ``[]``)
+    rdf_data = instance.rx(StrVector(list(schema)))
 
     # Process table
     if table_processor:
         rdf_data = table_processor(rdf_data)
 
-    # Write to Feather format
-    r_pkg_arrow.write_feather(rdf_data, tmp_path)
+    # Move data to Arrow
+    table = tibble_to_arrow(rdf_data)
+
+    # Convert nested columns to SITS Frame arrays
+    nested_arrays = {}
+
+    for nested_column in nested_columns or []:
+        if schema.get(nested_column) == "list" and nested_column in table.column_names:
+            nested_arrays[nested_column] = _nested_column_to_frame_array(
+                table.column(nested_column)
+            )
 
-    # Read from Feather format
-    df = feather.read_feather(tmp_path)
+    # Convert regular columns to Pandas
+    df = table.drop_columns(
+        [k for k, v in nested_arrays.items() if v is not None]
+    ).to_pandas()
 
-    # Convert nested columns to Pandas DataFrame
-    if nested_columns:
-        # Filter available columns
-        nested_columns = [col for col in nested_columns if col in df.columns]
+    # Add nested columns (keeping the original column order)
+    for nested_column in sorted(nested_arrays, key=table.column_names.index):
+        nested_array = nested_arrays[nested_column]
 
-        # Convert nested columns to Pandas DataFrame
-        for nested_column in nested_columns:
+        if nested_array is None:
             df[nested_column] = df[nested_column].apply(
                 lambda arr: PandasDataFrame.from_records(arr.tolist())
             )
 
-    # Remove temporary file
-    os.unlink(tmp_path)
+        else:
+            df.insert(
+                table.column_names.index(nested_column), nested_column, nested_array
+            )
 
     # Return value
     return df
@@ -214,10 +311,9 @@ def _pandas_to_tibble_arrow(
     """Convert a Pandas DataFrame to an R DataFrame (tibble) using Arrow format.
 
     This function handles the conversion of Pandas DataFrames to R DataFrames by:
-    1. Creating a temporary Feather file
-    2. Converting nested columns to a format suitable for R
-    3. Writing the data to Feather format
-    4. Reading back into R using a custom Arrow table reader
+    1. Flattening nested columns into long tables (one per column) and sizes
+    2. Moving the data to R through Arrow (see ``pysits.settings.ARROW_TRANSPORT``)
+    3. Splitting long tables into list-columns using a custom Arrow table reader
 
     Args:
         instance (PandasDataFrame): The Pandas DataFrame to convert.
@@ -228,35 +324,38 @@ def _pandas_to_tibble_arrow(
     Returns:
         RDataFrame: The converted R DataFrame (tibble).
     """
-    instance = instance.copy(deep=True)
-
-    tmp = tempfile.NamedTemporaryFile(suffix=".feather", delete=False)
-    tmp_path = tmp.name
-    tmp.close()
-
-    # Convert nested columns to R DataFrame
-    if nested_columns:
-        # Filter available columns
-        nested_columns = [col for col in nested_columns if col in instance.columns]
-
-        # Convert nested columns to R DataFrame
-        for nested_column in nested_columns:
-            instance[nested_column] = instance[nested_column].apply(
-                lambda arr: (
-                    arr.to_dict(orient="list")
-                    if isinstance(arr, PandasNDFrame)
-                    else arr
-                )
-            )
+    nested_columns = [col for col in nested_columns or [] if col in instance.columns]
+
+    # Flatten nested columns (data frames) into long tables
+    nested_data = {}
+    nested_sizes = {}
+
+    for nested_column in nested_columns:
+        nested_column_flat = _flatten_nested_column(instance[nested_column])
+
+        if nested_column_flat is not None:
+            nested_data[nested_column], nested_sizes[nested_column] = nested_column_flat
+
+    # Move data to R
+    data = arrow_to_tibble(
+        ArrowTable.from_pandas(
+            instance.drop(columns=list(nested_data)), preserve_index=False
+        )
+    )
 
-    # Write to Feather
-    feather.write_feather(instance, tmp_path)
+    nested_data = {k: arrow_to_tibble(v) for k, v in nested_data.items()}
 
     # Load Arrow table reader function
     load_arrow_table_fnc = _load_arrow_table_reader_function()
 
-    # Read from Feather and unnest columns
-    return load_arrow_table_fnc(tmp_path, nested_columns)
+    # Rebuild nested columns
+    return load_arrow_table_fnc(
+        data,
+        StrVector(nested_columns),
+        ListVector(nested_data),
+        ListVector(nested_sizes),
+        StrVector(list(instance.columns)),
+    )
 
 
 #
@@ -318,11 +417,8 @@ def tibble_sits_to_pandas_arrow(data: RDataFrame) -> PandasDataFrame:
         "count",
     ]
 
-    # Define nested columns
-    nested_columns = ["time_series", "base_data", "predicted"]
-
     # Convert to Pandas DataFrame
-    data_converted = tibble_nested_to_pandas_arrow(data, nested_columns)
+    data_converted = tibble_nested_to_pandas_arrow(data, SITS_NESTED_COLUMNS)
 
     # Select columns
     columns_available = [v for v in column_order if v in data_converted.columns]
@@ -337,9 +433,6 @@ def pandas_sits_to_tibble_arrow(data: PandasDataFrame) -> RDataFrame:
     Args:
         data (pandas.DataFrame): The pandas DataFrame to convert to R.
     """
-    # Define nested columns
-    nested_columns = ["time_series", "base_data", "predicted"]
-
     # Define data classes
     data_classes = ["sits", "tbl_df", "tbl", "data.frame"]
 
@@ -353,7 +446,7 @@ def pandas_sits_to_tibble_arrow(data: PandasDataFrame) -> RDataFrame:
         data_classes.append("som_clean_samples")
 
     # Convert to R DataFrame
-    data = pandas_to_tibble_arrow(data, nested_columns)
+    data = pandas_to_tibble_arrow(data, SITS_NESTED_COLUMNS)
 
     # Set class
     data.rclass = StrVector(data_classes)
@@ -446,9 +539,6 @@ def pandas_cube_to_tibble_arrow(data: PandasDataFrame) -> RDataFrame:
     Args:
         data (pandas.DataFrame): The pandas DataFrame to convert to R.
     """
-    # Define nested columns
-    nested_columns = ["labels", "file_info", "vector_info"]
-
     # Handle base_info separately if it exists
     base_info = None
 
@@ -460,7 +550,7 @@ def pandas_cube_to_tibble_arrow(data: PandasDataFrame) -> RDataFrame:
         data = data.drop(columns=["base_info"])
 
     # Convert to R DataFrame
-    data = pandas_to_tibble_arrow(data, nested_columns)
+    data = pandas_to_tibble_arrow(data, CUBE_NESTED_COLUMNS)
 
     # Add base_info back if it exists
     if base_info is not None:
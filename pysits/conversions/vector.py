@@ -27,10 +27,19 @@ from rpy2.robjects.vectors import Matrix, Vector
 from pysits.backend.functions import r_fnc_as_data_frame, r_fnc_colnames, r_fnc_rownames
 from pysits.backend.pkgs import r_pkg_base
 from pysits.conversions.common import convert_to_python
+from pysits.conversions.numpy import r_dimnames, r_vector_to_numpy
 
 
 def vector_to_pandas(vector: Vector) -> PandasDataFrame:
     """Convert a vector to a pandas dataframe."""
+    # Get values (numeric, integer and logical vectors are copied in bulk)
+    values = r_vector_to_numpy(vector)
+
+    if values is not None and values.dtype != object:
+        colnames = r_dimnames(vector)[0] or range(len(values))
+
+        return PandasDataFrame([values.astype(np.float64)], columns=list(colnames))
+
     # Get column names
     colnames = r_pkg_base.names(vector)
     colnames = convert_to_python(colnames, as_type="str")
@@ -56,9 +65,23 @@ def matrix_to_pandas(matrix: Matrix) -> PandasDataFrame:
         and column names. The data types are converted to appropriate Python types.
 
     Note:
-        The function attempts to unwrap single-element R vectors/lists to simplify
-        the data structure. If unwrapping fails, the original element is preserved.
+        Numeric, integer and logical matrices are copied in bulk. For other matrices
+        (e.g., list matrices), the function attempts to unwrap single-element R
+        vectors/lists to simplify the data structure. If unwrapping fails, the
+        original element is preserved.
     """
+    # Numeric, integer and logical matrices are copied in bulk
+    values = r_vector_to_numpy(matrix)
+
+    if values is not None and values.ndim == 2:  # noqa: PLR2004 - matrix
+        rownames, colnames = r_dimnames(matrix)
+
+        return PandasDataFrame(
+            values,
+            index=rownames or [str(i + 1) for i in range(values.shape[0])],
+            columns=colnames or [f"V{i + 1}" for i in range(values.shape[1])],
+        )
+
     # Convert R matrix to R data.frame for easier column access
     r_df: RDataFrame = r_fnc_as_data_frame(matrix)
 
@@ -118,8 +141,11 @@ def table_to_pandas(table) -> PandasDataFrame:
     # Get the dimension names (these are the categories for each dimension)
     dimnames = table.dimnames
 
-    # Convert table data to numpy array for easier manipulation
-    data = np.array(table)
+    # Convert table data to numpy array (in bulk, if possible)
+    data = r_vector_to_numpy(table)
+
+    if data is None:
+        data = np.array(table)
 
     if len(dims) == 1:
         # For 1D tables, create a single-column DataFrame
@@ -17,6 +17,7 @@
 
 """Docs decorators."""
 
+import functools
 import importlib.resources
 from collections.abc import Callable
 from typing import ParamSpec, TypeVar
@@ -29,6 +30,51 @@ P = ParamSpec("P")
 R = TypeVar("R")
 
 
+#
+# Documentation index
+#
+@functools.cache
+def _docs_index() -> frozenset[str]:
+    """Index of the markdown files available in ``pysits.docs.content``.
+
+    The content directory is listed only once, so functions without documentation
+    don't need to try opening their files.
+
+    Returns:
+        frozenset[str]: Names of the markdown files (without extension).
+    """
+    try:
+        content = importlib.resources.files("pysits.docs.content")
+
+    except ModuleNotFoundError:
+        return frozenset()
+
+    return frozenset(
+        item.name.removesuffix(".md")
+        for item in content.iterdir()
+        if item.name.endswith(".md")
+    )
+
+
+def load_doc(name: str) -> str:
+    """Load the documentation of a function from its markdown file.
+
+    Args:
+        name (str): The name of the markdown file (without extension).
+
+    Returns:
+        str: Documentation content (or a placeholder if it is not available).
+    """
+    if name not in _docs_index():
+        return f"(No documentation found for {name})"
+
+    return (
+        importlib.resources.files("pysits.docs.content")
+        .joinpath(f"{name}.md")
+        .read_text(encoding="utf-8")
+    )
+
+
 #
 # Decorators
 #
@@ -44,15 +90,7 @@ def attach_doc(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """
 
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
-        try:
-            with (
-                importlib.resources.files("pysits.docs.content")
-                .joinpath(f"{name}.md")
-                .open("r", encoding="utf-8") as f
-            ):
-                func.__doc__ = f.read()
-        except (FileNotFoundError, ModuleNotFoundError):
-            func.__doc__ = f"(No documentation found for {name})"
+        func.__doc__ = load_doc(name)
         return func
 
     return decorator
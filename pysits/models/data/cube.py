@@ -18,21 +18,24 @@
 """Cube models."""
 
 from pandas import DataFrame as PandasDataFrame
-from pandas import Series as PandasSeries
 from rpy2.robjects.vectors import DataFrame as RDataFrame
 
+from pysits import settings
 from pysits.backend.functions import r_fnc_set_column
+from pysits.conversions.cache import conversion_cache
 from pysits.conversions.tibble_arrow import (
+    CUBE_NESTED_COLUMNS,
     pandas_cube_to_tibble_arrow,
+    pandas_to_tibble_arrow,
     tibble_cube_to_pandas_arrow,
 )
-from pysits.models.data.frame import SITSFrame
+from pysits.models.data.frame import SITSFrame, SITSFrameItem
 
 
 #
 # Base class
 #
-class SITSCubeItemModel(PandasSeries):
+class SITSCubeItemModel(SITSFrameItem):
     """SITS Data Cube item model.
 
     Attributes:
@@ -45,9 +48,6 @@ class SITSCubeItemModel(PandasSeries):
     #
     # Attributes
     #
-    _instance: RDataFrame = None
-    """R DataFrame instance."""
-
     required_columns: list[str] = [
         "source",
         "collection",
@@ -63,35 +63,16 @@ class SITSCubeItemModel(PandasSeries):
     ]
     """Required columns for a valid cube item."""
 
-    def __init__(self, data: PandasSeries, **kwargs) -> None:
-        """Initialize a SITS Data Cube item.
+    #
+    # Convertions
+    #
+    def _convert_to_r(self, data: PandasDataFrame) -> RDataFrame:
+        """Convert the row (as a one-row frame) from Python to R.
 
         Args:
-            data (PandasSeries): Input data containing cube metadata and information.
-
-            **kwargs: Additional keyword arguments passed to pandas.Series constructor.
-
-        Note:
-            The input data must contain all required columns specified in
-            ``required_columns``. If the data is valid, it will be converted
-            to an R DataFrame instance.
+            data (pandas.DataFrame): Row as a one-row frame.
         """
-        # Create a cube from a Pandas Series
-        if isinstance(data, PandasSeries) and getattr(data, "_instance", None) is None:
-            # Check if required columns are present
-            has_required_columns = all(
-                col in data.index for col in self.required_columns
-            )
-
-            if has_required_columns:
-                # Convert to Pandas DataFrame
-                cube_data = PandasDataFrame([data])
-
-                # Convert to R DataFrame
-                self._instance = pandas_cube_to_tibble_arrow(cube_data)
-
-        # Initialize super class
-        super().__init__(data=data, **kwargs)
+        return pandas_cube_to_tibble_arrow(data)
 
 
 class SITSCubeModel(SITSFrame):
@@ -119,6 +100,9 @@ class SITSCubeModel(SITSFrame):
     ]
     """Required columns for a valid cube."""
 
+    _sync_full_columns: list[str] = ["base_info"]
+    """Columns that can only be synced with a full conversion."""
+
     #
     # Properties
     #
@@ -130,20 +114,31 @@ class SITSCubeModel(SITSFrame):
     #
     # Dunder methods
     #
-    def __init__(self, instance, **kwargs):
-        """Initializer."""
-        # If instance is a Pandas DataFrame, convert to R cube
-        if isinstance(instance, PandasDataFrame):
-            # Check if required columns are present
-            has_required_columns = all(
-                col in instance.columns for col in self.required_columns
-            )
+    def __init__(self, instance, lazy: bool | None = None, **kwargs):
+        """Initializer.
+
+        Args:
+            instance (RDataFrame | PandasDataFrame): Data instance.
+
+            lazy (bool | None, optional): If True, R data is only converted to
+                Python on first access. Defaults to ``settings.LAZY_CONVERSION``.
 
-            if has_required_columns:
-                self._instance = pandas_cube_to_tibble_arrow(instance)
+            **kwargs: Additional keyword arguments passed to pandas.DataFrame.
+        """
+        lazy = settings.LAZY_CONVERSION if lazy is None else lazy
+
+        # If lazy, keep the R instance and convert it on first access
+        if lazy and isinstance(instance, RDataFrame):
+            self._init_lazy(instance)
+            return
+
+        # If instance is a Pandas DataFrame, defer the conversion to R until the R
+        # instance is required
+        if isinstance(instance, PandasDataFrame):
+            self._is_updated = True
 
         else:
-            self._instance = instance
+            self._r_instance = instance
 
         # Proxy instance
         if isinstance(instance, RDataFrame):
@@ -161,7 +156,15 @@ class SITSCubeModel(SITSFrame):
         Args:
             instance (rpy2.robjects.vectors.DataFrame): Data instance.
         """
-        return tibble_cube_to_pandas_arrow(instance)
+        return conversion_cache.convert(instance, tibble_cube_to_pandas_arrow)
+
+    def _convert_columns_to_r(self, data: PandasDataFrame) -> RDataFrame:
+        """Convert columns of the frame from Python to R.
+
+        Args:
+            data (pandas.DataFrame): Columns to convert.
+        """
+        return pandas_to_tibble_arrow(data, CUBE_NESTED_COLUMNS)
 
     #
     # Data management
@@ -171,27 +174,50 @@ class SITSCubeModel(SITSFrame):
         if not self._is_updated:
             return
 
+        # Update flag
+        self._is_updated = False
+
+        # Check if required columns are present
+        has_required_columns = all(col in self.columns for col in self.required_columns)
+
+        if not has_required_columns:
+            self._r_instance = None
+            self._mark_synced()
+            return
+
+        # Sync only the changed rows and columns (if possible)
+        if self._sync_changes():
+            self._mark_synced()
+            return
+
         # Save current classes
-        classes = self._instance.rclass
+        classes = self._r_instance.rclass if self._r_instance is not None else None
 
         # Update instance
+        data = self
         base_info = None
 
         if "base_info" in self.columns:
             # Convert each dataframe in the series to R DataFrame
             base_info = [pandas_cube_to_tibble_arrow(df) for df in self.base_info]
 
-            # Drop base_info
-            self.drop(columns=["base_info"], inplace=True)
+            # Drop base_info (without changing the current data)
+            data = PandasDataFrame(self).drop(columns=["base_info"])
 
-        self._instance = pandas_cube_to_tibble_arrow(self)
+        self._r_instance = pandas_cube_to_tibble_arrow(data)
 
         # Add base_info
         if base_info is not None:
-            self._instance = r_fnc_set_column(self._instance, "base_info", base_info)
+            self._r_instance = r_fnc_set_column(
+                self._r_instance, "base_info", base_info
+            )
 
         # Restore classes
-        self._instance.rclass = classes
+        if classes is not None:
+            self._r_instance.rclass = classes
+
+        # Update flag
+        self._mark_synced()
 
     #
     # Representation
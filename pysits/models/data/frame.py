@@ -17,16 +17,55 @@
 
 """Frame data models."""
 
+import numpy as np
 from geopandas import GeoDataFrame as GeoPandasDataFrame
 from pandas import DataFrame as PandasDataFrame
+from pandas import Series as PandasSeries
+from pandas.api.types import is_integer
+from pandas.core.indexing import _AtIndexer, _iAtIndexer, _iLocIndexer, _LocIndexer
+from pandas.util import hash_pandas_object
 from rpy2.robjects.vectors import DataFrame as RDataFrame
 
 from pysits.conversions.tibble import (
     pandas_to_tibble,
     tibble_nested_to_pandas,
+    tibble_slice,
     tibble_to_pandas,
+    tibble_update_columns,
 )
 from pysits.models.data.base import SITSData
+from pysits.models.frame import SITSFrameArray
+
+
+#
+# Indexers
+#
+class _SITSIndexerMixin:
+    """Indexer that tracks the changes made through it."""
+
+    def __setitem__(self, key, value):
+        """Set item."""
+        self.obj._track_changes()
+
+        super().__setitem__(key, value)
+
+        self.obj._is_updated = True
+
+
+class _SITSLocIndexer(_SITSIndexerMixin, _LocIndexer):
+    """Label-based indexer (``loc``)."""
+
+
+class _SITSiLocIndexer(_SITSIndexerMixin, _iLocIndexer):
+    """Position-based indexer (``iloc``)."""
+
+
+class _SITSAtIndexer(_SITSIndexerMixin, _AtIndexer):
+    """Label-based scalar indexer (``at``)."""
+
+
+class _SITSiAtIndexer(_SITSIndexerMixin, _iAtIndexer):
+    """Position-based scalar indexer (``iat``)."""
 
 
 class SITSFrameBase(SITSData):
@@ -35,6 +74,34 @@ class SITSFrameBase(SITSData):
     _is_updated = False
     """Whether the instance is updated."""
 
+    _r_instance = None
+    """R instance."""
+
+    _pending_instance = None
+    """R instance waiting to be converted to Python (lazy conversion)."""
+
+    _row_source = None
+    """R instance from which the rows of this frame were selected."""
+
+    _row_positions = None
+    """Positions (0-based) of the rows selected from ``_row_source``."""
+
+    _sits_mgr = None
+    """Pandas data manager."""
+
+    _sync_state = None
+    """Index, columns and values synced with R (used to find changes)."""
+
+    _dirty_columns = None
+    """Columns assigned since the last sync with R."""
+
+    _sync_full_columns: list[str] = []
+    """Columns that can only be synced with a full conversion."""
+
+    _sync_rows_ratio = 0.1
+    """Maximum ratio of changed rows to update in a column (instead of replacing
+    the whole column)."""
+
     def __finalize__(self, other, method=None, **kwargs):
         """Propagate metadata from another object to the current one.
 
@@ -56,11 +123,375 @@ class SITSFrameBase(SITSData):
         # Always return the current subclass
         return self.__class__
 
+    @property
+    def _instance(self):
+        """R instance (Python changes are synced to R on access)."""
+        self._resolve_row_source()
+        self._sync_instance()
+
+        return self._r_instance
+
+    @_instance.setter
+    def _instance(self, value):
+        """Set R instance."""
+        object.__setattr__(self, "_r_instance", value)
+        object.__setattr__(self, "_row_source", None)
+
+    @property
+    def _mgr(self):
+        """Pandas data manager (converts pending R instances on first access)."""
+        if self._pending_instance is not None:
+            self._materialize()
+
+        return self._sits_mgr
+
+    @_mgr.setter
+    def _mgr(self, value):
+        """Set Pandas data manager."""
+        object.__setattr__(self, "_sits_mgr", value)
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the data is available in Python (converted from R)."""
+        return self._pending_instance is None
+
+    @property
+    def loc(self):
+        """Label-based indexer."""
+        return _SITSLocIndexer("loc", self)
+
+    @property
+    def iloc(self):
+        """Position-based indexer."""
+        return _SITSiLocIndexer("iloc", self)
+
+    @property
+    def at(self):
+        """Label-based scalar indexer."""
+        return _SITSAtIndexer("at", self)
+
+    @property
+    def iat(self):
+        """Position-based scalar indexer."""
+        return _SITSiAtIndexer("iat", self)
+
+    #
+    # Changes
+    #
     def __setitem__(self, key, value):
         """Set item."""
+        # Columns assigned (other keys, e.g., masks, may change any value)
+        columns = None
+
+        if isinstance(key, str):
+            columns = [key]
+
+        elif isinstance(key, list) and all(isinstance(k, str) for k in key):
+            columns = key
+
+        self._track_changes(columns)
+
         super().__setitem__(key, value)
         self._is_updated = True
 
+    def __delitem__(self, key):
+        """Delete item."""
+        self._track_changes([])
+
+        super().__delitem__(key)
+        self._is_updated = True
+
+    def insert(self, loc, column, value, **kwargs):
+        """Insert column into the frame at the specified location."""
+        self._track_changes([column])
+
+        super().insert(loc, column, value, **kwargs)
+        self._is_updated = True
+
+    def _update_inplace(self, result, *args, **kwargs):
+        """Replace the data of the frame (used by ``inplace`` operations)."""
+        self._track_changes()
+
+        super()._update_inplace(result, *args, **kwargs)
+        self._is_updated = True
+
+    def _set_axis(self, axis, labels):
+        """Set the labels of an axis (e.g., ``index = ...``, ``reset_index``)."""
+        super()._set_axis(axis, labels)
+
+        is_index = axis == self._get_block_manager_axis(0)
+
+        # Row labels are not synced with R, but the changes tracked since the last
+        # sync are mapped to the synced rows by their labels. Column labels are the
+        # names of the R columns. In both cases, a full conversion is required.
+        if is_index and self._sync_state is None:
+            return
+
+        self._is_updated = True
+        self._sync_state = None
+        self._dirty_columns = None
+
+    def _track_changes(self, columns: list[str] | None = None) -> None:
+        """Save the state synced with R before the frame is changed.
+
+        Args:
+            columns (list[str] | None, optional): Columns assigned by the change. If
+                None, the changed columns are unknown, and the values of the frame
+                are saved to find them on sync. Defaults to None.
+        """
+        if self._sync_state is None:
+            # Frame changed without being synced with R (full conversion)
+            if self._is_updated or not self.columns.is_unique:
+                return
+
+            self._sync_state = {
+                "index": self.index,
+                "columns": self.columns,
+                "values": None,
+            }
+
+        # Changes in known columns
+        if columns is not None:
+            self._dirty_columns = {*(self._dirty_columns or ()), *columns}
+            return
+
+        # Changes in unknown columns
+        if self._sync_state["values"] is None:
+            self._sync_state["values"] = {
+                column: self._column_state(column)
+                for column in self.columns
+                if column not in (self._dirty_columns or ())
+            }
+
+    def _column_state(self, column: str):
+        """Get the values of a column used to find the rows changed on it.
+
+        Args:
+            column (str): Column name.
+
+        Returns:
+            SITSFrameArray | np.ndarray | None: Nested data (immutable), hashes of
+                the values of the column or None if the column can't be hashed.
+        """
+        values = self[column]
+
+        if isinstance(values.array, SITSFrameArray):
+            return values.array
+
+        try:
+            return hash_pandas_object(values, index=False).to_numpy()
+
+        except TypeError:
+            return None
+
+    def _changed_rows(self, column: str, positions: np.ndarray) -> np.ndarray | None:
+        """Find the rows of a column changed since the last sync with R.
+
+        Args:
+            column (str): Column name.
+
+            positions (np.ndarray): Positions of the rows in the synced data.
+
+        Returns:
+            np.ndarray | None: Mask of the changed rows, or None if all rows must be
+                synced.
+        """
+        dirty_columns = self._dirty_columns or ()
+        values = self._sync_state["values"]
+
+        # Assigned or new columns
+        if column in dirty_columns or column not in self._sync_state["columns"]:
+            return None
+
+        # Only known columns were changed
+        if values is None:
+            return np.zeros(len(positions), dtype=bool)
+
+        synced_state = values[column]
+        current_state = self._column_state(column)
+
+        if isinstance(synced_state, SITSFrameArray):
+            is_equal = isinstance(current_state, SITSFrameArray) and (
+                current_state.equals(synced_state.take(positions))
+            )
+
+            return np.zeros(len(positions), dtype=bool) if is_equal else None
+
+        if synced_state is None or current_state is None:
+            return None
+
+        return current_state != synced_state[positions]
+
+    def _sync_changes(self) -> bool:
+        """Sync the rows and columns changed since the last sync with R.
+
+        Removed rows and columns are removed from the R instance and only the
+        changed values are converted. Changes that can't be synced this way (e.g.,
+        new rows) require a full conversion.
+
+        Returns:
+            bool: True if the changes were synced. False if a full conversion is
+                required.
+        """
+        state = self._sync_state
+
+        if state is None or not isinstance(self._r_instance, RDataFrame):
+            return False
+
+        if not self.index.is_unique or not self.columns.is_unique:
+            return False
+
+        # Rows
+        positions = state["index"].get_indexer(self.index)
+
+        if (positions < 0).any():
+            return False
+
+        # Columns
+        removed = [column for column in state["columns"] if column not in self.columns]
+
+        changed = {}
+
+        for column in self.columns:
+            changed_rows = self._changed_rows(column, positions)
+
+            if changed_rows is None:
+                changed[column] = None
+
+            elif changed_rows.any():
+                changed[column] = (
+                    np.flatnonzero(changed_rows)
+                    if changed_rows.mean() <= self._sync_rows_ratio
+                    else None
+                )
+
+        if any(column in self._sync_full_columns for column in [*changed, *removed]):
+            return False
+
+        # Update rows
+        instance = self._r_instance
+
+        if not np.array_equal(positions, np.arange(len(state["index"]))):
+            instance = tibble_slice(instance, positions)
+
+        # Update columns
+        if changed or removed:
+            data = PandasDataFrame(self)
+
+            values = {
+                column: self._convert_columns_to_r(
+                    data[[column]] if rows is None else data[[column]].iloc[rows]
+                )
+                for column, rows in changed.items()
+            }
+
+            instance = tibble_update_columns(instance, values, changed, removed)
+
+        self._r_instance = instance
+
+        return True
+
+    def _mark_synced(self) -> None:
+        """Mark the frame as synced with R."""
+        self._is_updated = False
+        self._sync_state = None
+        self._dirty_columns = None
+
+    #
+    # Row selection
+    #
+    def take(self, indices, axis=0, **kwargs):
+        """Return the elements in the given positional indices along an axis."""
+        result = super().take(indices, axis=axis, **kwargs)
+
+        # Track selected rows
+        if self._get_axis_number(axis) == 0:
+            self._track_rows(result, np.asarray(indices, dtype=np.int64))
+
+        return result
+
+    def _slice(self, slobj, axis=0):
+        """Construct a slice of this frame."""
+        result = super()._slice(slobj, axis=axis)
+
+        # Track selected rows
+        if axis == 0:
+            self._track_rows(result, np.arange(len(self), dtype=np.int64)[slobj])
+
+        return result
+
+    def copy(self, deep=True):
+        """Make a copy of this frame."""
+        result = super().copy(deep=deep)
+
+        # Track rows (all rows are kept)
+        self._track_rows(result, None)
+
+        return result
+
+    def _track_rows(self, result, positions: np.ndarray | None) -> None:
+        """Track the rows of this frame selected in a derived frame.
+
+        If this frame is synced with R, the R instance of the derived frame is
+        created by subsetting the R instance of this frame, instead of converting
+        the derived frame from Python.
+
+        Args:
+            result (SITSFrameBase): Derived frame.
+
+            positions (np.ndarray | None): Positions of the rows selected. If None,
+                all rows are selected.
+        """
+        if not isinstance(result, SITSFrameBase) or self._is_updated:
+            return
+
+        # Normalize positions
+        if positions is not None:
+            positions = np.where(positions < 0, positions + len(self), positions)
+
+            if np.array_equal(positions, np.arange(len(self))):
+                positions = None
+
+        # All rows selected: share the R instance (or its source)
+        if positions is None:
+            if self._row_source is None and self._r_instance is None:
+                return
+
+            result._r_instance = self._r_instance
+            result._row_source = self._row_source
+            result._row_positions = self._row_positions
+            result._is_updated = False
+            return
+
+        # Define source instance (only tibbles can be sliced by rows; R vectors,
+        # matrices and tables are shown with a different shape in Python)
+        if self._row_source is not None:
+            source = self._row_source
+            positions = self._row_positions[positions]
+
+        elif isinstance(self._r_instance, RDataFrame):
+            source = self._r_instance
+
+        else:
+            return
+
+        # Save source in the derived frame
+        result._r_instance = None
+        result._row_source = source
+        result._row_positions = positions
+        result._is_updated = False
+
+    def _resolve_row_source(self) -> None:
+        """Create the R instance from the rows selected from a source instance."""
+        if self._row_source is None:
+            return
+
+        self._r_instance = tibble_slice(self._row_source, self._row_positions)
+
+        # Reset source
+        self._row_source = None
+        self._row_positions = None
+
     #
     # Convertions
     #
@@ -68,17 +499,49 @@ class SITSFrameBase(SITSData):
         """Convert data from R to Python."""
         return tibble_to_pandas(instance)
 
+    def _convert_columns_to_r(self, data: PandasDataFrame) -> RDataFrame:
+        """Convert columns of the frame from Python to R."""
+        return pandas_to_tibble(data)
+
     #
     # Data management
+    #
+    def _init_lazy(self, instance: RDataFrame) -> None:
+        """Initialize the frame without converting the R instance.
+
+        The R instance is converted to Python on first access to the data.
+
+        Args:
+            instance (rpy2.robjects.vectors.DataFrame): Data instance.
+        """
+        # Initialize an empty frame
+        PandasDataFrame.__init__(self)
+
+        # Save instance to be converted later
+        self._r_instance = instance
+        self._pending_instance = instance
+
+    def _materialize(self) -> None:
+        """Convert the pending R instance to Python."""
+        instance = self._pending_instance
+
+        # Reset pending instance (avoids recursive conversions)
+        self._pending_instance = None
+
+        # Convert and use the converted data manager
+        data = self._convert_from_r(instance)
+
+        object.__setattr__(self, "_sits_mgr", data._mgr)
+
     def _sync_instance(self):
         """Sync instance with R."""
         if not self._is_updated:
             return
 
-        self._instance = pandas_to_tibble(self)
+        self._r_instance = pandas_to_tibble(self)
 
         # Update flag
-        self._is_updated = False
+        self._mark_synced()
 
 
 class SITSFrame(SITSFrameBase, PandasDataFrame):
@@ -136,3 +599,148 @@ class SITSFrameNested(SITSFrame):
     def _convert_from_r(self, instance, nested_columns, **kwargs):
         """Convert data from R to Python."""
         return tibble_nested_to_pandas(instance, nested_columns=nested_columns)
+
+
+#
+# Frame items
+#
+class SITSFrameItem(PandasSeries):
+    """Base class for rows of sits frames.
+
+    The R instance of a row is only created when it is required (e.g., when the
+    row is passed to an R function). Rows selected from a frame synced with R are
+    created by subsetting the R instance of the frame, instead of converting the
+    row from Python.
+    """
+
+    #
+    # Attributes
+    #
+    required_columns: list[str] = []
+    """Required columns to create the R instance."""
+
+    _r_instance = None
+    """R instance."""
+
+    _r_instance_name = None
+    """Name (row label) of the row used to create the R instance."""
+
+    _parent_source = None
+    """R instance of the frame from which the row was selected."""
+
+    _parent_index = None
+    """Index of the frame from which the row was selected."""
+
+    _parent_positions = None
+    """Positions of the rows of the frame in ``_parent_source`` (if the frame is a
+    row subset)."""
+
+    #
+    # Dunder methods
+    #
+    def __init__(self, data=None, **kwargs):
+        """Initializer."""
+        super().__init__(data=data, **kwargs)
+
+        # Keep the source of rows created from other rows
+        if isinstance(data, SITSFrameItem) and not kwargs:
+            self._r_instance = data._r_instance
+            self._r_instance_name = data._r_instance_name
+            self._parent_source = data._parent_source
+            self._parent_index = data._parent_index
+            self._parent_positions = data._parent_positions
+
+    def __finalize__(self, other, method=None, **kwargs):
+        """Propagate metadata from another object to the current one.
+
+        Rows selected from a frame (e.g., ``iloc``, ``iterrows`` and ``apply``)
+        save the R instance of the frame, used to create the R instance of the row.
+        """
+        result = super().__finalize__(other, method=method, **kwargs)
+
+        if method is None and isinstance(other, SITSFrameBase):
+            result._save_parent(other)
+
+        return result
+
+    def __setitem__(self, key, value):
+        """Set item."""
+        super().__setitem__(key, value)
+
+        # Changed rows are converted from Python
+        self._r_instance = None
+        self._parent_source = None
+
+    #
+    # Properties (Internal)
+    #
+    @property
+    def _instance(self):
+        """R instance (created on first access)."""
+        if self._r_instance is None or self._r_instance_name != self.name:
+            self._r_instance = self._create_instance()
+            self._r_instance_name = self.name
+
+        return self._r_instance
+
+    @_instance.setter
+    def _instance(self, value):
+        """Set R instance."""
+        self._r_instance = value
+        self._r_instance_name = self.name
+
+    #
+    # Data management
+    #
+    def _save_parent(self, parent: SITSFrameBase) -> None:
+        """Save the R instance of the frame from which the row was selected.
+
+        Args:
+            parent (SITSFrameBase): Frame from which the row was selected.
+        """
+        # Frame not synced with R
+        if parent._is_updated:
+            return
+
+        if parent._row_source is not None:
+            self._parent_source = parent._row_source
+            self._parent_positions = parent._row_positions
+
+        elif isinstance(parent._r_instance, RDataFrame):
+            self._parent_source = parent._r_instance
+            self._parent_positions = None
+
+        else:
+            return
+
+        self._parent_index = parent.index
+
+    def _create_instance(self) -> RDataFrame | None:
+        """Create the R instance of the row.
+
+        Returns:
+            rpy2.robjects.vectors.DataFrame | None: R instance, or None if the row
+                does not have the required columns.
+        """
+        if not all(col in self.index for col in self.required_columns):
+            return None
+
+        # Select the row from the R instance of the frame
+        if self._parent_source is not None and self.name in self._parent_index:
+            position = self._parent_index.get_loc(self.name)
+
+            if is_integer(position):
+                if self._parent_positions is not None:
+                    position = self._parent_positions[position]
+
+                return tibble_slice(self._parent_source, [position])
+
+        # Convert the row from Python
+        return self._convert_to_r(PandasDataFrame([self]))
+
+    #
+    # Convertions
+    #
+    def _convert_to_r(self, data: PandasDataFrame) -> RDataFrame:
+        """Convert the row (as a one-row frame) from Python to R."""
+        return pandas_to_tibble(data)
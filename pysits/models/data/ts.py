@@ -19,29 +19,29 @@
 
 from geopandas import GeoDataFrame as GeoPandasDataFrame
 from pandas import DataFrame as PandasDataFrame
-from pandas import Series as PandasSeries
 from rpy2.robjects.vectors import DataFrame as RDataFrame
 
+from pysits import settings
+from pysits.conversions.cache import conversion_cache
 from pysits.conversions.tibble import tibble_sits_to_pandas
 from pysits.conversions.tibble_arrow import (
+    SITS_NESTED_COLUMNS,
     pandas_sits_to_tibble_arrow,
+    pandas_to_tibble_arrow,
     tibble_sits_to_pandas_arrow,
 )
-from pysits.models.data.frame import SITSFrame, SITSFrameSF
+from pysits.models.data.frame import SITSFrame, SITSFrameItem, SITSFrameSF
 
 
 #
 # Time-series data class
 #
-class SITSTimeSeriesItemModel(PandasSeries):
+class SITSTimeSeriesItemModel(SITSFrameItem):
     """SITS time-series item model."""
 
     #
     # Attributes
     #
-    _instance: RDataFrame = None
-    """R DataFrame instance."""
-
     required_columns: list[str] = [
         "start_date",
         "end_date",
@@ -49,38 +49,46 @@ class SITSTimeSeriesItemModel(PandasSeries):
     ]
     """Required columns for a valid time-series item."""
 
-    def __init__(self, data: PandasSeries, **kwargs):
-        """Initializer."""
-        # Create a cube from a Pandas Series
-        if isinstance(data, PandasSeries):
-            # Check if required columns are present
-            has_required_columns = all(
-                col in data.index for col in self.required_columns
-            )
-
-            if has_required_columns:
-                # Convert to Pandas DataFrame
-                ts_data = PandasDataFrame([data])
-
-                # Convert to R DataFrame
-                self._instance = pandas_sits_to_tibble_arrow(ts_data)
+    #
+    # Convertions
+    #
+    def _convert_to_r(self, data: PandasDataFrame) -> RDataFrame:
+        """Convert the row (as a one-row frame) from Python to R.
 
-        # Initialize super class
-        super().__init__(data=data, **kwargs)
+        Args:
+            data (pandas.DataFrame): Row as a one-row frame.
+        """
+        return pandas_sits_to_tibble_arrow(data)
 
 
 class SITSTimeSeriesModel(SITSFrame):
     """Time-series base class."""
 
-    def __init__(self, instance, **kwargs):
-        """Initializer."""
-        # If instance is a Pandas DataFrame, convert to R cube
+    def __init__(self, instance, lazy: bool | None = None, **kwargs):
+        """Initializer.
+
+        Args:
+            instance (RDataFrame | PandasDataFrame): Data instance.
+
+            lazy (bool | None, optional): If True, R data is only converted to
+                Python on first access. Defaults to ``settings.LAZY_CONVERSION``.
+
+            **kwargs: Additional keyword arguments passed to pandas.DataFrame.
+        """
+        lazy = settings.LAZY_CONVERSION if lazy is None else lazy
+
+        # If lazy, keep the R instance and convert it on first access
+        if lazy and isinstance(instance, RDataFrame):
+            self._init_lazy(instance)
+            return
+
+        # If instance is a Pandas DataFrame, defer the conversion to R until the R
+        # instance is required
         if isinstance(instance, PandasDataFrame):
-            # Convert to R DataFrame
-            self._instance = pandas_sits_to_tibble_arrow(instance)
+            self._is_updated = True
 
         else:
-            self._instance = instance
+            self._r_instance = instance
 
         # Proxy instance
         if isinstance(instance, RDataFrame):
@@ -106,7 +114,15 @@ class SITSTimeSeriesModel(SITSFrame):
         Args:
             instance (rpy2.robjects.vectors.DataFrame): Data instance.
         """
-        return tibble_sits_to_pandas_arrow(instance)
+        return conversion_cache.convert(instance, tibble_sits_to_pandas_arrow)
+
+    def _convert_columns_to_r(self, data: PandasDataFrame) -> RDataFrame:
+        """Convert columns of the frame from Python to R.
+
+        Args:
+            data (pandas.DataFrame): Columns to convert.
+        """
+        return pandas_to_tibble_arrow(data, SITS_NESTED_COLUMNS)
 
     #
     # Data management
@@ -116,14 +132,23 @@ class SITSTimeSeriesModel(SITSFrame):
         if not self._is_updated:
             return
 
+        # Sync only the changed rows and columns (if possible)
+        if self._sync_changes():
+            self._mark_synced()
+            return
+
         # Save current classes
-        classes = self._instance.rclass
+        classes = self._r_instance.rclass if self._r_instance is not None else None
 
         # Update instance
-        self._instance = pandas_sits_to_tibble_arrow(self)
+        self._r_instance = pandas_sits_to_tibble_arrow(self)
 
         # Restore classes
-        self._instance.rclass = classes
+        if classes is not None:
+            self._r_instance.rclass = classes
+
+        # Update flag
+        self._mark_synced()
 
 
 class SITSTimeSeriesSFModel(SITSFrameSF):
@@ -17,17 +17,21 @@
 
 """Pandas extension models."""
 
-import warnings
 from collections.abc import Sequence
 
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 from pandas import DataFrame as PandasDataFrame
-from pandas._typing import Self
+from pandas import concat as pandas_concat
+from pandas._typing import ArrayLike, Self
 from pandas.api.extensions import (
     ExtensionArray,
     ExtensionDtype,
     register_extension_dtype,
 )
+from pandas.api.indexers import check_array_indexer
+from pandas.api.types import is_integer
 
 
 @register_extension_dtype
@@ -63,18 +67,155 @@ class SITSFrameDtype(ExtensionDtype):
         return SITSFrameArray
 
 
+#
+# Helper functions
+#
+def _frames_to_ragged(
+    frames: Sequence,
+) -> tuple[PandasDataFrame, np.ndarray, np.ndarray]:
+    """Concatenate the rows of a sequence of data frames.
+
+    Args:
+        frames (Sequence): Data frames (or None, for missing values).
+
+    Returns:
+        tuple[PandasDataFrame, np.ndarray, np.ndarray]: Rows of all data frames,
+            offsets (``n + 1`` values) and mask of missing data frames.
+    """
+    missing = np.array([df is None for df in frames], dtype=bool)
+    frames_valid = [df for df in frames if df is not None]
+
+    # Compute offsets
+    sizes = np.zeros(len(frames), dtype=np.int64)
+    sizes[~missing] = [len(df) for df in frames_valid]
+
+    offsets = np.zeros(len(frames) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+
+    # Concatenate rows
+    data = (
+        pandas_concat(frames_valid, ignore_index=True)
+        if frames_valid
+        else PandasDataFrame()
+    )
+
+    return data, offsets, missing
+
+
+def _frames_to_arrow(frames: Sequence) -> pa.LargeListArray | None:
+    """Convert a sequence of data frames to an Arrow list array.
+
+    Args:
+        frames (Sequence): Data frames (or None, for missing values).
+
+    Returns:
+        pa.LargeListArray | None: Array where each element is a list of structs
+            (the rows of a data frame). If the data frames can not be represented
+            as Arrow (e.g., elements that are not data frames, or data frames with
+            different columns), returns None.
+    """
+    frames_valid = [df for df in frames if df is not None]
+
+    # Check if all elements are data frames with the same columns
+    if not all(isinstance(df, PandasDataFrame) for df in frames_valid):
+        return None
+
+    if any(list(df.columns) != list(frames_valid[0].columns) for df in frames_valid):
+        return None
+
+    # Convert rows of all data frames
+    data, offsets, missing = _frames_to_ragged(frames)
+
+    try:
+        rows = pa.Table.from_pandas(data, preserve_index=False).to_struct_array()
+
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+
+    return pa.LargeListArray.from_arrays(
+        pa.array(offsets),
+        rows.combine_chunks(),
+        mask=pa.array(missing) if missing.any() else None,
+    )
+
+
+def _to_arrow_array(values: ArrayLike | pa.Array | pa.ChunkedArray) -> pa.Array:
+    """Convert a flat buffer of a nested column to an Arrow array.
+
+    Args:
+        values (ArrayLike | pa.Array | pa.ChunkedArray): NumPy, pandas or Arrow
+            array.
+
+    Returns:
+        pa.Array: Arrow array (Arrow arrays are used directly).
+    """
+    if isinstance(values, pa.ChunkedArray):
+        return values.combine_chunks()
+
+    if isinstance(values, pa.Array):
+        return values
+
+    return pa.array(values)
+
+
+def _arrow_to_frame(values: pa.StructArray) -> PandasDataFrame:
+    """Convert the rows of a nested data frame (Arrow structs) to Pandas.
+
+    Args:
+        values (pa.StructArray): Rows of a nested data frame.
+
+    Returns:
+        PandasDataFrame: Nested data frame.
+    """
+    # ``StructArray.flatten`` applies the offset of sliced arrays to the children
+    # (``Table.from_struct_array`` ignores it in some pyarrow versions)
+    columns = values.flatten()
+    names = [field.name for field in values.type]
+
+    return pa.Table.from_arrays(columns, names=names).to_pandas()
+
+
+#
+# Extension array
+#
 class SITSFrameArray(ExtensionArray):
     """SITS Frame array type.
 
+    The array is backed by an Arrow list array, where each element is a list of
+    structs (the rows of a nested data frame). Operations such as ``take``,
+    slicing and filtering run as Arrow kernels, and data frames are only created
+    when a single element is accessed. Elements that can not be represented as
+    Arrow are kept in a list.
+
     Note:
         To learn more about the operations and attributes implemented on this class
         it is recommended to check the pandas documentation:
         https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.api.extensions.ExtensionDtype.html
     """
 
+    _array: pa.LargeListArray | None = None
+    """Nested data frames (Arrow representation)."""
+
+    _data: list | None = None
+    """Nested data frames (list representation)."""
+
     def __init__(self, frames):
         """Initializer."""
-        self._data = frames
+        if isinstance(frames, pa.ChunkedArray):
+            frames = frames.combine_chunks()
+
+        # Arrow arrays are used directly
+        if isinstance(frames, pa.Array):
+            if not pa.types.is_large_list(frames.type):
+                frames = frames.cast(pa.large_list(frames.type.value_type))
+
+            self._array = frames
+
+        else:
+            self._array = _frames_to_arrow(frames)
+
+            if self._array is None:
+                self._data = frames
 
     #
     # Properties
@@ -84,6 +225,23 @@ class SITSFrameArray(ExtensionArray):
         """Dtype value."""
         return SITSFrameDtype()
 
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes needed to store this object in memory."""
+        if self._is_arrow:
+            return self._array.nbytes
+
+        return sum(
+            int(df.memory_usage(deep=True).sum())
+            for df in self._data
+            if isinstance(df, PandasDataFrame)
+        )
+
+    @property
+    def _is_arrow(self) -> bool:
+        """Whether the array uses the Arrow representation."""
+        return self._array is not None
+
     #
     # Private methods
     #
@@ -91,13 +249,140 @@ class SITSFrameArray(ExtensionArray):
         """Formatting function for scalar values."""
         return lambda x: f"NestedDataFrame(size = {len(x)})"
 
+    def _take_positions(self, positions: np.ndarray, missing: np.ndarray) -> Self:
+        """Take elements from valid positions.
+
+        Args:
+            positions (np.ndarray): Positions of the elements (in bounds).
+
+            missing (np.ndarray): Mask of elements that must be missing.
+
+        Returns:
+            Self: Array with the selected elements.
+        """
+        if self._is_arrow:
+            indices = pa.array(positions, type=pa.int64(), mask=missing)
+
+            return SITSFrameArray(self._array.take(indices))
+
+        return SITSFrameArray(
+            [
+                None if is_missing else self._data[position]
+                for position, is_missing in zip(positions, missing, strict=True)
+            ]
+        )
+
+    #
+    # Conversions
+    #
+    def to_ragged(self) -> tuple[dict[str, pa.Array], np.ndarray, np.ndarray]:
+        """Get the ragged (offsets-based) representation of the array.
+
+        The flat buffers are the children of the Arrow list array, so column types
+        and missing values (e.g., integers with nulls) are kept.
+
+        Returns:
+            tuple[dict[str, pa.Array], np.ndarray, np.ndarray]: Flat buffer of each
+                column, offsets (starting at zero) and mask of missing nested data
+                frames. Missing elements have no rows in the buffers.
+
+        Raises:
+            pa.ArrowException: If the nested data frames can not be represented as
+                Arrow.
+        """
+        if not self._is_arrow:
+            data, offsets, missing = _frames_to_ragged(self._data)
+
+            return {name: pa.array(data[name]) for name in data}, offsets, missing
+
+        missing = self.isna()
+
+        # Offsets of the list array (missing elements may have rows)
+        if not missing.any():
+            offsets = self._array.offsets.to_numpy()
+            offsets = offsets - offsets[0]
+
+            rows = self._array.values.slice(self._array.offsets[0].as_py(), offsets[-1])
+
+        # Compute offsets (rows of missing elements are removed)
+        else:
+            sizes = pc.fill_null(pc.list_value_length(self._array), 0).to_numpy()
+
+            offsets = np.zeros(len(self) + 1, dtype=np.int64)
+            np.cumsum(sizes, out=offsets[1:])
+
+            rows = self._array.flatten()
+
+        # Get flat buffers (children of the struct rows)
+        values = {
+            field.name: field_values
+            for field, field_values in zip(rows.type, rows.flatten(), strict=True)
+        }
+
+        return values, offsets, missing
+
+    def __arrow_array__(self, type=None):
+        """Convert the array to Arrow (used by ``pyarrow.array``)."""
+        if self._is_arrow:
+            return self._array
+
+        raise TypeError("Nested data frames can not be represented as Arrow.")
+
+    def __array__(self, dtype=None, copy=None):
+        """Convert the array to NumPy (used by ``numpy.asarray``).
+
+        The result is a 1-D object array of data frames. Elements are assigned one
+        by one, so NumPy does not stack data frames with the same shape as a 3-D
+        array (e.g., in ``DataFrame.iterrows`` and ``DataFrame.apply``).
+        """
+        result = np.empty(len(self), dtype=object)
+
+        for idx, frame in enumerate(self):
+            result[idx] = frame
+
+        return result if dtype is None else result.astype(dtype, copy=False)
+
     #
     # Class methods
     #
+    @classmethod
+    def from_ragged(
+        cls,
+        values: dict[str, ArrayLike],
+        offsets: np.ndarray,
+        missing: np.ndarray | None = None,
+    ) -> Self:
+        """Create an array from a ragged (offsets-based) representation.
+
+        Args:
+            values (dict[str, ArrayLike]): Flat buffer of each column (NumPy,
+                pandas or Arrow array), with the rows of all nested data frames.
+
+            offsets (np.ndarray): Offsets (``n + 1`` values) where each nested data
+                frame starts and ends in the flat buffers.
+
+            missing (np.ndarray | None, optional): Mask of missing nested data
+                frames. Defaults to None.
+
+        Returns:
+            Self: SITS Frame array.
+        """
+        rows = pa.StructArray.from_arrays(
+            [_to_arrow_array(v) for v in values.values()], names=list(values)
+        )
+
+        mask = None if missing is None else pa.array(missing, type=pa.bool_())
+
+        return cls(
+            pa.LargeListArray.from_arrays(
+                pa.array(offsets, type=pa.int64()), rows, mask=mask
+            )
+        )
+
     @classmethod
     def _from_sequence(cls, scalars, dtype=None, copy=False):
         """Construct a new ExtensionArray from a sequence of scalars."""
-        return cls(scalars)
+        return cls(list(scalars))
 
     @classmethod
     def _concat_same_type(cls, to_concat: Sequence[Self]) -> Self:
@@ -115,7 +400,15 @@ class SITSFrameArray(ExtensionArray):
             >>> SITSFrameArray._concat_same_type([arr1, arr2])
             NestedDataFrame(size = 4)
         """
-        concatenated_data = [df for arr in to_concat for df in arr._data]
+        # Concatenate Arrow arrays with the same type
+        if all(arr._is_arrow for arr in to_concat) and to_concat:
+            try:
+                return cls(pa.concat_arrays([arr._array for arr in to_concat]))
+
+            except pa.ArrowInvalid:
+                pass
+
+        concatenated_data = [df for arr in to_concat for df in arr]
         return cls(concatenated_data)
 
     #
@@ -124,30 +417,66 @@ class SITSFrameArray(ExtensionArray):
     def __getitem__(self, item):
         """Get item."""
         # Scalar `item` index
-        if isinstance(item, int):
-            return self._data[item]
+        if is_integer(item):
+            if not self._is_arrow:
+                return self._data[item]
 
-        # Assuming `item` as a sequence
-        frame_size = len(self._data)
+            # Check bounds
+            if not -len(self) <= item < len(self):
+                raise IndexError(f"Index {item} is out of bounds.")
 
-        if isinstance(item, slice):
-            # Safely handle ``slice`` start/stop/step
-            indices = range(*item.indices(frame_size))
+            element = self._array[item]
 
-        else:
-            # Assume it's iterable (like list or set)
-            indices = item
+            return _arrow_to_frame(element.values) if element.is_valid else None
+
+        # Slice with unit step (zero-copy)
+        if isinstance(item, slice) and item.step in (None, 1) and self._is_arrow:
+            start, stop, _ = item.indices(len(self))
+
+            return SITSFrameArray(self._array.slice(start, max(stop - start, 0)))
+
+        # Assuming `item` as a slice, mask or sequence of positions
+        item = check_array_indexer(self, item)
+
+        # Boolean masks
+        if not isinstance(item, slice) and item.dtype == bool and self._is_arrow:
+            return SITSFrameArray(self._array.filter(pa.array(item)))
+
+        positions = np.arange(len(self))[item]
 
         # Transform and return!
-        return SITSFrameArray([self._data[idx] for idx in indices])
+        return self._take_positions(positions, np.zeros(len(positions), dtype=bool))
+
+    def __iter__(self):
+        """Iterate over elements."""
+        if not self._is_arrow:
+            yield from self._data
+            return
+
+        # Get offsets and rows once, and slice them for each element
+        offsets = self._array.offsets.to_numpy()
+        rows = self._array.values
+        missing = self.isna()
+
+        for idx in range(len(self)):
+            if missing[idx]:
+                yield None
+
+            else:
+                start, stop = offsets[idx], offsets[idx + 1]
+
+                yield _arrow_to_frame(rows.slice(start, stop - start))
 
     def __len__(self):
         """Get object size."""
+        if self._is_arrow:
+            return len(self._array)
+
         return len(self._data)
 
     def __repr__(self):
         """Object representation."""
-        return f"NestedDataFrame(size = {len(self._data)})"
+        return f"NestedDataFrame(size = {len(self)})"
 
     def __eq__(self, other):
         """Compare two SITSFrameArray objects."""
@@ -155,13 +484,21 @@ class SITSFrameArray(ExtensionArray):
             return np.array(
                 [
                     x.equals(y) if hasattr(x, "equals") else np.array_equal(x, y)
-                    for x, y in zip(self._data, other._data)
+                    for x, y in zip(self, other)
                 ],
                 dtype=bool,
             )
 
         return NotImplemented
 
+    def equals(self, other) -> bool:
+        """Check whether two arrays contain the same data frames."""
+        # Compare the Arrow buffers, without creating the data frames
+        if isinstance(other, SITSFrameArray) and self._is_arrow and other._is_arrow:
+            return self._array.equals(other._array)
+
+        return super().equals(other)
+
     #
     # Hashing
     #
@@ -174,18 +511,38 @@ class SITSFrameArray(ExtensionArray):
     #
     def take(self, indices, allow_fill=False, fill_value=None):
         """Take elements from an array."""
-        with warnings.catch_warnings():
-            # Ignoring pandas warning about non-standard input. This
-            # will be solved soon
-            warnings.simplefilter("ignore")
+        indices = np.asarray(indices, dtype=np.intp)
+
+        # Define missing values (``-1`` when ``allow_fill``)
+        if allow_fill:
+            if (indices < -1).any():
+                raise ValueError("Invalid value in 'indices'. Must be >= -1.")
 
-            # Take and return!
-            return SITSFrameArray([self._data[idx] for idx in indices])
+            missing = indices == -1
+
+        else:
+            missing = np.zeros(len(indices), dtype=bool)
+            indices = np.where(indices < 0, indices + len(self), indices)
+
+        # Check bounds
+        positions = np.where(missing, 0, indices)
+
+        if ((positions < 0) | (positions >= len(self)))[~missing].any():
+            raise IndexError("Index is out of bounds for SITSFrameArray.")
+
+        return self._take_positions(positions, missing)
 
     def isna(self):
         """A 1-D array indicating if each value is missing."""
-        return np.array([df is None for df in self._data])
+        if self._is_arrow:
+            return self._array.is_null().to_numpy(zero_copy_only=False)
+
+        return np.array([df is None for df in self._data], dtype=bool)
 
     def copy(self):
         """Return a copy of the array."""
+        if self._is_arrow:
+            # Arrow arrays are immutable, so they can be shared
+            return SITSFrameArray(self._array)
+
         return SITSFrameArray(self._data.copy())
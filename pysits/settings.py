@@ -36,6 +36,36 @@ rpy2.rinterface_lib.callbacks.consolewrite_warnerror = lambda x: None
 #
 os.environ["TORCH_INSTALL"] = "0"
 
+#
+# Conversion settings
+#
+# Transport used to move Arrow tables between R and Python. Available values are
+# ``c_stream`` (in-memory, using the Arrow C Stream interface) and ``feather``
+# (temporary Feather files).
+ARROW_TRANSPORT = os.environ.get("PYSITS_ARROW_TRANSPORT", "c_stream")
+
+# Lazy conversion of sits data (time-series and cubes) from R to Python. When
+# enabled, data is only converted to Pandas when it is accessed in Python.
+LAZY_CONVERSION = os.environ.get("PYSITS_LAZY_CONVERSION", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+# Cache of sits data converted from R to Python. Converted data is reused when the
+# same R object is converted again. The cache is limited by number of entries and
+# by size (in bytes), and is disabled by default (``0`` entries).
+#
+# The cache trades memory for conversion time: it keeps each converted data frame
+# in memory. Without pandas Copy-on-Write (enabled by default in pandas 3), the
+# data returned by the cache is a deep copy, so each cached conversion may use
+# twice the memory of the converted data.
+CONVERSION_CACHE_SIZE = int(os.environ.get("PYSITS_CONVERSION_CACHE_SIZE", "0"))
+
+CONVERSION_CACHE_BYTES = int(
+    os.environ.get("PYSITS_CONVERSION_CACHE_BYTES", str(1024**3))
+)
+
 #
 # Compatible sits version
 #
@@ -15,20 +15,55 @@
 # along with this program; if not, see <https://www.gnu.org/licenses/>.
 #
 
-"""Global objects from sits."""
+"""Global objects from sits (loaded on first access)."""
 
+import sys
+
+from pysits.models.data.ts import SITSTimeSeriesModel
 from pysits.sits.utils import load_samples
 
 #
-# Samples objects
+# Available objects (name: package)
 #
-cerrado_2classes = load_samples("cerrado_2classes", package="sits")
-
-samples_modis_ndvi = load_samples("samples_modis_ndvi", package="sits")
-samples_l8_rondonia_2bands = load_samples("samples_l8_rondonia_2bands", package="sits")
+CONTEXT_DATASETS: dict[str, str] = {
+    # Samples objects
+    "cerrado_2classes": "sits",
+    "samples_modis_ndvi": "sits",
+    "samples_l8_rondonia_2bands": "sits",
+    # Points objects
+    "point_mt_6bands": "sits",
+}
 
 
 #
-# Points objects
+# Lazy loading mechanism
 #
-point_mt_6bands = load_samples("point_mt_6bands", package="sits")
+def __getattr__(name: str) -> SITSTimeSeriesModel:
+    """Lazily load and return a dataset from an R package.
+
+    Datasets are loaded on first access and cached in the module, so they are
+    loaded only once.
+
+    Args:
+        name (str): Dataset name (must be available in ``CONTEXT_DATASETS``).
+
+    Returns:
+        SITSTimeSeriesModel: The requested dataset.
+
+    Raises:
+        AttributeError: If the dataset is not available.
+    """
+    if name not in CONTEXT_DATASETS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    data = load_samples(name, package=CONTEXT_DATASETS[name])
+
+    # Cache it in the current module for future access
+    setattr(sys.modules[__name__], name, data)
+
+    return data
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including datasets not loaded yet."""
+    return sorted(set(globals()) | set(CONTEXT_DATASETS))
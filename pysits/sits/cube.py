@@ -17,8 +17,7 @@
 
 """Cube operations."""
 
-import rpy2.robjects as ro
-
+from pysits.backend.calls import call_with_expressions, split_expression_arguments
 from pysits.backend.pkgs import r_pkg_sits
 from pysits.conversions.decorators import (
     function_call,
@@ -151,33 +150,16 @@ def sits_reclassify(
     cube: SITSCubeModel, mask: SITSCubeModel, rules: MaskExpressionList, *args, **kwargs
 ) -> SITSCubeModel:
     """Reclassify a classified cube."""
-    params = []
-
-    # Process parameters manually
-    for k, v in kwargs.items():
-        current_v = v[0]
-
-        if k in ["output_dir", "version"]:
-            current_v = f"'{current_v}'"
-
-        elif k == "progress":
-            current_v = "TRUE" if current_v else "FALSE"
-
-        params.append(f"{k}={current_v}")
-
-    # Build the ``sits_apply`` command manually to support
-    # high-level expression definition (using string)
-    command = f"""
-        sits_reclassify(
-            cube = {cube.r_repr()},
-            mask = {mask.r_repr()},
-            rules = {rules.r_repr()},
-            {", ".join(params)}
-        )
-    """
+    values, expressions = split_expression_arguments(
+        kwargs, text_arguments=("output_dir", "version")
+    )
 
-    # Run operation
-    result = ro.r(command)
+    # Call ``sits_reclassify`` with the high-level rules expression
+    result = call_with_expressions(
+        "sits::sits_reclassify",
+        {"cube": cube, "mask": mask, **values},
+        {"rules": rules.r_repr(), **expressions},
+    )
 
     # Return
     return SITSCubeModel(result)
@@ -190,31 +172,12 @@ def sits_reclassify(
 @attach_doc("sits_texture")
 def sits_texture(cube, **kwargs) -> SITSCubeModel:
     """Apply a set of texture measures on a data cube."""
-    params = []
-
-    # Process parameters manually
-    for k, v in kwargs.items():
-        current_v = v[0]
-
-        if k == "output_dir":
-            current_v = f"'{current_v}'"
-
-        elif k == "progress":
-            current_v = "TRUE" if current_v else "FALSE"
-
-        params.append(f"{k}={current_v}")
-
-    # Build the ``sits_texture`` command manually to support
-    # high-level expression definition (using string)
-    command = f"""
-        sits_texture(
-            {cube.r_repr()},
-            {", ".join(params)}
-        )
-    """
+    values, expressions = split_expression_arguments(kwargs)
 
-    # Run operation
-    result = ro.r(command)
+    # Call ``sits_texture`` with the high-level expressions (defined as strings)
+    result = call_with_expressions(
+        "sits::sits_texture", {"cube": cube, **values}, expressions
+    )
 
     # Return
     return SITSCubeModel(result)
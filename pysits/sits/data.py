@@ -19,11 +19,10 @@
 
 from datetime import date
 
-import rpy2.robjects as ro
-from rpy2.robjects import globalenv as rpy2_globalenv
-
+from pysits.backend.calls import call_with_expressions, split_expression_arguments
 from pysits.backend.functions import r_fnc_summary
 from pysits.backend.pkgs import r_pkg_sits
+from pysits.backend.registry import r_helpers
 from pysits.conversions.common import convert_to_python
 from pysits.conversions.decorators import function_call, rpy2_fix_type
 from pysits.docs import attach_doc
@@ -34,6 +33,30 @@ from pysits.models.resolver import (
     resolve_and_invoke_content_class,
 )
 
+#
+# R helpers
+#
+r_helpers.register(
+    "convert_ts_reduce",
+    """
+    function(data, column_name = "time_series", exclude = "Index") {
+        data |>
+            dplyr::mutate(
+                {{ column_name }} := purrr::map(
+                    .data[[column_name]],
+                    ~ {
+                        .x |>
+                            dplyr::mutate(dplyr::across(
+                                .cols = !dplyr::all_of(exclude),
+                                .fns = ~ as.numeric(.)
+                            ))
+                    }
+                )
+            )
+    }
+    """,
+)
+
 
 @function_call(r_pkg_sits.sits_bands, lambda x: convert_to_python(x, as_type="str"))
 @attach_doc("sits_bands")
@@ -118,34 +141,12 @@ def sits_accuracy_summary(*args, **kwargs) -> SITSData:
 @attach_doc("sits_apply")
 def sits_apply(data, **kwargs) -> SITSFrame:
     """Apply a function on a set of time series."""
-    params = []
-
-    # Process parameters manually
-    for k, v in kwargs.items():
-        current_v = v[0]
-
-        if k == "output_dir":
-            current_v = f"'{current_v}'"
-
-        elif k == "progress":
-            current_v = "TRUE" if current_v else "FALSE"
-
-        elif k == "normalized":
-            current_v = "TRUE" if current_v else "FALSE"
+    values, expressions = split_expression_arguments(kwargs)
 
-        params.append(f"{k}={current_v}")
-
-    # Build the ``sits_apply`` command manually to support
-    # high-level expression definition (using string)
-    command = f"""
-        sits_apply(
-            {data.r_repr()},
-            {", ".join(params)}
-        )
-    """
-
-    # Run operation
-    result = ro.r(command)
+    # Call ``sits_apply`` with the high-level expressions (defined as strings)
+    result = call_with_expressions(
+        "sits::sits_apply", {"data": data, **values}, expressions
+    )
 
     # Return
     return resolve_and_invoke_content_class(result)
@@ -158,60 +159,21 @@ def sits_apply(data, **kwargs) -> SITSFrame:
 @attach_doc("sits_reduce")
 def sits_reduce(data, impute_fn=None, **kwargs) -> SITSFrame:
     """Reduces a cube or samples from a summarization function."""
-    params = []
+    values, expressions = split_expression_arguments(kwargs)
 
     # Process impute function
     if impute_fn is not None:
-        params.append(f"impute_fn = {impute_fn.r_repr()}")
-
-    # Process remaining parameters
-    for k, v in kwargs.items():
-        current_v = v[0]
-
-        if k == "output_dir":
-            current_v = f"'{current_v}'"
-
-        elif k == "progress":
-            current_v = "TRUE" if current_v else "FALSE"
-
-        params.append(f"{k}={current_v}")
-
-    # Build the ``sits_reduce`` command manually to support
-    # high-level expression definition (using string)
-    command = f"""
-        sits_reduce(
-            data = {data.r_repr()},
-            {", ".join(params)}
-        )
-    """
+        values["impute_fn"] = impute_fn
 
-    # Run operation
-    result = ro.r(command)
+    # Call ``sits_reduce`` with the high-level expressions (defined as strings)
+    result = call_with_expressions(
+        "sits::sits_reduce", {"data": data, **values}, expressions
+    )
 
     # Check if the result is a time-series data frame. If so, convert reduced
     # date type to numeric.
     if "time_series" in result.colnames:
-        # Define conversion function
-        ro.r("""
-            convert_ts_reduce <- 
-            function(data, column_name = "time_series", exclude = "Index") {
-                data |>
-                    dplyr::mutate(
-                        {{ column_name }} := purrr::map(
-                            .data[[column_name]],
-                            ~ {
-                                .x |>
-                                    dplyr::mutate(dplyr::across(
-                                        .cols = !dplyr::all_of(exclude),
-                                        .fns = ~ as.numeric(.)
-                                    ))
-                            }
-                        )
-                    )
-            }
-        """)
-
-        convert_ts_reduce = rpy2_globalenv["convert_ts_reduce"]
+        convert_ts_reduce = r_helpers["convert_ts_reduce"]
 
         # Convert result
         result = convert_ts_reduce(result)
@@ -17,15 +17,40 @@
 
 """Unit tests for the conversions module."""
 
+import gc
+
+import numpy as np
+import pandas as pd
 import pytest
 import rpy2.robjects as ro
+from rpy2.rinterface_lib.sexp import NULLType
 
+from pysits import settings
+from pysits.conversions.arrow import arrow_to_tibble, tibble_to_arrow
+from pysits.conversions.cache import ConversionCache
 from pysits.conversions.clojure import closure_factory
 from pysits.conversions.common import (
     convert_dict_like_as_list_to_r,
     convert_dict_like_to_r,
     convert_list_like_to_r,
+    convert_to_python,
+    convert_to_r,
+)
+from pysits.conversions.numpy import r_dimnames, r_vector_to_numpy
+from pysits.conversions.tibble import (
+    pandas_to_tibble,
+    tibble_nested_to_pandas,
+    tibble_schema,
+    tibble_to_pandas,
+)
+from pysits.conversions.tibble_arrow import (
+    pandas_sits_to_tibble_arrow,
+    pandas_to_tibble_arrow,
+    tibble_sits_to_pandas_arrow,
 )
+from pysits.conversions.vector import matrix_to_pandas, table_to_pandas
+from pysits.models.frame import SITSFrameArray
+from pysits.sits.context import samples_modis_ndvi
 
 
 def test_closure_factory_invalid_function():
@@ -163,3 +188,292 @@ def test_convert_dict_like_as_list_to_r():
     # Empty dictionary
     empty_result = convert_dict_like_as_list_to_r({})
     assert isinstance(empty_result, ro.vectors.ListVector)
+
+
+@pytest.mark.parametrize("transport", ["c_stream", "feather"])
+def test_arrow_transport_roundtrip(monkeypatch, transport):
+    """Test round-trip of data frames through the available Arrow transports."""
+    monkeypatch.setattr(settings, "ARROW_TRANSPORT", transport)
+
+    # Use a flat data frame (without nested columns)
+    data = samples_modis_ndvi._instance.rx(
+        True, ro.StrVector(["longitude", "latitude", "label", "cube"])
+    )
+
+    # R -> Python
+    table = tibble_to_arrow(data)
+
+    assert table.num_rows == samples_modis_ndvi.shape[0]
+    assert table.column_names == ["longitude", "latitude", "label", "cube"]
+
+    # Python -> R
+    result = arrow_to_tibble(table)
+
+    assert list(result.colnames) == table.column_names
+    assert result.nrow == table.num_rows
+
+    # Check content
+    original = tibble_to_pandas(data)
+    converted = tibble_to_pandas(result)
+
+    assert original.equals(converted)
+
+
+def test_arrow_transport_invalid(monkeypatch):
+    """Test that an invalid Arrow transport raises ValueError."""
+    monkeypatch.setattr(settings, "ARROW_TRANSPORT", "invalid")
+
+    with pytest.raises(ValueError, match="Invalid Arrow transport"):
+        tibble_to_arrow(samples_modis_ndvi._instance)
+
+
+def test_pandas_sits_to_tibble_arrow_nested_columns():
+    """Test that nested columns are rebuilt when converting sits data to R."""
+    data = tibble_sits_to_pandas_arrow(samples_modis_ndvi._instance)
+
+    # Python -> R
+    result = pandas_sits_to_tibble_arrow(data)
+
+    assert result.nrow == data.shape[0]
+    assert list(result.colnames) == list(data.columns)
+
+    # R -> Python
+    result = tibble_sits_to_pandas_arrow(result)
+
+    for original_ts, converted_ts in zip(
+        data["time_series"], result["time_series"], strict=True
+    ):
+        assert original_ts.equals(converted_ts)
+
+
+def test_pandas_to_tibble_arrow_nested_nulls():
+    """Test that nested integer columns with nulls are converted to R ``NA``."""
+    data = pd.DataFrame(
+        {
+            "id": [1, 2],
+            "values": SITSFrameArray(
+                [
+                    pd.DataFrame({"value": pd.Series([1, None], dtype="Int64")}),
+                    pd.DataFrame({"value": pd.Series([3], dtype="Int64")}),
+                ]
+            ),
+        }
+    )
+
+    result = pandas_to_tibble_arrow(data, ["values"])
+    value = ro.r("function(x) x$values[[1]]$value")(result)
+
+    assert list(ro.r["class"](value)) == ["integer"]
+    assert list(ro.r["is.na"](value)) == [False, True]
+
+
+def test_conversion_cache():
+    """Test that conversions of the same R object are cached."""
+    cache = ConversionCache(max_entries=1, max_bytes=1024**3)
+    samples = samples_modis_ndvi._instance
+
+    # Repeated conversions reuse the converted data
+    data1 = cache.convert(samples, tibble_sits_to_pandas_arrow)
+    data2 = cache.convert(samples, tibble_sits_to_pandas_arrow)
+
+    assert data2.equals(data1)
+    assert cache.info()["hits"] == 1
+    assert cache.info()["misses"] == 1
+
+    # Cached data is not changed by changes in the returned data
+    data2["label"] = "Changed"
+    assert cache.convert(samples, tibble_sits_to_pandas_arrow).equals(data1)
+
+    # Least recently used entries are evicted
+    cache.convert(samples, tibble_to_pandas)
+    assert cache.info()["entries"] == 1
+
+    cache.convert(samples, tibble_sits_to_pandas_arrow)
+    assert cache.info()["misses"] == 3  # noqa: PLR2004 - 3 conversions
+
+    # Clear
+    cache.clear()
+    assert cache.info()["entries"] == 0
+
+    # Entries are removed when the R object is released
+    data = ro.r("data.frame(x = c('a', 'b'))")
+    cache.convert(data, tibble_to_pandas)
+    assert cache.info()["nbytes"] > 0
+
+    del data
+    gc.collect()
+
+    assert cache.info()["entries"] == 0
+    assert cache.info()["nbytes"] == 0
+
+
+def test_tibble_schema():
+    """Test that invalid columns (functions and NULL values) are ignored."""
+    data = ro.r("""
+        tibble::tibble(
+            a = 1:2,
+            b = c("x", "y"),
+            fn = list(mean, mean),
+            empty = list(NULL, NULL),
+            nested = list(data.frame(x = 1), data.frame(x = 2))
+        )
+    """)
+
+    assert tibble_schema(data) == {"a": "integer", "b": "character", "nested": "list"}
+
+
+def test_r_vector_to_numpy():
+    """Test bulk conversion of R vectors and matrices to NumPy."""
+    # Vectors (``NA`` values are supported)
+    values = r_vector_to_numpy(ro.r("c(a = 1L, b = NA, c = 3L)"))
+    assert np.isnan(values[1])
+    assert values[[0, 2]].tolist() == [1, 3]
+
+    assert r_vector_to_numpy(ro.r("c(TRUE, FALSE, NA)")).tolist() == [True, False, None]
+    assert r_vector_to_numpy(ro.r("c('a', 'b')")) is None
+    assert r_vector_to_numpy(ro.r("factor(c('a', 'b'))")) is None
+
+    assert convert_to_python(ro.r("c(1.5, 2.5)"), as_type="float") == [1.5, 2.5]
+
+    # Missing integers are kept as ``NA_integer_``
+    assert convert_to_python(ro.r("c(1L, NA)"), as_type="int") == [
+        1,
+        int(ro.NA_Integer),
+    ]
+
+    # Matrices keep their layout and names
+    matrix = ro.r("matrix(1:6, nrow = 2, dimnames = list(c('r1', 'r2'), NULL))")
+    assert r_vector_to_numpy(matrix).tolist() == [[1, 3, 5], [2, 4, 6]]
+    assert r_dimnames(matrix) == [["r1", "r2"], None]
+
+    matrix_df = matrix_to_pandas(matrix)
+    assert matrix_df.index.tolist() == ["r1", "r2"]
+    assert matrix_df.columns.tolist() == ["V1", "V2", "V3"]
+    assert matrix_df["V3"].tolist() == [5, 6]
+
+    # Tables
+    table_df = table_to_pandas(ro.r("table(c('a', 'b', 'b'), c('x', 'y', 'y'))"))
+    assert table_df.loc["b", "y"] == 2  # noqa: PLR2004 - 2 occurrences
+    assert table_df.loc["a", "y"] == 0
+
+
+def test_convert_numpy_to_r():
+    """Test conversion of NumPy arrays, scalars and pandas Series to R."""
+    # Arrays
+    assert list(convert_to_r(np.array([1, 2, 3]))) == [1, 2, 3]
+    assert list(ro.r["class"](convert_to_r(np.array([1.5, 2.5])))) == ["numeric"]
+    assert list(convert_to_r(np.array([True, False]))) == [True, False]
+    assert list(convert_to_r(np.array(["a", "b"]))) == ["a", "b"]
+
+    # Scalars
+    assert list(convert_to_r(np.float64(1.5))) == [1.5]
+    assert list(ro.r["class"](convert_to_r(np.int32(1)))) == ["integer"]
+
+    # Matrices keep their layout
+    matrix = convert_to_r(np.arange(6).reshape(2, 3))
+    assert list(ro.r["dim"](matrix)) == [2, 3]
+    assert r_vector_to_numpy(matrix).tolist() == [[0, 1, 2], [3, 4, 5]]
+
+    # Dates
+    dates = convert_to_r(np.array(["2020-01-01", "NaT"], dtype="datetime64[D]"))
+    assert list(ro.r["format"](dates))[0] == "2020-01-01"
+    assert list(ro.r["is.na"](dates)) == [False, True]
+
+    # Series (categorical series are converted to factors)
+    series = pd.Series(pd.Categorical(["b", "a", None], categories=["a", "b"]))
+    factor = convert_to_r(series)
+    assert list(ro.r["levels"](factor)) == ["a", "b"]
+    assert list(ro.r["as.character"](factor))[:2] == ["b", "a"]
+    assert list(ro.r["is.na"](factor)) == [False, False, True]
+
+    named = convert_to_r(pd.Series([1, 2], index=["x", "y"]))
+    assert list(named.names) == ["x", "y"]
+
+    # Filtered series (integer index) are converted to unnamed vectors
+    series = pd.Series([1, -2, 3, 4])
+    filtered = convert_to_r(series[series > 0])
+    assert list(filtered) == [1, 3, 4]
+    assert isinstance(filtered.names, NULLType)
+
+    # Nullable series (missing values are converted to ``NA``)
+    logical = convert_to_r(pd.Series([True, None], dtype="boolean"))
+    assert list(ro.r["class"](logical)) == ["logical"]
+    assert list(ro.r["is.na"](logical)) == [False, True]
+
+    integer = convert_to_r(pd.Series([1, None], dtype="Int64"))
+    assert list(ro.r["class"](integer)) == ["integer"]
+    assert list(ro.r["is.na"](integer)) == [False, True]
+
+    for dtype in ["string", object]:
+        character = convert_to_r(pd.Series(["a", pd.NA], dtype=dtype))
+        assert list(ro.r["class"](character)) == ["character"]
+        assert list(ro.r["is.na"](character)) == [False, True]
+
+
+def test_pandas_to_tibble_plain():
+    """Test conversion of plain (non-nested) data frames to R."""
+    data = pd.DataFrame(
+        {
+            "longitude": [-55.1, -55.2],
+            "start_date": pd.to_datetime(["2020-01-01", "2020-06-01"]).date,
+            "label": ["Forest", None],
+        }
+    )
+
+    r_data = pandas_to_tibble(data)
+    assert tibble_schema(r_data) == {
+        "longitude": "numeric",
+        "start_date": "Date",
+        "label": "character",
+    }
+    assert list(ro.r["is.na"](r_data.rx2("label"))) == [False, True]
+
+    # Data frames without a flat representation use rpy2 conversion
+    mixed = pandas_to_tibble(pd.DataFrame({"value": [1, "a"]}))
+    assert list(mixed.colnames) == ["value"]
+
+
+def test_tibble_nested_to_pandas_long_table():
+    """Test conversion of nested columns through a single long table."""
+    data = ro.r("""
+        tibble::tibble(
+            id = 1:3,
+            values = list(
+                data.frame(date = as.Date("2020-01-01") + 0:1, value = 1:2),
+                data.frame(date = as.Date(character(0)), value = integer(0)),
+                data.frame(date = as.Date("2021-01-01"), value = 3L)
+            ),
+            labels = list("a", c("b", "c"), "d")
+        )
+    """)
+
+    data_df = tibble_nested_to_pandas(
+        data,
+        nested_columns=["values", "labels"],
+        nested_processor=lambda x: x.assign(value=x["value"] * 10),
+    )
+
+    # Nested data frames are built from the columns of the long table
+    assert data_df["values"].array._is_arrow
+
+    values = list(data_df["values"])
+    assert [len(v) for v in values] == [2, 0, 1]
+    assert values[0]["value"].tolist() == [10, 20]
+    assert values[2]["value"].tolist() == [30]
+
+    # Columns without data frames are converted row by row
+    assert list(data_df["labels"][1]) == ["b", "c"]
+
+
+def test_convert_to_r_dispatch():
+    """Test dispatch of conversions to R by object type."""
+    vector = ro.IntVector([1])
+
+    assert convert_to_r(vector) is vector
+    assert convert_to_r(None) is ro.NULL
+    assert list(convert_to_r(samples_modis_ndvi).colnames) == list(
+        samples_modis_ndvi._instance.colnames
+    )
+
+    with pytest.raises(TypeError):
+        convert_to_r(object())
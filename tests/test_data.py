@@ -19,6 +19,8 @@
 
 from pathlib import Path
 
+from pysits import settings
+from pysits.conversions.common import convert_to_r
 from pysits.models.data.cube import SITSCubeModel
 from pysits.models.data.ts import SITSTimeSeriesModel
 from pysits.sits.context import samples_l8_rondonia_2bands
@@ -216,3 +218,26 @@ def test_cube_reduce(tmp_path: Path):
     # Check cube properties
     assert "NDVIMEAN" in sits_bands(cube_reduced)
     assert len(sits_timeline(cube_reduced)) == 1  # noqa: PLR2004 - one date
+
+
+def test_lazy_conversion(monkeypatch):
+    """Test lazy conversion of sits data from R to Python."""
+    samples = SITSTimeSeriesModel(samples_l8_rondonia_2bands._instance, lazy=True)
+
+    # Data is not converted while only R is used
+    assert not samples.is_materialized
+    assert convert_to_r(samples) is samples._instance
+    assert sits_bands(samples) == sits_bands(samples_l8_rondonia_2bands)
+    assert not samples.is_materialized
+
+    # Data is converted on first access
+    assert samples.shape == samples_l8_rondonia_2bands.shape
+    assert samples.is_materialized
+    assert samples.label.tolist() == samples_l8_rondonia_2bands.label.tolist()
+
+    # Lazy conversion can be enabled globally
+    monkeypatch.setattr(settings, "LAZY_CONVERSION", True)
+
+    samples = sits_select(samples_l8_rondonia_2bands, bands=("NDVI",))
+    assert not samples.is_materialized
+    assert sits_bands(samples) == ["NDVI"]
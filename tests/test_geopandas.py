@@ -17,8 +17,10 @@
 
 """Unit tests for geopandas operations."""
 
+import shapely
 from geopandas import GeoDataFrame as GeoPandasDataFrame
 
+from pysits.conversions.tibble import geopandas_to_tibble, tibble_to_pandas
 from pysits.models.data.frame import SITSFrameSF
 from pysits.models.data.ts import SITSTimeSeriesSFModel
 from pysits.sits.context import samples_l8_rondonia_2bands
@@ -60,3 +62,39 @@ def test_ts_geopandas_export():
     assert samples_gdf.geometry.name == "geometry"
     assert isinstance(samples_gdf, SITSTimeSeriesSFModel)
     assert isinstance(samples_gdf, GeoPandasDataFrame)
+
+
+def test_geopandas_wkb_roundtrip():
+    """Test geometry conversion between geopandas and sf (as WKB)."""
+    data = GeoPandasDataFrame(
+        {"id": [1, 2, 3, 4]},
+        geometry=[
+            shapely.Point(-55, -10),
+            shapely.box(-56, -11, -55, -10),
+            shapely.Polygon(),
+            None,
+        ],
+        crs="EPSG:4326",
+    )
+
+    # Convert to sf and back
+    data_sf = geopandas_to_tibble(data)
+    assert "sf" in list(data_sf.rclass)
+
+    data_converted = tibble_to_pandas(data_sf)
+
+    assert data_converted.crs is not None
+    assert data_converted["id"].tolist() == [1, 2, 3, 4]
+    assert data_converted.geometry.iloc[:2].equals(data.geometry.iloc[:2])
+
+    # Empty geometries are kept (sf stores missing geometries as empty geometries)
+    assert data_converted.geometry.iloc[2].geom_type == "Polygon"
+    assert data_converted.geometry.iloc[2].is_empty
+    assert data_converted.geometry.iloc[3].is_empty
+
+    # Empty data frame
+    data_sf = geopandas_to_tibble(data.iloc[:0])
+    data_converted = tibble_to_pandas(data_sf)
+
+    assert len(data_converted) == 0
+    assert data_converted.crs is not None
@@ -0,0 +1,63 @@
+#
+# Copyright (C) 2025 sits developers.
+#
+# This program is free software; you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <https://www.gnu.org/licenses/>.
+#
+
+"""Unit tests for pysits import."""
+
+import json
+import subprocess
+import sys
+
+from pysits.sits.context import CONTEXT_DATASETS
+
+#
+# Script to inspect the state of R after ``import pysits``
+#
+IMPORT_SCRIPT = """
+import json
+
+import pysits
+from rpy2 import robjects
+
+print(json.dumps({{
+    "globalenv": list(robjects.globalenv.keys()),
+    "context": [name for name in vars(pysits.sits.context) if name in {names!r}],
+}}))
+"""
+
+
+def test_import_does_not_load_datasets():
+    """Test that importing pysits does not load R datasets."""
+    script = IMPORT_SCRIPT.format(names=set(CONTEXT_DATASETS))
+
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    state = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert not set(state["globalenv"]) & set(CONTEXT_DATASETS)
+    assert state["context"] == []
+
+
+def test_context_datasets_lazy_access():
+    """Test that context datasets are loaded on access and cached."""
+    import pysits
+
+    data = pysits.samples_modis_ndvi
+
+    assert data is pysits.samples_modis_ndvi
+    assert data is pysits.sits.context.samples_modis_ndvi
+    assert "samples_modis_ndvi" in dir(pysits.sits.context)
@@ -17,12 +17,21 @@
 
 """Unit tests for indexing operations."""
 
+import numpy as np
+import pyarrow as pa
+import pytest
+from pandas import DataFrame as PandasDataFrame
 from pandas import Series as PandasSeries
 
+from pysits.conversions.common import convert_to_r
 from pysits.models.data.cube import SITSCubeItemModel, SITSCubeModel
+from pysits.models.data.frame import SITSFrame
 from pysits.models.data.ts import SITSTimeSeriesItemModel, SITSTimeSeriesModel
+from pysits.models.frame import SITSFrameArray
 from pysits.sits.context import samples_l8_rondonia_2bands
 from pysits.sits.cube import sits_cube
+from pysits.sits.data import sits_labels
+from pysits.sits.tiles import sits_tiles_to_roi
 
 
 def test_cube_indexing():
@@ -136,3 +145,238 @@ def test_ts_indexing():
     cols = ["label", "longitude", "latitude"]
     idx9 = samples[cols]
     assert [col in idx9.columns for col in cols]
+
+
+def test_ts_deferred_conversion():
+    """Test that derived frames are only converted to R when required."""
+    samples = samples_l8_rondonia_2bands
+
+    # Frames created from Python data are not converted to R
+    idx1 = SITSTimeSeriesModel(PandasDataFrame(samples).head(10))
+    assert idx1._is_updated
+
+    # R instance is created on access
+    assert idx1._instance is not None
+    assert not idx1._is_updated
+    assert "sits" in list(idx1._instance.rclass)
+    assert idx1._instance.nrow == 10  # noqa: PLR2004 - 10 rows
+
+
+def test_ts_row_push_down():
+    """Test that row subsets are created by subsetting the parent R instance."""
+    samples = samples_l8_rondonia_2bands
+
+    # Row selections are tracked (no conversion to R is required)
+    idx1 = samples[samples["label"] == "Pasture"]
+    assert not idx1._is_updated
+    assert idx1._row_source is not None
+
+    idx2 = idx1.iloc[5:15].head(5)
+    assert not idx2._is_updated
+    assert idx2._row_positions.tolist() == idx1._row_positions[5:10].tolist()
+
+    # R instance is created from the parent R instance
+    assert idx2._instance.nrow == 5  # noqa: PLR2004 - 5 rows
+    assert list(idx2._instance.rclass) == list(samples._instance.rclass)
+    assert sits_labels(idx2) == ["Pasture"]
+
+    # Changed columns are converted from Python
+    idx3 = idx1.iloc[0:2]
+    idx3["label"] = "Forest"
+    assert idx3._is_updated
+    assert sits_labels(idx3) == ["Forest"]
+
+
+def test_frame_row_push_down_non_tibble():
+    """Test that row selections of non-tibble frames do not slice the R instance."""
+    roi = sits_tiles_to_roi("22KGA")
+
+    # All rows selected (a named vector is a single row): R vector is shared
+    roi_head = roi.head()
+    assert roi_head._row_source is None
+
+    roi_r = convert_to_r(roi_head)
+    assert list(roi_r.names) == list(roi._instance.names)
+    assert len(roi_r) == 4  # noqa: PLR2004 - xmin, xmax, ymin, ymax
+
+    # Row subsets are not created from R vectors or Python data
+    assert roi.iloc[:0]._row_source is None
+
+    frame = SITSFrame(PandasDataFrame({"a": [1, 2, 3]}))
+    assert frame.iloc[[0, 2]]._row_source is None
+
+
+def test_ts_column_sync():
+    """Test that only the changed rows and columns are synced with R."""
+    samples = samples_l8_rondonia_2bands.copy()
+    samples._instance  # noqa: B018 - sync instance
+
+    # Assigned columns are tracked
+    samples["label"] = "Forest"
+    assert samples._dirty_columns == {"label"}
+    assert sits_labels(samples) == ["Forest"]
+    assert not samples._is_updated
+
+    # Changes made through indexers and inplace operations are tracked
+    samples.loc[samples.index[0], "label"] = "Pasture"
+    samples.drop(index=samples.index[-1], inplace=True)
+    assert samples._is_updated
+
+    changed_rows = samples._changed_rows("label", np.arange(samples.shape[0]))
+    assert changed_rows.tolist() == [True] + [False] * (samples.shape[0] - 1)
+    assert not samples._changed_rows("time_series", np.arange(samples.shape[0])).any()
+
+    # Only the changes are synced
+    assert samples._sync_changes()
+    assert samples._r_instance.nrow == samples.shape[0]
+    assert sits_labels(samples) == ["Forest", "Pasture"]
+
+
+def test_ts_column_sync_relabel():
+    """Test that relabelled frames are synced with R in their row order."""
+    samples = samples_l8_rondonia_2bands.head(5).copy()
+    samples._instance  # noqa: B018 - sync instance
+
+    # Shuffled and reindexed rows
+    idx1 = samples.sample(frac=1, random_state=42).reset_index()
+    longitudes = list(idx1._instance.rx2("longitude"))
+    assert longitudes == idx1["longitude"].tolist()
+
+    # Changed and relabelled rows
+    samples["label"] = "Forest"
+    samples.index = [4, 3, 2, 1, 0]
+    assert samples._sync_state is None
+
+    longitudes = list(samples._instance.rx2("longitude"))
+    assert longitudes == samples["longitude"].tolist()
+    assert sits_labels(samples) == ["Forest"]
+
+
+def test_ts_item_lazy_instance():
+    """Test that R instances of rows are only created when required."""
+    samples = samples_l8_rondonia_2bands
+
+    # Rows are created without R instances
+    rows = [row for _, row in samples.iloc[0:3].iterrows()]
+    assert all(isinstance(row, SITSTimeSeriesItemModel) for row in rows)
+    assert all(row._r_instance is None for row in rows)
+
+    # R instances are selected from the frame
+    assert rows[1]._instance.nrow == 1
+    assert sits_labels(rows[1]) == [samples["label"].iloc[1]]
+
+    # Changed rows are converted from Python
+    row = samples.iloc[0]
+    row["label"] = "Forest"
+    assert row._parent_source is None
+    assert sits_labels(row) == ["Forest"]
+
+
+def test_ts_ragged_indexing():
+    """Test indexing of time-series stored as flat buffers and offsets."""
+    samples = samples_l8_rondonia_2bands
+
+    time_series = samples["time_series"]
+    assert isinstance(time_series.array, SITSFrameArray)
+
+    # Elements are created as data frames
+    ts = time_series.iloc[0]
+    assert isinstance(ts, PandasDataFrame)
+    assert "Index" in ts.columns
+
+    # Filtering keeps the ragged representation
+    idx1 = samples[samples["label"] == "Pasture"]
+    values, offsets, missing = idx1["time_series"].array.to_ragged()
+
+    assert len(offsets) == idx1.shape[0] + 1
+    assert not missing.any()
+    assert all(len(v) == offsets[-1] for v in values.values())
+
+    ts_expected = time_series[samples["label"] == "Pasture"].iloc[0]
+    assert idx1["time_series"].iloc[0].equals(ts_expected)
+
+    # Missing values are supported
+    array = SITSFrameArray.from_ragged(
+        {"NDVI": np.array([0.1, 0.2, 0.3])}, np.array([0, 1, 1, 3])
+    )
+    taken = array.take([2, -1], allow_fill=True)
+
+    assert taken.isna().tolist() == [False, True]
+    assert taken[0]["NDVI"].tolist() == [0.2, 0.3]
+
+
+def test_frame_array_operations():
+    """Test vectorized operations of SITS Frame arrays."""
+    array = SITSFrameArray.from_ragged(
+        {"NDVI": np.array([0.1, 0.2, 0.3, 0.4])}, np.array([0, 1, 1, 3, 4])
+    )
+
+    assert len(array) == 4  # noqa: PLR2004 - 4 elements
+    assert array.nbytes > 0
+
+    # Slicing and filtering
+    assert array[1:3][1]["NDVI"].tolist() == [0.2, 0.3]
+    assert array[::-1][0]["NDVI"].tolist() == [0.4]
+    assert len(array[np.array([True, False, False, True])]) == 2  # noqa: PLR2004
+
+    # Take (with and without missing values)
+    assert array.take([-1])[0]["NDVI"].tolist() == [0.4]
+    assert array.take([0, -1], allow_fill=True).isna().tolist() == [False, True]
+
+    with pytest.raises(IndexError):
+        array.take([4])
+
+    with pytest.raises(ValueError):
+        array.take([-2], allow_fill=True)
+
+    # Concatenation
+    concatenated = SITSFrameArray._concat_same_type([array, array])
+    assert len(concatenated) == 8  # noqa: PLR2004 - 8 elements
+    assert concatenated[7]["NDVI"].tolist() == [0.4]
+
+    # Data frames are created only on access
+    frames = list(array)
+    assert all(isinstance(df, PandasDataFrame) for df in frames)
+    assert frames[1].empty
+
+
+def test_frame_array_ragged_types():
+    """Test that the ragged representation keeps column types and nulls."""
+    array = SITSFrameArray(
+        [
+            PandasDataFrame({"value": PandasSeries([1, None], dtype="Int64")}),
+            None,
+            PandasDataFrame({"value": PandasSeries([3], dtype="Int64")}),
+        ]
+    )
+
+    values, offsets, missing = array.to_ragged()
+
+    assert offsets.tolist() == [0, 2, 2, 3]
+    assert missing.tolist() == [False, True, False]
+    assert pa.types.is_integer(values["value"].type)
+    assert values["value"].to_pylist() == [1, None, 3]
+
+    # Sliced arrays start at zero
+    values, offsets, _ = array[2:].to_ragged()
+    assert offsets.tolist() == [0, 1]
+    assert values["value"].to_pylist() == [3]
+
+
+def test_frame_array_row_iteration():
+    """Test row-wise operations on nested data frames with the same shape."""
+    array = SITSFrameArray.from_ragged(
+        {"NDVI": np.arange(6, dtype=float)}, np.array([0, 2, 4, 6])
+    )
+    data = PandasDataFrame({"label": ["a", "b", "c"], "time_series": array})
+
+    # Elements are kept as data frames (not stacked as a 3-D array)
+    assert np.asarray(array).shape == (3,)
+    assert data.to_numpy().shape == (3, 2)
+
+    # Row-wise operations
+    rows = [row for _, row in data.iterrows()]
+    assert rows[2]["time_series"]["NDVI"].tolist() == [4.0, 5.0]
+
+    sizes = data.apply(lambda row: len(row["time_series"]), axis=1)
+    assert sizes.tolist() == [2, 2, 2]
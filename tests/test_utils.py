@@ -20,8 +20,18 @@
 from pathlib import Path
 
 import pytest
-
-from pysits.backend.loaders import load_function_from_package
+import rpy2.robjects as ro
+
+from pysits.backend.calls import call_with_expressions, split_expression_arguments
+from pysits.backend.loaders import (
+    LazyFunction,
+    LazyPackage,
+    lazy_function_from_package,
+    lazy_package,
+    load_function_from_package,
+)
+from pysits.backend.registry import RHelperRegistry
+from pysits.docs.decorators import load_doc
 from pysits.models.data.ts import SITSTimeSeriesModel
 from pysits.sits.context import samples_modis_ndvi
 from pysits.sits.utils import (
@@ -62,3 +72,100 @@ def test_read_rds_file_not_found():
 def test_r_package_dir():
     """Test get package dir from an existing R package."""
     assert r_package_dir("extdata/raster/mod13q1", package="sits")
+
+
+def test_r_helper_registry():
+    """Test registry of R helper functions."""
+    registry = RHelperRegistry()
+    registry.register("pysits_test_add", "function(x, y) x + y")
+
+    helper = registry["pysits_test_add"]
+    assert list(helper(1, 2)) == [3]  # noqa: PLR2004 - sum of values
+
+    # Helpers are defined once, byte-compiled and outside the global environment
+    assert registry["pysits_test_add"] is helper
+    assert "pysits_test_add" not in list(ro.globalenv.keys())
+
+    is_compiled = ro.r('function(f) any(grepl("bytecode", capture.output(print(f))))')
+    assert is_compiled(helper)[0]
+
+    # Invalid registrations
+    with pytest.raises(ValueError):
+        registry.register("pysits_test_add", "function(x, y) x - y")
+
+    with pytest.raises(KeyError):
+        registry.get("pysits_test_missing")
+
+
+def test_call_with_expressions():
+    """Test R calls with values bound to symbols and parsed expressions."""
+    values, expressions = split_expression_arguments(
+        {
+            "x": ro.IntVector([1]),
+            "y": ro.StrVector(["x_band + 1"]),
+            "output_dir": ro.StrVector(["/tmp"]),
+        }
+    )
+
+    assert list(values) == ["x", "output_dir"]
+    assert expressions == {"y": "x_band + 1"}
+
+    # Expressions are parsed as R code, values are used as they are
+    result = call_with_expressions(
+        "base::list", {"x": ro.IntVector([1])}, {"y": "deparse(quote(x_band + 1))"}
+    )
+
+    assert list(result.names) == ["x", "y"]
+    assert list(result.rx2("y")) == ["x_band + 1"]
+
+
+def test_lazy_package():
+    """Test R packages loaded on first use."""
+    package = LazyPackage("stats")
+
+    # Functions referenced before loading are resolved on call
+    median = package.median
+    assert isinstance(median, LazyFunction)
+    assert not package.loaded
+
+    assert median(ro.IntVector([1, 2, 3]))[0] == 2  # noqa: PLR2004 - median value
+    assert package.loaded
+
+    # Loaded packages return their attributes
+    assert "median" in package
+    assert not isinstance(package.median, LazyFunction)
+
+
+def test_lazy_package_shared():
+    """Test R packages shared by lazy functions and checked on load."""
+    package = lazy_package("utils")
+    assert lazy_package("utils") is package
+
+    # Functions of the same package share a single loader
+    head = lazy_function_from_package("utils::head")
+    missing = lazy_function_from_package("utils::pysits_missing_function")
+
+    assert head._package is package
+    assert missing._package is package
+    assert not package.loaded
+
+    # Unknown functions are reported when the package is loaded
+    with pytest.warns(UserWarning, match="pysits_missing_function"):
+        assert list(head(ro.IntVector([1, 2, 3]), 1)) == [1]
+
+    assert package.loaded
+
+    with pytest.raises(AttributeError, match="pysits_missing_function"):
+        missing()
+
+    # Unknown attributes of loaded packages fail on access
+    with pytest.raises(AttributeError, match="pysits_other_function"):
+        lazy_function_from_package("utils::pysits_other_function")
+
+
+def test_load_doc():
+    """Test loading of function documentation from markdown files."""
+    assert load_doc("sits_get_data").startswith("Get time series")
+    assert load_doc("pysits_missing_doc") == (
+        "(No documentation found for pysits_missing_doc)"
+    )